@@ -0,0 +1,221 @@
+"""
+Bulk CAS-list compliance screening against the ETL outputs.
+
+A bill of materials (tens of thousands of CAS numbers) is screened in three vectorized
+steps instead of a Python loop over rows:
+
+1. normalize: strip, drop leading zeros, accept '50-00-0', '0000050-00-0' or '50000'
+2. validate:  CAS check digit (sum of body digits weighted 1, 2, 3, ... from the right,
+              mod 10) computed with numpy integer arithmetic on the whole column
+3. join:      every CAS becomes an int64 key; the regulated lists are precomputed into one
+              hash index (pd.Index) plus a key x list membership matrix, so each input is
+              a single hash probe no matter how many lists are screened
+
+The per-list sets come from the substance index (data/substance_index.sqlite) built by
+the ETL runs, or directly from reach_data.json / kosha_data.json.
+
+Usage:
+    python modules/etl-pipeline/cas_screening.py bom.csv --column "CAS No." --output screened.csv
+    python modules/etl-pipeline/cas_screening.py bom.txt --reach data/reach_data.json --kosha data/kosha_data.json
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from substance_index import CAS_KEYS, DEFAULT_INDEX_FILE, _field, kosha_datasets, normalize_cas
+
+CAS_FORMAT = r'0*\d{2,7}-?\d{2}-?\d'
+# Weights 1..9 for the body digits, right to left
+DIGIT_PLACES = 10 ** np.arange(9, dtype=np.int64)
+DIGIT_WEIGHTS = np.arange(1, 10, dtype=np.int64)
+
+
+def parse_cas(values) -> pd.DataFrame:
+    """
+    Vectorized normalization and check-digit validation.
+
+    The format check and dash removal run as column-wise string operations; once the
+    digits are an int64 key (body digits followed by the check digit), leading zeros are
+    gone and the check digit is plain integer arithmetic on the whole column.
+
+    Returns one row per input with columns:
+        cas   normalized 'NNNNNNN-NN-N' string (None if the format is wrong)
+        key   int64 key, -1 unless valid
+        valid format ok and check digit correct
+    """
+    series = pd.Series(values, dtype=object).astype('string').str.strip()
+    well_formed = series.str.fullmatch(CAS_FORMAT).fillna(False).to_numpy(dtype=bool)
+
+    key = np.full(len(series), -1, dtype=np.int64)
+    if well_formed.any():
+        key[well_formed] = series[well_formed].str.replace('-', '', regex=False).astype('int64').to_numpy()
+    body, check = key // 10, key % 10
+    # The first CAS group has at least two digits (after dropping leading zeros)
+    well_formed &= body >= 1000
+
+    body_digits = (body[:, None] // DIGIT_PLACES) % 10
+    valid = well_formed & ((body_digits @ DIGIT_WEIGHTS) % 10 == check)
+
+    # Format each distinct number once (a BOM repeats the same substances many times)
+    cas = np.full(len(series), None, dtype=object)
+    if well_formed.any():
+        distinct, inverse = np.unique(key[well_formed], return_inverse=True)
+        labels = np.array([f"{k // 1000}-{k // 10 % 100:02d}-{k % 10}" for k in distinct.tolist()], dtype=object)
+        cas[well_formed] = labels[inverse]
+    key[~valid] = -1
+    return pd.DataFrame({'cas': cas, 'key': key, 'valid': valid})
+
+
+def cas_check_digit_ok(cas: str) -> bool:
+    """Scalar reference implementation of the check-digit rule (for spot checks)."""
+    digits = cas.replace('-', '')
+    body, check = digits[:-1], int(digits[-1])
+    return sum(i * int(d) for i, d in enumerate(reversed(body), start=1)) % 10 == check
+
+
+class CasScreener:
+    """Precomputed regulated-list sets: one hash index over every listed CAS key."""
+
+    def __init__(self, lists: dict):
+        """lists maps a list name (e.g. 'reach/svhc') to an iterable of CAS strings."""
+        self.list_names = list(lists)
+        keys_per_list = []
+        for name in self.list_names:
+            parsed = parse_cas(list(lists[name]))
+            # Listed numbers are kept even with a bad check digit: the source list is authoritative
+            well_formed = parsed['cas'].notna().to_numpy()
+            raw = pd.Series(parsed['cas'][well_formed], dtype=object).str.replace('-', '', regex=False)
+            keys_per_list.append(np.unique(raw.astype('int64').to_numpy()))
+
+        all_keys = np.unique(np.concatenate(keys_per_list)) if keys_per_list else np.empty(0, dtype=np.int64)
+        self.index = pd.Index(all_keys)
+        # Row per listed key, column per list; a trailing all-False row for "not listed"
+        self.membership = np.zeros((len(all_keys) + 1, len(self.list_names)), dtype=bool)
+        for col, keys in enumerate(keys_per_list):
+            self.membership[self.index.get_indexer(keys), col] = True
+        self.list_sizes = {name: len(keys) for name, keys in zip(self.list_names, keys_per_list)}
+
+    @classmethod
+    def from_index(cls, index_file=DEFAULT_INDEX_FILE, lists=None) -> 'CasScreener':
+        """Per-list CAS sets from the SQLite substance index (optionally only some 'source/list' names)."""
+        with sqlite3.connect(index_file) as conn:
+            rows = conn.execute("SELECT source || '/' || list, cas FROM substances WHERE cas IS NOT NULL").fetchall()
+        frame = pd.DataFrame(rows, columns=['list', 'cas'])
+        grouped = {name: group['cas'].tolist() for name, group in frame.groupby('list', sort=True)}
+        if lists:
+            grouped = {name: grouped.get(name, []) for name in lists}
+        return cls(grouped)
+
+    @classmethod
+    def from_datasets(cls, datasets: dict) -> 'CasScreener':
+        """Per-list CAS sets from record lists ({'reach/svhc': [row, ...], ...})."""
+        return cls({
+            name: [cas for record in records if isinstance(record, dict)
+                   for cas in normalize_cas(_field(record, CAS_KEYS))]
+            for name, records in datasets.items()
+        })
+
+    def screen(self, values) -> pd.DataFrame:
+        """
+        Screen input CAS numbers; one row per input, in input order.
+
+        Columns: input, cas, valid, one boolean column per list, listed_in ('; '-joined
+        list names) and regulated (listed anywhere). Invalid numbers are never matched.
+        """
+        values = list(values)
+        parsed = parse_cas(values)
+        positions = self.index.get_indexer(parsed['key'].to_numpy())
+        positions[positions < 0] = len(self.index)  # -> the all-False row
+        matches = self.membership[positions]
+
+        result = pd.DataFrame({'input': values, 'cas': parsed['cas'], 'valid': parsed['valid']})
+        for col, name in enumerate(self.list_names):
+            result[name] = matches[:, col]
+        result['regulated'] = matches.any(axis=1)
+
+        # Label per distinct combination of lists (bitmask), not per row
+        bits = matches.astype(np.int64) @ (1 << np.arange(len(self.list_names), dtype=np.int64))
+        labels = {code: '; '.join(name for i, name in enumerate(self.list_names) if code >> i & 1)
+                  for code in np.unique(bits).tolist()}
+        result.insert(3, 'listed_in', pd.Series(bits).map(labels).to_numpy(dtype=object))
+        return result
+
+
+def load_datasets(reach_file=None, kosha_file=None) -> dict:
+    """Record lists keyed 'reach/<annex>' and 'kosha/<data_type>' from ETL JSON outputs (incl. a combined KOSHA run)."""
+    datasets = {}
+    if reach_file:
+        with open(reach_file, 'r', encoding='utf-8') as f:
+            reach = json.load(f)
+        for annex, result in reach.items():
+            if isinstance(result, dict) and isinstance(result.get('data'), list):
+                datasets[f"reach/{annex}"] = result['data']
+    if kosha_file:
+        with open(kosha_file, 'r', encoding='utf-8') as f:
+            kosha = json.load(f)
+        if isinstance(kosha.get('data'), list):
+            for data_type, records in kosha_datasets(kosha, default_name=Path(kosha_file).stem).items():
+                datasets[f"kosha/{data_type}"] = records
+    return datasets
+
+
+def read_cas_input(path, column=None) -> list:
+    """CAS numbers from a text file (one per line), or a CSV/Excel column (default: first)."""
+    path = Path(path)
+    if path.suffix.lower() in ('.xlsx', '.xls'):
+        df = pd.read_excel(path, dtype=str)
+    elif path.suffix.lower() == '.csv':
+        df = pd.read_csv(path, dtype=str, encoding='utf-8-sig')
+    else:
+        with open(path, 'r', encoding='utf-8-sig') as f:
+            return [line.strip() for line in f if line.strip()]
+    series = df[column] if column else df.iloc[:, 0]
+    return series.fillna('').tolist()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bulk CAS screening against SVHC / Annex XIV / XVII / KOSHA lists')
+    parser.add_argument('input', help='CAS list: text (one per line), CSV or Excel')
+    parser.add_argument('--column', help='Column holding CAS numbers in a CSV/Excel input (default: first)')
+    parser.add_argument('--output', help='Write the screening table as CSV')
+    parser.add_argument('--index-file', default=str(DEFAULT_INDEX_FILE), help='Substance index built by the ETL runs')
+    parser.add_argument('--reach', help='Screen against reach_data.json instead of the substance index')
+    parser.add_argument('--kosha', help='Screen against a kosha_data.json instead of the substance index')
+    parser.add_argument('--lists', nargs='*', help="Only these lists, e.g. reach/svhc kosha/special_materials")
+    args = parser.parse_args()
+
+    if args.reach or args.kosha:
+        datasets = load_datasets(args.reach, args.kosha)
+        if args.lists:
+            datasets = {name: datasets.get(name, []) for name in args.lists}
+        screener = CasScreener.from_datasets(datasets)
+    elif Path(args.index_file).exists():
+        screener = CasScreener.from_index(args.index_file, lists=args.lists)
+    else:
+        print(f"Substance index not found: {args.index_file} (run an ETL module, or pass --reach/--kosha)")
+        sys.exit(1)
+
+    values = read_cas_input(args.input, args.column)
+    start = time.perf_counter()
+    result = screener.screen(values)
+    elapsed = time.perf_counter() - start
+
+    for name in screener.list_names:
+        print(f"{name}: {int(result[name].sum())} matches (list size {screener.list_sizes[name]})")
+    print(f"Screened {len(result)} CAS numbers in {elapsed * 1000:.1f} ms: "
+          f"{int((~result['valid']).sum())} invalid, {int(result['regulated'].sum())} regulated")
+
+    if args.output:
+        result.to_csv(args.output, index=False, encoding='utf-8-sig')
+        print(f"Saved screening results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
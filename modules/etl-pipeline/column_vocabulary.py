@@ -0,0 +1,122 @@
+"""
+Shared column vocabulary for the KOSHA, MOEL and PDF sources.
+
+Source tables label the same column in many ways ('화학물질명', '유해물질', 'CAS No.',
+'cas번호', ...). HeaderNormalizer maps a raw header to its canonical column name:
+
+- the alias table is an ordered list of (canonical, [aliases]); a header maps to the
+  canonical name of the first alias (in table order) contained in it, case-insensitively
+- all aliases are compiled into one regex, so each header is scanned once
+- results are memoized per distinct header string
+
+The built-in table can be extended without code changes through config/column_aliases.json
+({"canonical": ["alias", ...]}); aliases for an existing canonical name are tried right
+after its built-in ones, new canonical names after the whole built-in table.
+"""
+
+import hashlib
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+ALIAS_FILE = Path(__file__).resolve().parents[2] / 'config' / 'column_aliases.json'
+
+DEFAULT_ALIASES = [
+    ('물질명', ['물질명', '유해물질', '화학물질명', '명칭', '이름']),
+    ('CAS_No', ['cas', 'cas no', 'cas_no', 'cas번호']),
+    ('관리등급', ['관리등급', '등급', '위험등급']),
+    ('특별관리물질', ['특별관리', '특별관리물질']),
+    ('관리대상', ['관리대상']),
+    ('비고', ['비고', 'remarks']),
+]
+
+
+def load_alias_table(alias_file=ALIAS_FILE) -> list:
+    """Built-in aliases merged with the user alias file (if present)."""
+    table = [(canonical, list(aliases)) for canonical, aliases in DEFAULT_ALIASES]
+    if alias_file is None or not Path(alias_file).exists():
+        return table
+
+    with open(alias_file, 'r', encoding='utf-8') as f:
+        user_aliases = json.load(f)
+    groups = {canonical: aliases for canonical, aliases in table}
+    for canonical, aliases in user_aliases.items():
+        if isinstance(aliases, str):
+            aliases = [aliases]
+        if canonical not in groups:
+            groups[canonical] = []
+            table.append((canonical, groups[canonical]))
+        groups[canonical].extend(a for a in aliases if a not in groups[canonical])
+    return table
+
+
+class HeaderNormalizer:
+    """Compiled alias matcher: raw header -> canonical column name."""
+
+    def __init__(self, alias_table: list = None):
+        if alias_table is None:
+            alias_table = load_alias_table()
+        self.alias_table = alias_table
+
+        # Group i matches the i-th alias in priority order. The lookahead makes the match
+        # zero-width, so finditer reports the best alias starting at every position and
+        # overlapping aliases are not hidden by an earlier, lower-priority match.
+        self._targets = []
+        alternatives = []
+        for canonical, aliases in alias_table:
+            for alias in aliases:
+                alternatives.append(f'(?P<a{len(self._targets)}>{re.escape(alias.lower())})')
+                self._targets.append(canonical)
+        self._pattern = re.compile('(?=' + '|'.join(alternatives) + ')') if alternatives else None
+
+        payload = json.dumps(alias_table, ensure_ascii=False).encode('utf-8')
+        self.fingerprint = hashlib.sha1(payload).hexdigest()[:8]
+        self.canonical = lru_cache(maxsize=None)(self._canonical)
+
+    def _canonical(self, header: str) -> Optional[str]:
+        if self._pattern is None:
+            return None
+        best = None
+        for match in self._pattern.finditer(header.lower()):
+            index = int(match.lastgroup[1:])
+            if best is None or index < best:
+                best = index
+                if best == 0:
+                    break
+        return None if best is None else self._targets[best]
+
+    def normalize(self, header) -> str:
+        """Canonical name for header, or the stripped header itself if no alias matches."""
+        if not header:
+            return ""
+        header = str(header).strip()
+        return self.canonical(header) or header
+
+    def normalize_columns(self, columns) -> list:
+        """Normalize DataFrame columns into unique labels.
+
+        A canonical name already taken keeps the original label; if that is taken too,
+        a _2, _3, ... suffix is added (duplicate labels would lose data in to_dict).
+        """
+        normalized = []
+        emitted = set()
+        for column in columns:
+            name = self.normalize(column)
+            if name in emitted:
+                name = str(column).strip()
+            if name in emitted:
+                base, suffix = name, 2
+                while f"{base}_{suffix}" in emitted:
+                    suffix += 1
+                name = f"{base}_{suffix}"
+            normalized.append(name)
+            emitted.add(name)
+        return normalized
+
+
+@lru_cache(maxsize=None)
+def get_header_normalizer(alias_file=ALIAS_FILE) -> HeaderNormalizer:
+    """Process-wide normalizer for an alias file (built once, shared by all sources)."""
+    return HeaderNormalizer(load_alias_table(alias_file))
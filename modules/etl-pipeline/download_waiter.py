@@ -0,0 +1,168 @@
+"""
+Shared "wait for a browser download to finish" helper for the ETL modules.
+
+On Linux the download directory is watched with inotify (through ctypes, no extra
+dependency), so the waiter wakes up as soon as a file is created, renamed or written.
+Elsewhere it falls back to polling with an adaptive backoff. Either way a file is only
+declared complete once no partial-download file is present and its size has stayed the
+same for `stable_for` seconds.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import platform
+import select
+import time
+from fnmatch import fnmatch
+from pathlib import Path
+
+# Partial download markers: Chrome/Edge (.crdownload), Firefox (.part). Not the generic
+# .tmp: the ETL modules write their own atomic-replace temp files into data/ as well.
+PARTIAL_SUFFIXES = ('.crdownload', '.part')
+
+# inotify event mask: created, moved in, written, closed after write, deleted
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+
+_POLL_MIN_INTERVAL = 0.05
+_POLL_MAX_INTERVAL = 1.0
+
+
+def list_files(download_dir: Path, file_pattern: str) -> set:
+    """Names of the files in download_dir matching file_pattern (single directory scan)."""
+    try:
+        with os.scandir(download_dir) as entries:
+            return {e.name for e in entries if fnmatch(e.name, file_pattern)}
+    except FileNotFoundError:
+        return set()
+
+
+def _scan(download_dir: Path, file_pattern: str, before_files: set):
+    """One pass over the directory: new matching files with (size, mtime) and partial flag."""
+    new_files = {}
+    has_partial = False
+    try:
+        entries = os.scandir(download_dir)
+    except FileNotFoundError:
+        return new_files, has_partial
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith(PARTIAL_SUFFIXES):
+                has_partial = True
+                continue
+            if name in before_files or not fnmatch(name, file_pattern):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue  # renamed between listing and stat
+            new_files[name] = (stat.st_size, stat.st_mtime)
+    return new_files, has_partial
+
+
+class _InotifyWatcher:
+    """Minimal ctypes inotify wrapper; wait() returns once events arrive or timeout expires."""
+
+    def __init__(self, path: Path):
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        wd = libc.inotify_add_watch(self._fd, os.fsencode(str(path)), _WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(err, f'inotify_add_watch failed for {path}')
+
+    def wait(self, timeout: float) -> bool:
+        ready, _, _ = select.select([self._fd], [], [], max(timeout, 0))
+        if not ready:
+            return False
+        # Drain everything queued; we only care that something changed
+        while True:
+            try:
+                if not os.read(self._fd, 64 * 1024):
+                    break
+            except BlockingIOError:
+                break
+        return True
+
+    def close(self):
+        os.close(self._fd)
+
+
+class _BackoffPoller:
+    """Polling fallback: short sleeps right after a change, growing while nothing happens."""
+
+    def __init__(self):
+        self.interval = _POLL_MIN_INTERVAL
+
+    def wait(self, timeout: float) -> bool:
+        time.sleep(max(min(self.interval, timeout), 0))
+        self.interval = min(self.interval * 1.5, _POLL_MAX_INTERVAL)
+        return True
+
+    def reset(self):
+        self.interval = _POLL_MIN_INTERVAL
+
+    def close(self):
+        pass
+
+
+def _make_watcher(download_dir: Path):
+    if platform.system() == "Linux":
+        try:
+            return _InotifyWatcher(download_dir)
+        except (OSError, AttributeError) as e:
+            print(f"inotify unavailable ({e}), falling back to polling")
+    return _BackoffPoller()
+
+
+def wait_for_new_file(download_dir: Path, file_pattern: str, before_files: set,
+                      timeout: float = 120, stable_for: float = 0.5) -> Path:
+    """Wait for a new file matching file_pattern to appear and finish downloading.
+
+    Files already listed in before_files are ignored. The most recently modified new
+    file is returned once no partial download is present and its size has been stable
+    for stable_for seconds.
+    """
+    download_dir = Path(download_dir)
+    end_time = time.monotonic() + timeout
+    watcher = _make_watcher(download_dir)
+    last_seen = None  # (name, size, mtime)
+    stable_since = None
+    try:
+        while True:
+            now = time.monotonic()
+            new_files, has_partial = _scan(download_dir, file_pattern, before_files)
+
+            if new_files and not has_partial:
+                name = max(new_files, key=lambda n: new_files[n][1])
+                observed = (name, *new_files[name])
+                if observed != last_seen:
+                    last_seen = observed
+                    stable_since = now
+                    if isinstance(watcher, _BackoffPoller):
+                        watcher.reset()
+                elif now - stable_since >= stable_for:
+                    return download_dir / name
+                # Wake up when the stability window ends even if nothing else happens
+                wait_time = stable_since + stable_for - now
+            else:
+                last_seen = None
+                stable_since = None
+                wait_time = end_time - now
+
+            remaining = end_time - now
+            if remaining <= 0:
+                break
+            watcher.wait(min(wait_time, remaining))
+    finally:
+        watcher.close()
+    raise TimeoutError(f'{file_pattern} download did not complete within timeout')
@@ -0,0 +1,118 @@
+"""
+Pluggable output writers for ETL results.
+
+JSON stays the primary output. Each dataset ({'metadata': ..., 'data': [rows]}) can also
+be written as a typed columnar file next to it:
+
+- parquet: Arrow table with dictionary-encoded string columns (requires pyarrow)
+- npz:     numpy archive, string columns stored as int32 codes + category array
+
+The dataset's `metadata` block travels inside the file (Parquet schema metadata key
+`etl_metadata`, or the `__metadata__` entry of the npz archive), so the dashboard can
+read a columnar file on its own.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+COLUMNAR_DIR = Path('data') / 'columnar'
+METADATA_KEY = 'etl_metadata'
+
+
+def _is_typed(series: pd.Series) -> bool:
+    """Numeric/bool columns are stored as-is; everything else is treated as text."""
+    return pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series)
+
+
+def _rows_to_frame(rows: list) -> pd.DataFrame:
+    """DataFrame with numeric columns kept and everything else normalized to str/None."""
+    df = pd.DataFrame(rows)
+    for col in df.columns:
+        if not _is_typed(df[col]):
+            df[col] = df[col].astype(object).where(df[col].notna(), None)
+            df[col] = df[col].map(lambda v: v if v is None else str(v))
+    df.columns = [str(col) for col in df.columns]
+    return df
+
+
+def write_json(path, dataset, ensure_ascii: bool = True):
+    """Pretty-printed JSON, as the ETL modules have always written it."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(dataset, f, indent=4, ensure_ascii=ensure_ascii)
+    return Path(path)
+
+
+def write_parquet(path, dataset):
+    """Parquet file with dictionary-encoded string columns and metadata in the schema."""
+    if not HAS_PYARROW:
+        raise ImportError("pyarrow is not installed")
+    df = _rows_to_frame(dataset.get('data', []))
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    columns = [
+        col.dictionary_encode() if (pa.types.is_string(col.type) or pa.types.is_large_string(col.type)) else col
+        for col in table.columns
+    ]
+    table = pa.Table.from_arrays(columns, names=table.column_names)
+    metadata = {METADATA_KEY.encode(): json.dumps(dataset.get('metadata', {}), ensure_ascii=False).encode('utf-8')}
+    table = table.replace_schema_metadata(metadata)
+    pq.write_table(table, path, use_dictionary=True)
+    return Path(path)
+
+
+def write_npz(path, dataset):
+    """Compressed npz: numeric columns as-is, string columns as codes + categories."""
+    df = _rows_to_frame(dataset.get('data', []))
+    arrays = {
+        '__columns__': np.array(list(df.columns), dtype=str),
+        '__metadata__': np.array(json.dumps(dataset.get('metadata', {}), ensure_ascii=False)),
+    }
+    for i, col in enumerate(df.columns):
+        series = df[col]
+        if not _is_typed(series):
+            codes, categories = pd.factorize(series, use_na_sentinel=True)
+            arrays[f'c{i}_codes'] = codes.astype(np.int32)
+            arrays[f'c{i}_categories'] = np.array(categories, dtype=str)
+        else:
+            arrays[f'c{i}_values'] = series.to_numpy()
+    np.savez_compressed(path, **arrays)
+    return Path(path)
+
+
+COLUMNAR_WRITERS = {
+    'parquet': ('.parquet', write_parquet),
+    'npz': ('.npz', write_npz),
+}
+
+
+def resolve_columnar_format(fmt: str) -> str:
+    """'auto' picks parquet when pyarrow is available, npz otherwise."""
+    if fmt == 'auto':
+        return 'parquet' if HAS_PYARROW else 'npz'
+    if fmt not in COLUMNAR_WRITERS:
+        raise ValueError(f"Unknown columnar format: {fmt}")
+    return fmt
+
+
+def write_columnar(name: str, dataset, fmt: str = 'auto', output_dir=COLUMNAR_DIR) -> Path:
+    """Write one dataset as output_dir/<name>.<ext> and return the path."""
+    fmt = resolve_columnar_format(fmt)
+    suffix, writer = COLUMNAR_WRITERS[fmt]
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / f"{name}{suffix}"
+    tmp_path = path.with_name(f"tmp-{path.name}")
+    writer(tmp_path, dataset)
+    os.replace(tmp_path, path)
+    print(f"Saved columnar {fmt}: {path}")
+    return path
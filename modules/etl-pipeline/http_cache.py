@@ -0,0 +1,163 @@
+"""
+On-disk HTTP cache for ETL source exports.
+
+Each cache key (e.g. an annex type) remembers the ETag / Last-Modified validators the
+server sent, the SHA-256 of the downloaded file and, optionally, the transformed ETL
+result for that hash. Later runs send conditional requests and can skip the transform
+step entirely when the server answers 304 or the content hash has not changed.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = Path('data') / 'http_cache'
+
+
+def sha256_file(path, chunk_size: int = 1024 * 1024) -> str:
+    """Return the hex SHA-256 digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _atomic_write_json(path: Path, payload):
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+class HttpCache:
+    """ETag/Last-Modified + content-hash cache stored under data/http_cache/."""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.cache_dir / 'index.json'
+        self._lock = threading.Lock()
+        self._index = self._load_index()
+
+    def _load_index(self) -> dict:
+        if not self.index_file.exists():
+            return {}
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            return index if isinstance(index, dict) else {}
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable HTTP cache index {self.index_file}: {e}")
+            return {}
+
+    def _save_index(self):
+        _atomic_write_json(self.index_file, self._index)
+
+    def entry(self, key: str) -> dict:
+        """Return a copy of the cache entry for key (empty dict if none)."""
+        with self._lock:
+            return dict(self._index.get(key, {}))
+
+    def conditional_headers(self, key: str) -> dict:
+        """If-None-Match / If-Modified-Since headers for the last response seen for key."""
+        entry = self.entry(key)
+        # Validators are only useful if we still have the body they describe
+        if not entry.get('path') or not os.path.exists(entry['path']):
+            return {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def record(self, key: str, path, content_hash: str, etag: str = None, last_modified: str = None, url: str = None):
+        """Remember the validators and content hash of a freshly downloaded file."""
+        with self._lock:
+            entry = self._index.get(key, {})
+            entry.update({
+                'url': url or entry.get('url'),
+                'path': str(path),
+                'sha256': content_hash,
+                'etag': etag,
+                'last_modified': last_modified,
+                'fetched_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            })
+            self._index[key] = entry
+            self._save_index()
+
+    def touch(self, key: str):
+        """Mark an entry as revalidated (304 / unchanged hash) without changing it."""
+        with self._lock:
+            if key in self._index:
+                self._index[key]['validated_at'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+                self._save_index()
+
+    def _result_file(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.result.json"
+
+    def load_result(self, key: str, content_hash: str):
+        """Return the cached transform result for key if it was built from content_hash."""
+        result_file = self._result_file(key)
+        if not result_file.exists():
+            return None
+        try:
+            with open(result_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if cached.get('sha256') != content_hash:
+            return None
+        return cached.get('result')
+
+    def store_result(self, key: str, content_hash: str, result):
+        """Cache the transform result built from the file with content_hash."""
+        _atomic_write_json(self._result_file(key), {'sha256': content_hash, 'result': result})
+
+
+def fetch_conditional(session, method: str, url: str, key: str, dest, cache: HttpCache = None,
+                      validate=None, **request_kwargs):
+    """Issue a (conditional) request and write the body to dest.
+
+    Returns (path, changed). On 304 the previously cached file is returned with
+    changed=False; on 200 the body is saved, its hash compared with the cached one and
+    the new validators recorded. validate(response) may reject a 200 body by returning
+    False, in which case ValueError is raised.
+    """
+    headers = dict(request_kwargs.pop('headers', None) or {})
+    if cache:
+        headers.update(cache.conditional_headers(key))
+
+    response = session.request(method, url, headers=headers, **request_kwargs)
+
+    if response.status_code == 304 and cache:
+        entry = cache.entry(key)
+        cache.touch(key)
+        print(f"Not modified (304): {url}")
+        return Path(entry['path']), False
+
+    if response.status_code != 200:
+        raise ValueError(f"{method} {url} -> {response.status_code}")
+    if validate and not validate(response):
+        raise ValueError(f"{method} {url} returned an unexpected payload")
+
+    dest = Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    with open(dest, 'wb') as f:
+        f.write(response.content)
+
+    content_hash = hashlib.sha256(response.content).hexdigest()
+    changed = True
+    if cache:
+        changed = cache.entry(key).get('sha256') != content_hash
+        cache.record(
+            key, dest, content_hash,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified'),
+            url=url,
+        )
+    return dest, changed
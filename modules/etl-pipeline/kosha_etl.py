@@ -2,31 +2,41 @@ import requests
 import pandas as pd
 import json
 import os
+import re
 import time
 import argparse
-import platform
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain, islice
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 import xml.etree.ElementTree as ET
 
 # Selenium for robust data extraction - cross-platform support
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
-# Cross-platform WebDriver imports
-if platform.system() == "Windows":
-    from selenium.webdriver.edge.options import Options as EdgeOptions
-    from selenium.webdriver.edge.service import Service as EdgeService
-else:
-    # For Mac/Linux development, use Chrome as fallback
-    from selenium.webdriver.chrome.options import Options as ChromeOptions
-    from selenium.webdriver.chrome.service import Service as ChromeService
-
-# WebDriver manager for automatic driver installation
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
+# Local HTML parsing for bulk table extraction (falls back to element-by-element WebDriver calls)
+try:
+    import lxml.html
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+# Streaming reader for .xlsx workbooks
+try:
+    import openpyxl
+    HAS_OPENPYXL = True
+except ImportError:
+    HAS_OPENPYXL = False
+
+from column_vocabulary import get_header_normalizer
+from download_waiter import list_files, wait_for_new_file
+from etl_output import COLUMNAR_WRITERS, write_columnar, write_json
+from substance_index import index_datasets, kosha_datasets
+from webdriver_pool import WebDriverPool, borrow_webdriver
 
 # KOSHA (Korea Occupational Safety and Health Agency) data sources
 # 산업안전보건법 특수관리물질 관련 데이터 소스 설정
@@ -81,6 +91,9 @@ KOSHA_CONFIG = {
     }
 }
 
+# Korean locale for every browser launched by this module
+BROWSER_ARGS = ('--lang=ko-KR',)
+
 def _default_headers(base_url: str) -> dict:
     """Return browser-like headers for Korean government website requests."""
     return {
@@ -91,106 +104,6 @@ def _default_headers(base_url: str) -> dict:
         'Connection': 'keep-alive',
     }
 
-def _build_webdriver(download_dir: Path):
-    """Create cross-platform WebDriver in headless mode with download directory configured."""
-    system = platform.system()
-
-    # Browser priority: Chrome first (cross-platform), then Edge on Windows
-    browser_configs = []
-
-    if system == "Windows":
-        browser_configs = [
-            (ChromeOptions, webdriver.Chrome, "Chrome"),
-            (EdgeOptions, webdriver.Edge, "Edge")
-        ]
-    else:
-        # Mac/Linux: Chrome primarily
-        browser_configs = [
-            (ChromeOptions, webdriver.Chrome, "Chrome")
-        ]
-
-    # Common options for all browsers
-    def setup_options(opts):
-        opts.add_argument('--headless=new')
-        opts.add_argument('--disable-gpu')
-        opts.add_argument('--no-sandbox')
-        opts.add_argument('--disable-dev-shm-usage')
-        opts.add_argument('--disable-web-security')
-        opts.add_argument('--allow-running-insecure-content')
-        opts.add_argument('--lang=ko-KR')
-
-        # Ensure downloads go to the specified folder without prompts
-        download_path = str(download_dir.resolve())
-        prefs = {
-            'download.default_directory': download_path,
-            'download.prompt_for_download': False,
-            'download.directory_upgrade': True,
-            'safebrowsing.enabled': True,
-        }
-        opts.add_experimental_option('prefs', prefs)
-        return opts, download_path
-
-    # Try each browser configuration
-    last_error = None
-    for opts_class, driver_class, browser_name in browser_configs:
-        try:
-            opts, download_path = setup_options(opts_class())
-
-            # Set up service with webdriver-manager
-            if browser_name == "Chrome":
-                service = ChromeService(ChromeDriverManager().install())
-            elif browser_name == "Edge":
-                service = EdgeService(EdgeChromiumDriverManager().install())
-            else:
-                service = None
-
-            # Initialize driver with service if available
-            if service:
-                driver = driver_class(service=service, options=opts)
-            else:
-                driver = driver_class(options=opts)
-
-            # Force download behavior via CDP (Chromium-based browsers)
-            driver.execute_cdp_cmd('Page.setDownloadBehavior', {
-                'behavior': 'allow',
-                'downloadPath': download_path
-            })
-            print(f"Successfully initialized {browser_name} WebDriver")
-            return driver
-        except Exception as e:
-            last_error = e
-            print(f"{browser_name} WebDriver initialization failed: {e}")
-            continue
-
-    # All browsers failed
-    error_msg = f"All WebDriver initializations failed. Last error: {last_error}"
-    if system == "Windows":
-        error_msg += "\nMake sure Chrome or Edge WebDriver is installed. Try: pip install webdriver-manager"
-    else:
-        error_msg += "\nMake sure Chrome WebDriver is installed. Try: pip install webdriver-manager"
-    raise Exception(error_msg)
-
-def _wait_for_new_file(download_dir: Path, file_pattern: str, before_files: set[str], timeout: int = 120) -> Path:
-    """Wait for a new file to appear and finish downloading in download_dir."""
-    end_time = time.time() + timeout
-    while time.time() < end_time:
-        current_files = {p.name for p in download_dir.glob(file_pattern)}
-        new_files = current_files - before_files
-        # If file visible and no partial download files present
-        partial_patterns = ['*.crdownload', '*.part', '*.tmp']
-        has_partial = any(any(download_dir.glob(pattern)) for pattern in partial_patterns)
-
-        if new_files and not has_partial:
-            # Choose the most recently modified new file
-            candidates = sorted(
-                [download_dir / name for name in new_files],
-                key=lambda p: p.stat().st_mtime,
-                reverse=True,
-            )
-            return candidates[0]
-        time.sleep(0.5)
-    raise TimeoutError(f'{file_pattern} download did not complete within timeout')
-
 def _handle_cookie_consent(driver):
     """Handle cookie consent banners on Korean government sites."""
     try:
@@ -213,7 +126,7 @@ def _handle_cookie_consent(driver):
     except Exception:
         pass
 
-def search_kosha_data(data_type: str) -> dict:
+def search_kosha_data(data_type: str, pool: WebDriverPool = None) -> dict:
     """Search for KOSHA data using web scraping."""
     config = KOSHA_CONFIG.get(data_type)
     if not config:
@@ -222,8 +135,7 @@ def search_kosha_data(data_type: str) -> dict:
     download_dir = Path('data')
     download_dir.mkdir(parents=True, exist_ok=True)
 
-    driver = _build_webdriver(download_dir)
-    try:
+    with borrow_webdriver(download_dir, pool, extra_args=BROWSER_ARGS) as driver:
         # First try known data URLs
         all_search_results = []
 
@@ -296,11 +208,78 @@ def search_kosha_data(data_type: str) -> dict:
             'page_title': driver.title if hasattr(driver, 'title') else 'N/A'
         }
 
-    finally:
-        driver.quit()
+# Pagination block following the list table (class="paging", "pagination", ...)
+PAGINATION_XPATH = "following::*[contains(@class, 'paging') or contains(@class, 'pagination')][1]"
+
+# Next-page links inside the pagination block ("다음", ">", class="next")
+NEXT_PAGE_XPATH = (
+    ".//a[contains(@class, 'next') or normalize-space(text())='다음' or normalize-space(text())='>' "
+    "or contains(@title, '다음')]"
+)
+
+# The browser resolves the CSS selector and returns the table as one HTML string
+TABLE_HTML_SCRIPT = "var t = document.querySelector(arguments[0]); return t ? t.outerHTML : null;"
+
+# Private-use character standing in for <br> while cell text is collected
+# (newlines in the HTML source are plain whitespace)
+LINE_BREAK_MARK = '\ue000'
+
+def _cell_text(cell) -> str:
+    """Cell text as WebElement.text reports it: <br> line breaks kept, runs of whitespace collapsed.
+
+    <br> elements must already have been marked (see _mark_line_breaks).
+    """
+    text = cell.text_content()
+    if LINE_BREAK_MARK not in text:
+        return ' '.join(text.split())
+    lines = (' '.join(line.split()) for line in text.split(LINE_BREAK_MARK))
+    return '\n'.join(line for line in lines if line)
+
+def _mark_line_breaks(element):
+    for br in element.iter('br'):
+        br.tail = LINE_BREAK_MARK + (br.tail or '')
+
+def parse_table_html(html: str) -> pd.DataFrame:
+    """Parse an HTML table (its outerHTML, or the first table of a page) locally with lxml."""
+    root = lxml.html.fromstring(html)
+    table = root if root.tag == 'table' else root.find('.//table')
+    if table is None:
+        raise ValueError("No table found in HTML")
+    for hidden in list(table.iter('script', 'style')):
+        hidden.drop_tree()
+    _mark_line_breaks(table)
+
+    # Extract headers
+    headers = []
+    thead = table.find('.//thead')
+    if thead is not None:
+        headers = [_cell_text(cell) for cell in thead.iter('th')]
+
+    # Extract data rows (a browser DOM always has <tbody>, saved HTML may not)
+    rows = []
+    tbody = table.find('.//tbody')
+    for row in (tbody if tbody is not None else table).iter('tr'):
+        row_data = [_cell_text(cell) for cell in row.iter('td')]
+        if row_data:
+            rows.append(row_data)
+
+    if headers and rows:
+        return pd.DataFrame(rows, columns=headers)
+    return pd.DataFrame(rows)
+
+def extract_table_data(driver, table_selector: str = None, bulk: bool = True) -> pd.DataFrame:
+    """Extract data from HTML table.
+
+    The bulk path fetches the table's HTML in a single execute_script call and parses
+    it locally; the element-by-element path (bulk=False, or without lxml) makes one
+    WebDriver call per row and per cell.
+    """
+    if bulk and HAS_LXML:
+        html = driver.execute_script(TABLE_HTML_SCRIPT, table_selector or 'table')
+        if html is None:
+            raise ValueError(f"No table found for selector: {table_selector or 'table'}")
+        return parse_table_html(html)
 
-def extract_table_data(driver, table_selector: str = None) -> pd.DataFrame:
-    """Extract data from HTML table."""
     if table_selector:
         table = driver.find_element(By.CSS_SELECTOR, table_selector)
     else:
@@ -332,16 +311,146 @@ def extract_table_data(driver, table_selector: str = None) -> pd.DataFrame:
 
     return df
 
-def try_api_extraction(data_type: str) -> dict:
-    """Try to extract data using API endpoints."""
+def _next_page_link(table, next_xpath: str):
+    """Next-page link in the pagination block after the table, ignoring carousels and menus elsewhere."""
+    for pager in table.find_elements(By.XPATH, PAGINATION_XPATH):
+        # A pagination block further down the page may belong to another table
+        if table not in pager.find_elements(By.XPATH, "preceding::table[1]/ancestor-or-self::table"):
+            return None
+        for link in pager.find_elements(By.XPATH, next_xpath):
+            if link.is_displayed() and 'disabled' not in (link.get_attribute('class') or ''):
+                return link
+    return None
+
+def extract_paginated_table(driver, table_selector: str = None, next_xpath: str = NEXT_PAGE_XPATH,
+                            max_pages: int = 50, timeout: int = 15) -> pd.DataFrame:
+    """Extract a table split over several pages and merge the pages into one DataFrame.
+
+    Each page's table HTML is fetched once and parsed, then the next-page link in the
+    pagination block following the table (next_xpath, relative to that block) is clicked
+    and the old first row is awaited going stale. Stops when there is no next link, the
+    table HTML did not change after the click, or after max_pages.
+    """
+    selector = table_selector or 'table'
+    frames = []
+    previous = None
+    for page in range(1, max_pages + 1):
+        html = driver.execute_script(TABLE_HTML_SCRIPT, selector)
+        if html is None:
+            if page == 1:
+                raise ValueError(f"No table found for selector: {selector}")
+            break
+        if html == previous:
+            break
+        previous = html
+        if HAS_LXML:
+            frames.append(parse_table_html(html))
+        else:
+            frames.append(extract_table_data(driver, table_selector, bulk=False))
+
+        table = driver.find_element(By.CSS_SELECTOR, selector)
+        link = _next_page_link(table, next_xpath)
+        if link is None:
+            break
+        markers = table.find_elements(By.CSS_SELECTOR, 'tbody tr') or [table]
+        link.click()
+        try:
+            WebDriverWait(driver, timeout).until(EC.staleness_of(markers[0]))
+        except TimeoutException:
+            print(f"Table did not change after clicking next on page {page}")
+
+    if len(frames) > 1:
+        print(f"Merged {len(frames)} table pages")
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0]
+    return pd.concat(frames, ignore_index=True)
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Process-wide keep-alive session shared by every API probe (one pool per host)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            _session.mount('https://', adapter)
+            _session.mount('http://', adapter)
+        return _session
+
+
+# Which API endpoint last returned a valid payload for each data_type, probed first next time
+API_ENDPOINT_FILE = Path('data') / 'kosha_api_endpoints.json'
+_endpoint_lock = threading.Lock()
+
+
+def _load_endpoint_memory() -> dict:
+    try:
+        with open(API_ENDPOINT_FILE, 'r', encoding='utf-8') as f:
+            memory = json.load(f)
+        return memory if isinstance(memory, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _remember_endpoint(data_type: str, endpoint: str):
+    with _endpoint_lock:
+        memory = _load_endpoint_memory()
+        if memory.get(data_type) == endpoint:
+            return
+        memory[data_type] = endpoint
+        API_ENDPOINT_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = API_ENDPOINT_FILE.with_suffix('.json.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(memory, f, indent=4)
+        os.replace(tmp_file, API_ENDPOINT_FILE)
+
+
+def _probe_endpoint(session, endpoint: str, headers: dict, timeout, stop: threading.Event) -> dict:
+    """GET one endpoint and return the parsed payload, or raise if it is not valid JSON/XML.
+
+    The body is read in chunks so a probe that lost the race (stop is set) gives up
+    its connection instead of downloading a payload nobody will use.
+    """
+    with session.get(endpoint, headers=headers, timeout=timeout, stream=True) as response:
+        if response.status_code != 200:
+            raise ValueError(f"HTTP {response.status_code}")
+        content_type = response.headers.get('Content-Type', '').lower()
+        if 'json' not in content_type and 'xml' not in content_type:
+            raise ValueError(f"unexpected Content-Type {content_type or '(none)'}")
+
+        chunks = []
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            if stop.is_set():
+                raise InterruptedError("another endpoint answered first")
+            chunks.append(chunk)
+        content = b''.join(chunks)
+
+    data = json.loads(content) if 'json' in content_type else ET.fromstring(content)
+    return {'source': 'api', 'endpoint': endpoint, 'data': data, 'content_type': content_type}
+
+
+def try_api_extraction(data_type: str, timeout: float = 30, connect_timeout: float = 5) -> dict:
+    """Try to extract data using API endpoints.
+
+    The endpoint that worked last time for data_type is tried alone first. Otherwise all
+    candidates are probed concurrently over the shared session; the first valid JSON/XML
+    payload wins and the remaining probes are cancelled, so a dead host costs one
+    timeout instead of one per endpoint.
+    """
     config = KOSHA_CONFIG.get(data_type)
     api_base = config.get('api_base')
 
     if not api_base:
         return None
 
-    session = requests.Session()
+    session = get_session()
     base_headers = _default_headers(config['base_url'])
+    request_timeout = (connect_timeout, timeout)
 
     # Common Korean government API patterns
     api_endpoints = [
@@ -351,74 +460,221 @@ def try_api_extraction(data_type: str) -> dict:
         f"{api_base}/substances",  # 물질 데이터
     ]
 
-    for endpoint in api_endpoints:
+    remembered = _load_endpoint_memory().get(data_type)
+    if remembered in api_endpoints:
         try:
-            response = session.get(endpoint, headers=base_headers, timeout=30)
-            if response.status_code == 200:
-                content_type = response.headers.get('Content-Type', '').lower()
-
-                if 'json' in content_type:
-                    data = response.json()
-                    return {
-                        'source': 'api',
-                        'endpoint': endpoint,
-                        'data': data,
-                        'content_type': content_type
-                    }
-                elif 'xml' in content_type:
-                    # Parse XML
-                    root = ET.fromstring(response.content)
-                    return {
-                        'source': 'api',
-                        'endpoint': endpoint,
-                        'data': root,
-                        'content_type': content_type
-                    }
-
+            result = _probe_endpoint(session, remembered, base_headers, request_timeout, threading.Event())
+            print(f"API endpoint {remembered} (cached for {data_type}) answered")
+            return result
         except Exception as e:
-            print(f"API endpoint {endpoint} failed: {e}")
-            continue
-
-    return None
+            print(f"Cached API endpoint {remembered} failed: {e}; probing all endpoints")
+        api_endpoints.remove(remembered)
+
+    stop = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=len(api_endpoints))
+    futures = {
+        executor.submit(_probe_endpoint, session, endpoint, base_headers, request_timeout, stop): endpoint
+        for endpoint in api_endpoints
+    }
+    try:
+        for future in as_completed(futures):
+            endpoint = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"API endpoint {endpoint} failed: {e}")
+                continue
+            _remember_endpoint(data_type, endpoint)
+            return result
+        return None
+    finally:
+        # Losing probes stop at their next chunk; queued ones never start
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
 
 def download_excel_from_link(driver, link_url: str, download_dir: Path) -> str:
     """Download Excel file from a link using Selenium."""
-    before_files = {p.name for p in download_dir.glob('*.xls*')}
+    before_files = list_files(download_dir, '*.xls*')
 
     driver.get(link_url)
     time.sleep(2)  # Wait for download to start
 
-    downloaded_path = _wait_for_new_file(download_dir, '*.xls*', before_files, timeout=180)
+    downloaded_path = wait_for_new_file(download_dir, '*.xls*', before_files, timeout=180)
     print(f"Downloaded Excel file: {downloaded_path}")
     return str(downloaded_path)
 
-def _read_excel_robust(path: str) -> pd.DataFrame:
-    """Read Excel file with multiple encoding attempts."""
-    encodings = ['utf-8', 'cp949', 'euc-kr', 'latin-1']  # Korean encodings
-
+# Magic bytes: .xlsx is a zip archive, legacy .xls an OLE2 compound file (BIFF)
+XLSX_MAGIC = b'PK\x03\x04'
+BIFF_MAGIC = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+# Tried for HTML saved as .xls when it declares no (or a wrong) charset
+HTML_ENCODINGS = ('utf-8-sig', 'cp949')
+# Rows per sheet scanned for the header row (title rows often sit above it)
+HEADER_SCAN_ROWS = 30
+# Downloads larger than this are read in row chunks instead of one DataFrame
+EXCEL_STREAM_THRESHOLD = 20 * 1024 * 1024
+EXCEL_CHUNK_ROWS = 10_000
+
+def sniff_excel_format(path: str) -> str:
+    """'xlsx', 'xls' or 'html' from the file's first bytes (the extension is often wrong)."""
+    with open(path, 'rb') as f:
+        head = f.read(512)
+    if head.startswith(XLSX_MAGIC):
+        return 'xlsx'
+    if head.startswith(BIFF_MAGIC):
+        return 'xls'
+    if head.lstrip(b'\xef\xbb\xbf \t\r\n').startswith(b'<'):
+        return 'html'
+    raise ValueError(f"Unrecognized workbook format {head[:8]!r}: {path}")
+
+def _decode_html(path: str) -> str:
+    raw = Path(path).read_bytes()
+    declared = re.search(rb'charset=["\']?([\w-]+)', raw[:4096], re.IGNORECASE)
+    encodings = ((declared.group(1).decode('ascii'),) if declared else ()) + HTML_ENCODINGS
     for encoding in encodings:
         try:
-            df = pd.read_excel(path, engine='openpyxl')
-            if not df.empty:
-                print(f"Successfully read Excel with encoding: {encoding}")
-                return df
-        except Exception as e:
-            print(f"Failed to read Excel with encoding {encoding}: {e}")
+            text = raw.decode(encoding)
+            break
+        except (UnicodeDecodeError, LookupError):
             continue
-
-    # Try with different engines
+    else:
+        text = raw.decode('cp949', errors='replace')
+    # lxml refuses str input that still carries an XML encoding declaration
+    return re.sub(r'^\s*<\?xml[^>]*\?>', '', text)
+
+def _open_workbook(path: str, fmt: str) -> tuple:
+    """([(sheet name, row iterator), ...], close) - xlsx rows are streamed from the file."""
+    if fmt == 'xlsx':
+        if not HAS_OPENPYXL:
+            raise ImportError("openpyxl is required to read .xlsx files")
+        workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        sheets = []
+        for sheet in workbook.worksheets:
+            sheet.reset_dimensions()  # stored dimensions are often wrong in generated files
+            sheets.append((sheet.title, sheet.iter_rows(values_only=True)))
+        return sheets, workbook.close
+
+    if fmt == 'xls':
+        frames = pd.read_excel(path, sheet_name=None, header=None, engine='xlrd')
+        return [(name, frame.astype(object).where(frame.notna(), None).itertuples(index=False, name=None))
+                for name, frame in frames.items()], lambda: None
+
+    if not HAS_LXML:
+        raise ImportError("lxml is required to read HTML workbooks")
+    root = lxml.html.fromstring(_decode_html(path))
+    sheets = []
+    for number, table in enumerate(root.iter('table'), start=1):
+        _mark_line_breaks(table)
+        rows = ([_cell_text(cell) or None for cell in row if cell.tag in ('th', 'td')] for row in table.iter('tr'))
+        sheets.append((f"table{number}", rows))
+    return sheets, lambda: None
+
+def _is_blank(row) -> bool:
+    return all(value is None or value == '' for value in row)
+
+def _header_scorer(expected_columns):
+    """Row -> number of distinct expected columns among its cells (aliases count via the column vocabulary)."""
+    normalizer = get_header_normalizer()
+
+    def key(value) -> str:
+        return re.sub(r'[\s_.\-()/]+', '', str(value)).lower()
+
+    expected = set()
+    for column in expected_columns or ():
+        expected.update((key(column), key(normalizer.normalize(column))))
+
+    def score(row) -> int:
+        matched = set()
+        for cell in row:
+            if cell is None or cell == '' or len(str(cell)) > 50:
+                continue
+            matched.update(k for k in (key(cell), key(normalizer.normalize(cell))) if k in expected)
+        return len(matched)
+
+    return score
+
+def _select_sheet(sheets, expected_columns) -> tuple:
+    """(sheet name, header row index, header row, score, data rows) for the best header match.
+
+    Only the first HEADER_SCAN_ROWS rows of each sheet are looked at; without a match the
+    first sheet with data and its first non-empty row are used.
+    """
+    score = _header_scorer(expected_columns)
+    best = None
+    for name, rows in sheets:
+        head = list(islice(rows, HEADER_SCAN_ROWS))
+        candidates = [(score(row), -index) for index, row in enumerate(head) if not _is_blank(row)]
+        if not candidates:
+            continue
+        matched, index = max(candidates)
+        if best is None or matched > best[3]:
+            best = (name, -index, head, matched, rows)
+    if best is None:
+        raise ValueError("Workbook has no data")
+    name, index, head, matched, rows = best
+    return name, index, head[index], matched, chain(head[index + 1:], rows)
+
+def _header_names(row) -> list:
+    """Column labels like pandas: blanks become 'Unnamed: i', repeats get '.1', '.2' suffixes."""
+    labels = [None if value is None or str(value).strip() == '' else str(value).strip() for value in row]
+    while labels and labels[-1] is None:
+        labels.pop()
+    names, seen = [], {}
+    for index, label in enumerate(labels):
+        label = label or f"Unnamed: {index}"
+        if label in seen:
+            seen[label] += 1
+            label = f"{label}.{seen[label]}"
+        else:
+            seen[label] = 0
+        names.append(label)
+    return names
+
+def iter_excel_chunks(path: str, expected_columns=None, chunk_size: int = EXCEL_CHUNK_ROWS):
+    """Read a downloaded workbook once, yielding DataFrames of up to chunk_size rows.
+
+    The format is sniffed from the file (xlsx, legacy BIFF .xls, or HTML saved as .xls)
+    and the sheet/table whose header row best matches expected_columns is used. xlsx
+    sheets are streamed in read-only mode; .xls and HTML are parsed whole, then chunked.
+    chunk_size=None yields a single DataFrame. Blank rows are skipped; cells beyond the
+    header width are dropped.
+    """
+    fmt = sniff_excel_format(path)
+    sheets, close = _open_workbook(path, fmt)
     try:
-        df = pd.read_excel(path, engine='xlrd')
-        print("Successfully read Excel with xlrd engine")
-        return df
-    except Exception as e:
-        print(f"Failed to read Excel with xlrd: {e}")
+        name, index, header, matched, rows = _select_sheet(sheets, expected_columns)
+        columns = _header_names(header)
+        width = len(columns)
+        print(f"Reading {fmt} workbook {Path(path).name}: sheet '{name}', header row {index + 1} "
+              f"({matched} expected columns matched)")
+
+        chunk = []
+        for row in rows:
+            if _is_blank(row):
+                continue
+            row = list(row[:width])
+            row.extend([None] * (width - len(row)))
+            chunk.append(row)
+            if chunk_size and len(chunk) >= chunk_size:
+                yield pd.DataFrame(chunk, columns=columns)
+                chunk = []
+        if chunk:
+            yield pd.DataFrame(chunk, columns=columns)
+    finally:
+        close()
 
-    raise ValueError(f"Could not read Excel file: {path}")
+def _read_excel_robust(path: str, expected_columns=None) -> pd.DataFrame:
+    """Read a downloaded workbook once with the engine matching its actual format."""
+    frames = list(iter_excel_chunks(path, expected_columns, chunk_size=None))
+    if not frames:
+        raise ValueError(f"Could not read Excel file: {path} (no data rows)")
+    return frames[0]
 
+def etl_process_kosha(data_type: str, skip_download: bool = False, pool: WebDriverPool = None) -> dict:
+    """ETL process for KOSHA data.
 
-def etl_process_kosha(data_type: str, skip_download: bool = False) -> dict:
-    """ETL process for KOSHA data."""
+    The search and scraping steps borrow the same browser from pool; without one, a
+    single-browser pool is created for this call.
+    """
     import logging
 
     # 로깅 설정
@@ -470,15 +726,19 @@ def etl_process_kosha(data_type: str, skip_download: bool = False) -> dict:
 
     # Fallback to web scraping
     logger.info("API extraction failed, attempting web scraping")
+    # Table headers are mapped to the column vocabulary shared with the PDF parser
+    header_normalizer = get_header_normalizer()
+    own_pool = pool is None
+    if own_pool:
+        pool = WebDriverPool(extra_args=BROWSER_ARGS)
     try:
-        search_results = search_kosha_data(data_type)
+        search_results = search_kosha_data(data_type, pool=pool)
 
         data_found = False
         processed_data = []
 
         download_dir = Path('data')
-        driver = _build_webdriver(download_dir)
-        try:
+        with pool.lease(download_dir) as driver:
             logger.info(f"Processing {len(search_results['search_results'])} search results")
 
             for result in search_results['search_results']:
@@ -486,10 +746,17 @@ def etl_process_kosha(data_type: str, skip_download: bool = False) -> dict:
                     try:
                         logger.info(f"Attempting to download Excel from: {result['url']}")
                         excel_path = download_excel_from_link(driver, result['url'], download_dir)
-                        df = _read_excel_robust(excel_path)
-                        processed_data.extend(df.to_dict('records'))
-                        data_found = True
-                        logger.info(f"Successfully extracted {len(df)} records from Excel file")
+                        if os.path.getsize(excel_path) > EXCEL_STREAM_THRESHOLD:
+                            frames = iter_excel_chunks(excel_path, config['expected_columns'])
+                        else:
+                            frames = [_read_excel_robust(excel_path, config['expected_columns'])]
+                        record_count = 0
+                        for df in frames:
+                            df.columns = header_normalizer.normalize_columns(df.columns)
+                            processed_data.extend(df.to_dict('records'))
+                            record_count += len(df)
+                        data_found = data_found or record_count > 0
+                        logger.info(f"Successfully extracted {record_count} records from Excel file")
                     except Exception as e:
                         logger.error(f"Failed to download/process Excel: {e}")
                         continue
@@ -499,8 +766,9 @@ def etl_process_kosha(data_type: str, skip_download: bool = False) -> dict:
                         source_url = result.get('source_url', search_results['config']['data_url'])
                         logger.info(f"Attempting to extract table data from: {source_url}")
                         driver.get(source_url)
-                        df = extract_table_data(driver)
+                        df = extract_paginated_table(driver)
                         if not df.empty:
+                            df.columns = header_normalizer.normalize_columns(df.columns)
                             processed_data.extend(df.to_dict('records'))
                             data_found = True
                             logger.info(f"Successfully extracted {len(df)} records from HTML table")
@@ -523,30 +791,117 @@ def etl_process_kosha(data_type: str, skip_download: bool = False) -> dict:
             logger.info(f"Web scraping completed successfully. Total items: {len(processed_data)}")
             return {'metadata': metadata, 'data': processed_data}
 
-        finally:
-            driver.quit()
-
     except Exception as e:
         logger.error(f"Web scraping failed: {e}")
         raise
+    finally:
+        if own_pool:
+            pool.close()
+
+def _run_source(data_type: str, skip_download: bool, pool: WebDriverPool) -> tuple:
+    """etl_process_kosha for one source, returning (result or None, error or None, seconds)."""
+    start = time.perf_counter()
+    try:
+        result = etl_process_kosha(data_type, skip_download=skip_download, pool=pool)
+        return result, None, time.perf_counter() - start
+    except Exception as e:
+        return None, e, time.perf_counter() - start
+
+def run_all_sources(data_types=None, skip_download: bool = False, workers: int = None,
+                    pool: WebDriverPool = None) -> dict:
+    """Run every KOSHA_CONFIG source in this process and combine the results.
+
+    Sources run on a thread each, so API probes and page loads of one source overlap
+    with the others; the browser steps share pool (one browser unless a larger pool is
+    passed in) and take turns on it. A failing source is reported in the metadata and
+    left out of the data. Every record carries the data_type it came from.
+    """
+    data_types = list(data_types or KOSHA_CONFIG)
+    workers = max(1, min(workers or len(data_types), len(data_types)))
+    own_pool = pool is None
+    if own_pool:
+        pool = WebDriverPool(extra_args=BROWSER_ARGS)
+
+    start = time.perf_counter()
+    outcomes = {}
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_run_source, data_type, skip_download, pool): data_type
+                       for data_type in data_types}
+            for future in as_completed(futures):
+                data_type = futures[future]
+                result, error, elapsed = future.result()
+                outcomes[data_type] = (result, error, elapsed)
+                if error is None:
+                    print(f"Processed {data_type} in {elapsed:.1f}s")
+                else:
+                    print(f"Error processing {data_type} after {elapsed:.1f}s: {error}")
+        pool_stats = pool.stats()
+    finally:
+        if own_pool:
+            pool.close()
+
+    # Keep the output ordering stable regardless of completion order
+    sources = {}
+    data = []
+    for data_type in data_types:
+        result, error, elapsed = outcomes[data_type]
+        if error is not None:
+            sources[data_type] = {'status': 'failed', 'error': str(error), 'elapsed_seconds': round(elapsed, 3)}
+            continue
+        records = result.get('data')
+        if isinstance(records, dict):
+            records = [records]
+        records = [dict(record, data_type=data_type) if isinstance(record, dict) else record
+                   for record in records or []]
+        sources[data_type] = dict(result['metadata'], status='ok', elapsed_seconds=round(elapsed, 3))
+        data.extend(records)
+
+    metadata = {
+        'data_type': 'all',
+        'source': 'combined',
+        'item_count': len(data),
+        'sources': sources,
+        'elapsed_seconds': round(time.perf_counter() - start, 3),
+        'browser_pool': pool_stats,
+    }
+    return {'metadata': metadata, 'data': data}
 
 def main():
     parser = argparse.ArgumentParser(description='KOSHA ETL Pipeline for Korean Chemical Safety Data')
-    parser.add_argument('--data-type', choices=['special_materials', 'hazardous_materials', 'mole_data'],
-                       default='special_materials', help='Type of data to extract')
+    parser.add_argument('--data-type', choices=['special_materials', 'hazardous_materials', 'mole_data', 'all'],
+                       default='special_materials',
+                       help='Type of data to extract (all: every source in one run, one browser, combined output)')
+    parser.add_argument('--workers', type=int,
+                        help='With --data-type all: sources processed concurrently (default: all of them)')
     parser.add_argument('--skip-download', action='store_true', help='Skip downloading and use existing files')
     parser.add_argument('--output-file', default='kosha_data.json', help='Output JSON file name')
+    parser.add_argument('--columnar', choices=['auto'] + list(COLUMNAR_WRITERS),
+                       help='Also write the dataset as a columnar file under data/columnar/ (auto: parquet if pyarrow is installed, else npz)')
+    parser.add_argument('--no-index', action='store_true',
+                       help='Do not update the cross-source substance index (data/substance_index.sqlite)')
     args = parser.parse_args()
 
     os.makedirs('data', exist_ok=True)
 
     try:
-        result = etl_process_kosha(args.data_type, skip_download=args.skip_download)
+        if args.data_type == 'all':
+            result = run_all_sources(skip_download=args.skip_download, workers=args.workers)
+            for data_type, info in result['metadata']['sources'].items():
+                print(f"  {data_type}: {info['status']}, {info.get('item_count', 0)} items, "
+                      f"{info['elapsed_seconds']:.1f}s")
+            if not result['data']:
+                raise ValueError("No data extracted from any KOSHA source")
+        else:
+            result = etl_process_kosha(args.data_type, skip_download=args.skip_download)
 
         output_file = f'data/{args.output_file}'
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=4, ensure_ascii=False)
+        write_json(output_file, result, ensure_ascii=False)
         print(f"Data saved to {output_file}")
+        if args.columnar and isinstance(result.get('data'), list):
+            write_columnar(Path(args.output_file).stem, result, fmt=args.columnar)
+        if not args.no_index:
+            index_datasets('kosha', kosha_datasets(result))
         print(f"Extracted {result['metadata']['item_count']} items")
 
     except Exception as e:
@@ -4,29 +4,26 @@ import json
 import os
 import time  # For delay to avoid rate limiting
 import argparse
-import platform
+import codecs
+import csv
+import threading
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import xml.etree.ElementTree as ET
 # Selenium for robust CSV export via button click - cross-platform support
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
-# Cross-platform WebDriver imports
-if platform.system() == "Windows":
-    from selenium.webdriver.edge.options import Options as EdgeOptions
-    from selenium.webdriver.edge.service import Service as EdgeService
-else:
-    # For Mac/Linux development, use Chrome as fallback
-    from selenium.webdriver.chrome.options import Options as ChromeOptions
-    from selenium.webdriver.chrome.service import Service as ChromeService
-
-# WebDriver manager for automatic driver installation
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
+from download_waiter import list_files, wait_for_new_file
+from etl_output import COLUMNAR_WRITERS, write_columnar, write_json
+from http_cache import HttpCache, fetch_conditional, sha256_file
+from reach_snapshot import SnapshotStore
+from substance_index import index_datasets
+from webdriver_pool import WebDriverPool, borrow_webdriver
 
 # ECHA Annex base URLs and POST parameters
 ANNEX_CONFIG = {
@@ -92,175 +89,155 @@ def _default_headers(base_url: str) -> dict:
     }
 
 
-def _post_headers(base_url: str) -> dict:
-    """Headers for CSV export POST call."""
+def _post_headers(base_url: str, accept: str = 'text/csv,*/*;q=0.8') -> dict:
+    """Headers for CSV/XML export POST call."""
     return {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0 Safari/537.36',
-        'Accept': 'text/csv,*/*;q=0.8',
+        'Accept': accept,
         'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
         'Origin': 'https://echa.europa.eu',
         'Referer': base_url,
     }
 
 
-def download_csv(annex_type):
-    """Download CSV using POST request to simulate export button, with retries and browser-like headers."""
-    config = ANNEX_CONFIG.get(annex_type)
-    if not config:
-        raise ValueError(f"Unknown annex type: {annex_type}")
-    
-    session = requests.Session()
-    base_headers = _default_headers(config['base_url'])
+def _looks_like_html(content: bytes) -> bool:
+    head = content[:512].lstrip(b'\xef\xbb\xbf \t\r\n').lower()
+    return head.startswith(b'<!doctype html') or head.startswith(b'<html')
+
+
+def _is_csv_response(response) -> bool:
+    """Accept a body with a delimited header row and at least one data line.
+
+    ECHA does not always set text/csv, so the body itself is checked: HTML pages and
+    JSON error bodies are rejected, and the first line must split on a CSV delimiter.
+    """
+    content_type = (response.headers.get('Content-Type') or '').lower()
+    content = response.content or b''
+    if 'html' in content_type or _looks_like_html(content):
+        return False
+    head = content[:SNIFF_BYTES].lstrip(b'\xef\xbb\xbf \t\r\n')
+    if head[:1] in (b'{', b'['):
+        return False
+    lines = [line for line in head.splitlines() if line.strip()]
+    if len(lines) < 2:
+        return False
+    return any(delim.encode() in lines[0] for delim in CSV_DELIMITERS)
+
+
+def _is_xml_response(response) -> bool:
+    """Accept a body that starts like an XML document and contains at least one <result>."""
+    content = response.content or b''
+    head = content[:512].lstrip(b'\xef\xbb\xbf \t\r\n')
+    return head.startswith(b'<') and not _looks_like_html(content) and b'<result' in content
+
+
+# Export variants for the requests-only path, merged over ANNEX_CONFIG[...]['params'].
+# Adjust based on Network tab if ECHA changes the portlet resource IDs.
+EXPORT_FORMATS = {
+    'csv': {
+        'params': {'p_p_resource_id': 'exportResults'},
+        'accept': 'text/csv,*/*;q=0.8',
+        'filename_key': 'csv_filename',
+        'validate': _is_csv_response,
+    },
+    'xml': {
+        'params': {'p_p_resource_id': 'exportResultsXML'},
+        'accept': 'application/xml,text/xml,*/*;q=0.8',
+        'filename_key': 'xml_filename',
+        'validate': _is_xml_response,
+    },
+}
+
+_session = None
+_session_lock = threading.Lock()
+
 
-    # First GET the page to get cookies/session (with retries)
+def get_session() -> requests.Session:
+    """Process-wide keep-alive session shared by every direct export request."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            _session.mount('https://', adapter)
+            _session.mount('http://', adapter)
+        return _session
+
+
+def _prime_session(session, config, attempts: int = 3):
+    """GET the list page first so the export POST carries the portlet cookies."""
+    base_headers = _default_headers(config['base_url'])
     last_exc = None
-    for attempt in range(3):
+    for attempt in range(attempts):
         try:
             response = session.get(config['base_url'], headers=base_headers, timeout=30, allow_redirects=True)
             if response.status_code == 200:
-                break
+                return
             last_exc = Exception(f"GET {config['base_url']} -> {response.status_code}")
         except Exception as e:
             last_exc = e
-        time.sleep(1.5 * (attempt + 1))
-    else:
-        raise Exception(f"Failed to access base URL: {config['base_url']} ({last_exc})")
+        if attempt + 1 < attempts:
+            time.sleep(1.5 * (attempt + 1))
+    raise Exception(f"Failed to access base URL: {config['base_url']} ({last_exc})")
+
+
+def download_export(annex_type, fmt: str = 'csv', cache: HttpCache = None, session=None, attempts: int = 3):
+    """Download a CSV or XML export with the portlet POST, with retries and browser-like headers.
+
+    With a cache, the export request carries If-None-Match / If-Modified-Since and a 304
+    answer returns the previously downloaded file. A response that fails the format's
+    validation (e.g. an HTML error page) counts as a failed attempt.
+    """
+    config = ANNEX_CONFIG.get(annex_type)
+    if not config:
+        raise ValueError(f"Unknown annex type: {annex_type}")
+    export = EXPORT_FORMATS.get(fmt)
+    if not export:
+        raise ValueError(f"Unknown export format: {fmt}")
+
+    session = session or requests.Session()
+    _prime_session(session, config, attempts=attempts)
 
     time.sleep(1)  # Delay to mimic user behavior
 
+    # Use pathlib for cross-platform path handling
+    data_dir = Path('data')
+    data_dir.mkdir(parents=True, exist_ok=True)
+
     # POST to export (with retries)
-    post_headers = _post_headers(config['base_url'])
-    response = None
-    for attempt in range(3):
+    post_headers = _post_headers(config['base_url'], accept=export['accept'])
+    cache_key = annex_type if fmt == 'xml' else f"{annex_type}_{fmt}"
+    last_exc = None
+    for attempt in range(attempts):
         try:
-            response = session.post(
-                config['post_url'],
-                params=config['params'],
+            export_file, changed = fetch_conditional(
+                session, 'POST', config['post_url'], cache_key,
+                data_dir / config[export['filename_key']],
+                cache=cache,
+                validate=export['validate'],
+                params={**config['params'], **export['params']},
                 headers=post_headers,
                 timeout=60,
                 allow_redirects=True,
             )
-            # Some servers may not set content-type correctly; try to accept on success + non-empty body
-            content_type = (response.headers.get('Content-Type') or '').lower()
-            if response.status_code == 200 and (('text/csv' in content_type) or (response.content and len(response.content) > 100)):
-                break
+            break
         except Exception as e:
             last_exc = e
-        time.sleep(2.0 * (attempt + 1))
-    else:
-        raise Exception(f"Failed to download CSV for {annex_type} (last error: {last_exc})")
-
-    # Use pathlib for cross-platform path handling
-    data_dir = Path('data')
-    data_dir.mkdir(parents=True, exist_ok=True)
-    csv_file = data_dir / config['csv_filename']
-    
-    with open(csv_file, 'wb') as f:
-        f.write(response.content)
-    print(f"Downloaded: {csv_file}")
-    return str(csv_file)
-
-
-def _build_webdriver(download_dir: Path):
-    """Create cross-platform WebDriver in headless mode with download directory configured."""
-    system = platform.system()
-
-    # Browser priority: Chrome first (cross-platform), then Edge on Windows
-    browser_configs = []
-
-    if system == "Windows":
-        browser_configs = [
-            (ChromeOptions, webdriver.Chrome, "Chrome"),
-            (EdgeOptions, webdriver.Edge, "Edge")
-        ]
+        if attempt + 1 < attempts:
+            time.sleep(2.0 * (attempt + 1))
     else:
-        # Mac/Linux: Chrome primarily
-        browser_configs = [
-            (ChromeOptions, webdriver.Chrome, "Chrome")
-        ]
+        raise Exception(f"Failed to download {fmt.upper()} for {annex_type} (last error: {last_exc})")
 
-    # Common options for all browsers
-    def setup_options(opts):
-        opts.add_argument('--headless=new')
-        opts.add_argument('--disable-gpu')
-        opts.add_argument('--no-sandbox')
-        opts.add_argument('--disable-dev-shm-usage')
-        opts.add_argument('--disable-web-security')
-        opts.add_argument('--allow-running-insecure-content')
-
-        # Ensure downloads go to the specified folder without prompts
-        download_path = str(download_dir.resolve())
-        prefs = {
-            'download.default_directory': download_path,
-            'download.prompt_for_download': False,
-            'download.directory_upgrade': True,
-            'safebrowsing.enabled': True,
-        }
-        opts.add_experimental_option('prefs', prefs)
-        return opts, download_path
-
-    # Try each browser configuration
-    last_error = None
-    for opts_class, driver_class, browser_name in browser_configs:
-        try:
-            opts, download_path = setup_options(opts_class())
+    print(f"Downloaded: {export_file}" if changed else f"Unchanged: {export_file}")
+    return str(export_file)
 
-            # Set up service with webdriver-manager
-            if browser_name == "Chrome":
-                service = ChromeService(ChromeDriverManager().install())
-            elif browser_name == "Edge":
-                service = EdgeService(EdgeChromiumDriverManager().install())
-            else:
-                service = None
 
-            # Initialize driver with service if available
-            if service:
-                driver = driver_class(service=service, options=opts)
-            else:
-                driver = driver_class(options=opts)
-
-            # Force download behavior via CDP (Chromium-based browsers)
-            driver.execute_cdp_cmd('Page.setDownloadBehavior', {
-                'behavior': 'allow',
-                'downloadPath': download_path
-            })
-            print(f"Successfully initialized {browser_name} WebDriver")
-            return driver
-        except Exception as e:
-            last_error = e
-            print(f"{browser_name} WebDriver initialization failed: {e}")
-            continue
-
-    # All browsers failed
-    error_msg = f"All WebDriver initializations failed. Last error: {last_error}"
-    if system == "Windows":
-        error_msg += "\nMake sure Chrome or Edge WebDriver is installed. Try: pip install webdriver-manager"
-    else:
-        error_msg += "\nMake sure Chrome WebDriver is installed. Try: pip install webdriver-manager"
-    raise Exception(error_msg)
-
-
-def _wait_for_new_csv(download_dir: Path, before_files: set[str], timeout: int = 120) -> Path:
-    """Wait for a new CSV file to appear and finish downloading in download_dir."""
-    end_time = time.time() + timeout
-    crdownload_suffix = '.crdownload'
-    while time.time() < end_time:
-        current_files = {p.name for p in download_dir.glob('*.csv')}
-        new_csvs = current_files - before_files
-        # If csv visible and no .crdownload present, return the newest
-        if new_csvs and not any(download_dir.glob(f'*{crdownload_suffix}')):
-            # Choose the most recently modified new CSV
-            candidates = sorted(
-                [download_dir / name for name in new_csvs],
-                key=lambda p: p.stat().st_mtime,
-                reverse=True,
-            )
-            return candidates[0]
-        time.sleep(0.5)
-    raise TimeoutError('CSV download did not complete within timeout')
+def download_csv(annex_type, cache: HttpCache = None):
+    """Download CSV using POST request to simulate export button, with retries and browser-like headers."""
+    return download_export(annex_type, 'csv', cache=cache)
 
 
-def download_csv_selenium(annex_type: str) -> str:
+def download_csv_selenium(annex_type: str, pool: WebDriverPool = None) -> str:
     """Use Selenium (Edge headless) to click Export CSV button and wait for file to download."""
     config = ANNEX_CONFIG.get(annex_type)
     if not config:
@@ -269,15 +246,14 @@ def download_csv_selenium(annex_type: str) -> str:
     download_dir = Path('data')
     download_dir.mkdir(parents=True, exist_ok=True)
 
-    driver = _build_webdriver(download_dir)
-    try:
+    with borrow_webdriver(download_dir, pool) as driver:
         driver.get(config['base_url'])
         wait = WebDriverWait(driver, 30)
         export_selector = config.get('export_selector')
         if not export_selector:
             raise ValueError('export_selector not configured')
 
-        before_files = {p.name for p in download_dir.glob('*.csv')}
+        before_files = list_files(download_dir, '*.csv')
 
         # Try multiple selectors for robustness
         selectors = [
@@ -335,31 +311,32 @@ def download_csv_selenium(annex_type: str) -> str:
         if not clicked:
             raise last_err or RuntimeError('Export button not found')
 
-        downloaded_path = _wait_for_new_csv(download_dir, before_files, timeout=180)
+        downloaded_path = wait_for_new_file(download_dir, '*.csv', before_files, timeout=180)
         print(f"Downloaded via Selenium: {downloaded_path}")
         return str(downloaded_path)
-    finally:
-        driver.quit()
 
 
-def download_xml_selenium(annex_type: str) -> str:
-    """Use Selenium to click Export XML button and wait for file to download."""
+def download_xml_selenium(annex_type: str, download_dir: Path = None, pool: WebDriverPool = None) -> str:
+    """Use Selenium to click Export XML button and wait for file to download.
+
+    download_dir defaults to data/. Concurrent runs pass a per-worker directory so
+    the "new file" detection only ever sees this worker's downloads.
+    """
     config = ANNEX_CONFIG.get(annex_type)
     if not config:
         raise ValueError(f"Unknown annex type: {annex_type}")
 
-    download_dir = Path('data')
+    download_dir = Path(download_dir) if download_dir else Path('data')
     download_dir.mkdir(parents=True, exist_ok=True)
 
-    driver = _build_webdriver(download_dir)
-    try:
+    with borrow_webdriver(download_dir, pool) as driver:
         driver.get(config['base_url'])
         wait = WebDriverWait(driver, 30)
         export_selector = config.get('xml_selector')
         if not export_selector:
             raise ValueError('xml_selector not configured')
 
-        before_files = {p.name for p in download_dir.glob('*.xml')}
+        before_files = list_files(download_dir, '*.xml')
 
         # Handle disclaimer/terms acceptance first (required for ECHA)
         try:
@@ -419,108 +396,429 @@ def download_xml_selenium(annex_type: str) -> str:
         if not clicked:
             raise last_err or RuntimeError('XML Export button not found')
 
-        # Wait for XML (modify _wait_for_new_csv to _wait_for_new_file with *.xml)
-        def _wait_for_new_xml(download_dir: Path, before_files: set[str], timeout: int = 180) -> Path:
-            end_time = time.time() + timeout
-            while time.time() < end_time:
-                current_files = {p.name for p in download_dir.glob('*.xml')}
-                new_xmls = current_files - before_files
-                if new_xmls and not any(download_dir.glob('*.crdownload')):
-                    candidates = sorted([download_dir / name for name in new_xmls], key=lambda p: p.stat().st_mtime, reverse=True)
-                    return candidates[0]
-                time.sleep(0.5)
-            raise TimeoutError('XML download did not complete within timeout')
-
-        downloaded_path = _wait_for_new_xml(download_dir, before_files)
+        downloaded_path = wait_for_new_file(download_dir, '*.xml', before_files, timeout=180)
         print(f"Downloaded XML via Selenium: {downloaded_path}")
         return str(downloaded_path)
-    finally:
-        driver.quit()
 
 
-def _read_csv_robust(path: str):
-    """Try multiple encodings and delimiter detection before giving up - Windows compatible."""
-    # Windows-friendly encoding candidates
-    candidates = [
-        ('utf-8', None),
-        ('utf-8-sig', None),
-        ('cp1252', None),  # Windows default encoding
-        ('latin-1', None),
-        ('utf-8', ','),
-        ('utf-8', ';'),
-        ('utf-8', '\t'),
-        ('cp1252', ','),   # Windows with comma delimiter
-        ('cp1252', ';'),   # Windows with semicolon delimiter
-    ]
-    last_err = None
-    for enc, delim in candidates:
-        try:
-            if delim:
-                df = pd.read_csv(path, encoding=enc, sep=delim, engine='python')
-            else:
-                # Let pandas sniff delimiter
-                df = pd.read_csv(path, encoding=enc)
-            if not df.empty:
-                print(f"Successfully read CSV with encoding: {enc}, delimiter: {delim or 'auto'}")
-                return df
-        except Exception as e:
-            last_err = e
+# Sniffing budget: delimiter detection looks at the first SNIFF_BYTES only
+SNIFF_BYTES = 64 * 1024
+CSV_DELIMITERS = [',', ';', '\t', '|']
+_BOMS = [
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+
+def _is_utf8(chunk: bytes, final: bool) -> bool:
+    """True if chunk decodes as UTF-8 (a multibyte char cut at the chunk end is allowed)."""
+    try:
+        chunk.decode('utf-8')
+        return True
+    except UnicodeDecodeError as e:
+        return not final and e.reason == 'unexpected end of data' and e.start >= len(chunk) - 3
+
+
+def _detect_encoding(f, prefix: bytes) -> str:
+    """Guess the encoding from the first non-ASCII chunk: utf-8, else cp1252, else latin-1."""
+    chunk, final = prefix, len(prefix) < SNIFF_BYTES
+    # ASCII-only prefix says nothing; scan on (bytes only, no parsing) until evidence appears
+    while chunk.isascii() and not final:
+        chunk = f.read(SNIFF_BYTES)
+        final = len(chunk) < SNIFF_BYTES
+    if chunk.isascii() or _is_utf8(chunk, final):
+        return 'utf-8'
+    try:
+        chunk.decode('cp1252')
+        return 'cp1252'  # Windows default encoding
+    except UnicodeDecodeError:
+        return 'latin-1'
+
+
+def _detect_delimiter(sample: str) -> str:
+    """Pick the delimiter giving the most consistent (>1) field count over the sample lines."""
+    lines = sample.splitlines()
+    if len(lines) > 1:
+        lines = lines[:-1]  # last line may be cut by the prefix limit
+    lines = [line for line in lines[:50] if line.strip()]
+    best, best_score = ',', (0, 0)
+    for delim in CSV_DELIMITERS:
+        counts = [len(row) for row in csv.reader(lines, delimiter=delim)]
+        if not counts:
             continue
-    print(f"CSV read failed with last error: {last_err}")
-    return None
+        width = max(set(counts), key=counts.count)
+        if width < 2:
+            continue
+        score = (counts.count(width), width)
+        if score > best_score:
+            best, best_score = delim, score
+    return best
+
+
+def sniff_csv_dialect(path: str) -> dict:
+    """Detect BOM, encoding and delimiter of a CSV from a bounded prefix of the file."""
+    with open(path, 'rb') as f:
+        prefix = f.read(SNIFF_BYTES)
+        bom = next((enc for mark, enc in _BOMS if prefix.startswith(mark)), None)
+        encoding = bom or _detect_encoding(f, prefix)
+    sample = prefix.decode(encoding, errors='ignore')
+    return {
+        'encoding': encoding,
+        'delimiter': _detect_delimiter(sample),
+        'bom': bom is not None,
+    }
 
-def etl_process(annex_type, skip_download=False):
-    """ETL for a specific annex using XML only: Download via Selenium, parse XML, return as dict."""
-    config = ANNEX_CONFIG.get(annex_type)
-    xml_file = f"data/{config['xml_filename']}"
 
-    # Extract: XML only
-    if skip_download:
-        if not os.path.exists(xml_file):
-            raise FileNotFoundError(f"Existing XML not found for {annex_type}: {xml_file}")
-    else:
-        xml_file = download_xml_selenium(annex_type)
+def _read_csv_robust(path: str):
+    """Sniff encoding/delimiter once, then parse with the C engine - Windows compatible.
 
-    # Transform: Parse XML
+    The detected dialect is attached as df.attrs['csv_dialect'].
+    """
+    try:
+        dialect = sniff_csv_dialect(path)
+        df = pd.read_csv(path, encoding=dialect['encoding'], sep=dialect['delimiter'], engine='c')
+    except Exception as e:
+        print(f"CSV read failed: {e}")
+        return None
+    if df.empty:
+        print(f"CSV read returned no rows: {path}")
+        return None
+    df.attrs['csv_dialect'] = dialect
+    print(f"Successfully read CSV with encoding: {dialect['encoding']}, delimiter: {dialect['delimiter']!r}")
+    return df
+
+def _normalize_tag(tag: str) -> str:
+    """Column key used in reach_data.json for an XML tag."""
+    return tag.lower().replace(' ', '_').replace('.', '_')
+
+
+def _parse_xml_tree(xml_file) -> list:
+    """Build the full element tree, then copy every <result> into a dict."""
     tree = ET.parse(xml_file)
     root = tree.getroot()
     data = []
     for row in root.findall('.//result'):
         row_dict = {}
         for col in row:
-            key = col.tag.lower().replace(' ', '_').replace('.', '_')
+            key = _normalize_tag(col.tag)
             row_dict[key] = col.text.strip() if col.text else None
         data.append(row_dict)
+    return data
+
+
+def iter_xml_rows(xml_file):
+    """Stream row dicts from an ECHA XML export, one per closed <result> element.
+
+    Each processed element is cleared and detached from its parent, so memory stays
+    bounded by a single row. Tag normalization is computed once per distinct tag.
+    """
+    key_cache = {}
+    stack = []
+    for event, elem in ET.iterparse(xml_file, events=('start', 'end')):
+        if event == 'start':
+            stack.append(elem)
+            continue
+
+        stack.pop()
+        if elem.tag != 'result' or not stack:
+            continue
+
+        row_dict = {}
+        for col in elem:
+            key = key_cache.get(col.tag)
+            if key is None:
+                key = key_cache[col.tag] = _normalize_tag(col.tag)
+            row_dict[key] = col.text.strip() if col.text else None
+        yield row_dict
+
+        elem.clear()
+        stack[-1].remove(elem)
+
+
+def parse_xml_rows(xml_file, parser: str = 'stream') -> list:
+    """Parse an ECHA XML export into a list of row dicts ('stream' or 'tree' engine)."""
+    if parser == 'stream':
+        return list(iter_xml_rows(xml_file))
+    if parser == 'tree':
+        return _parse_xml_tree(xml_file)
+    raise ValueError(f"Unknown XML parser: {parser}")
+
+
+def parse_csv_rows(csv_file):
+    """Parse a CSV export into row dicts keyed like the XML columns; returns (rows, dialect)."""
+    df = _read_csv_robust(csv_file)
+    if df is None:
+        raise ValueError(f"Unreadable CSV export: {csv_file}")
+    dialect = df.attrs['csv_dialect']
+    df.columns = [_normalize_tag(str(col)) for col in df.columns]
+    df = df.astype(str).apply(lambda col: col.str.strip()).where(df.notna(), None)
+    return df.to_dict('records'), dialect
+
+
+# Which extraction strategy last worked for each annex, tried first on the next run
+STRATEGY_FILE = Path('data') / 'reach_strategy.json'
+EXTRACTION_STRATEGIES = ['direct_xml', 'direct_csv', 'selenium_xml']
+_strategy_lock = threading.Lock()
+
+
+def _load_strategy_memory() -> dict:
+    try:
+        with open(STRATEGY_FILE, 'r', encoding='utf-8') as f:
+            memory = json.load(f)
+        return memory if isinstance(memory, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _remember_strategy(annex_type: str, strategy: str, path: str, fmt: str):
+    """Record the strategy that produced rows, and the export it left on disk (for --skip-download)."""
+    entry = {'strategy': strategy, 'format': fmt, 'path': str(path)}
+    with _strategy_lock:
+        memory = _load_strategy_memory()
+        if memory.get(annex_type) == entry:
+            return
+        memory[annex_type] = entry
+        STRATEGY_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = STRATEGY_FILE.with_suffix('.json.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(memory, f, indent=4)
+        os.replace(tmp_file, STRATEGY_FILE)
+
+
+def _strategy_order(annex_type: str, mode: str) -> list:
+    """Strategies to try: Selenium only, or direct HTTP first with the last winner up front."""
+    if mode == 'selenium':
+        return ['selenium_xml']
+    order = list(EXTRACTION_STRATEGIES)
+    last = _load_strategy_memory().get(annex_type)
+    if isinstance(last, dict):
+        last = last.get('strategy')
+    if last in order:
+        order.remove(last)
+        order.insert(0, last)
+    return order
+
+
+def _last_export(annex_type: str):
+    """(path, format) of the export the last successful run parsed, or None (older memory files have none)."""
+    last = _load_strategy_memory().get(annex_type)
+    if isinstance(last, dict) and last.get('path') and last.get('format') in EXPORT_FORMATS:
+        return last['path'], last['format']
+    return None
+
+
+def _download_selenium_xml(annex_type, download_dir, pool):
+    xml_file = f"data/{ANNEX_CONFIG[annex_type]['xml_filename']}"
+    if download_dir:
+        # Private download dir: move the export to its usual place so --skip-download finds it
+        downloaded = download_xml_selenium(annex_type, download_dir=download_dir, pool=pool)
+        os.replace(downloaded, xml_file)
+        return xml_file
+    return download_xml_selenium(annex_type, pool=pool)
+
+
+def extract_export(annex_type, mode='direct', download_dir=None, cache: HttpCache = None,
+                   pool: WebDriverPool = None, transform=None):
+    """Fetch an annex export, returning (path, format, strategy, result).
+
+    In 'direct' mode the requests-based XML and CSV exports are tried on the shared
+    keep-alive session and a browser is only started when both fail. With a transform
+    (called as transform(path, fmt, strategy)), a download that cannot be parsed or
+    has no rows also counts as a failed strategy; only a strategy whose export yields
+    rows is remembered. result is the transform's return value (None without one).
+    """
+    last_exc = None
+    for strategy in _strategy_order(annex_type, mode):
+        try:
+            if strategy == 'selenium_xml':
+                path, fmt = _download_selenium_xml(annex_type, download_dir, pool), 'xml'
+            else:
+                fmt = strategy.split('_', 1)[1]
+                path = download_export(annex_type, fmt, cache=cache, session=get_session(), attempts=1)
+            result = transform(path, fmt, strategy) if transform else None
+        except Exception as e:
+            last_exc = e
+            print(f"{annex_type}: {strategy} extraction failed: {e}")
+            continue
+        _remember_strategy(annex_type, strategy, path, fmt)
+        return path, fmt, strategy, result
+    raise Exception(f"All extraction strategies failed for {annex_type} (last error: {last_exc})")
+
+def _transform_export(annex_type, export_file, fmt, used_strategy, xml_parser='stream', cache: HttpCache = None):
+    """Parse an export into {'metadata', 'data'}; raises ValueError if it has no rows.
+
+    With a cache, an export whose SHA-256 matches the previous run reuses the cached
+    result instead of being parsed again.
+    """
+    config = ANNEX_CONFIG.get(annex_type)
+    cache_key = annex_type if fmt == 'xml' else f"{annex_type}_{fmt}"
+    content_hash = None
+    if cache:
+        content_hash = sha256_file(export_file)
+        cached = cache.load_result(cache_key, content_hash)
+        if cached is not None:
+            cache.touch(cache_key)
+            print(f"{annex_type} export unchanged (sha256 {content_hash[:12]}), skipping transform")
+            # The cached metadata describes the run that parsed the file; record this run's strategy.
+            # fmt is part of cache_key and csv_dialect is sniffed from the hashed bytes, so both still hold.
+            metadata = dict(cached.get('metadata') or {}, extraction_strategy=used_strategy)
+            return {**cached, 'metadata': metadata}
+
+    dialect = None
+    if fmt == 'xml':
+        data = parse_xml_rows(export_file, parser=xml_parser)
+    else:
+        data, dialect = parse_csv_rows(export_file)
 
     if not data:
-        raise ValueError(f"Empty XML for {annex_type}: {xml_file}")
+        raise ValueError(f"Empty {fmt.upper()} for {annex_type}: {export_file}")
 
     metadata = {
         'annex_type': annex_type,
         'item_count': len(data),
-        'source': config['base_url']
+        'source': config['base_url'],
+        'extraction_strategy': used_strategy,
     }
-    return {'metadata': metadata, 'data': data}
+    if dialect:
+        metadata['csv_dialect'] = dialect
+    result = {'metadata': metadata, 'data': data}
+    if cache:
+        if cache.entry(cache_key).get('sha256') != content_hash:
+            cache.record(cache_key, export_file, content_hash, url=config['base_url'])
+        cache.store_result(cache_key, content_hash, result)
+    return result
+
+def etl_process(annex_type, skip_download=False, download_dir=None, xml_parser='stream', cache: HttpCache = None,
+                pool: WebDriverPool = None, strategy='direct'):
+    """ETL for a specific annex: download the export (direct HTTP, Selenium fallback), parse it, return as dict.
+
+    Each download is parsed before its strategy is accepted, so an export that passes
+    the response checks but has no rows falls through to the next strategy.
+    skip_download re-reads the export of the last successful run (XML or CSV), falling
+    back to data/<xml_filename>.
+    """
+    if skip_download:
+        config = ANNEX_CONFIG.get(annex_type)
+        last = _last_export(annex_type)
+        if last and os.path.exists(last[0]):
+            export_file, fmt = last
+        else:
+            export_file, fmt = f"data/{config['xml_filename']}", 'xml'
+            if not os.path.exists(export_file):
+                raise FileNotFoundError(f"No existing export for {annex_type}: {export_file}")
+        return _transform_export(annex_type, export_file, fmt, 'existing_file', xml_parser=xml_parser, cache=cache)
+
+    def transform(path, fmt, used_strategy):
+        return _transform_export(annex_type, path, fmt, used_strategy, xml_parser=xml_parser, cache=cache)
+
+    _, _, _, result = extract_export(
+        annex_type, mode=strategy, download_dir=download_dir, cache=cache, pool=pool, transform=transform,
+    )
+    return result
+
+def run_annexes(annexes, skip_download=False, workers=1, xml_parser='stream', cache: HttpCache = None,
+                pool: WebDriverPool = None, strategy='direct'):
+    """Run etl_process for each annex, optionally on a bounded thread pool.
+
+    Every worker downloads into its own data/downloads/<annex> directory. A failing
+    annex is reported and left out of the result, exactly like the sequential loop.
+    Browsers are borrowed from pool; without one, a pool sized to the worker count is
+    created for this run and closed at the end.
+    """
+    workers = max(1, min(workers, len(annexes)))
+    own_pool = pool is None and not skip_download
+    if own_pool:
+        pool = WebDriverPool(max_size=workers)
+
+    all_data = {}
+    try:
+        if workers == 1:
+            for annex in annexes:
+                try:
+                    all_data[annex] = etl_process(annex, skip_download=skip_download, xml_parser=xml_parser,
+                                                  cache=cache, pool=pool, strategy=strategy)
+                    print(f"Processed {annex}")
+                except Exception as e:
+                    print(f"Error processing {annex}: {e}")
+            return all_data
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    etl_process,
+                    annex,
+                    skip_download=skip_download,
+                    download_dir=Path('data') / 'downloads' / annex,
+                    xml_parser=xml_parser,
+                    cache=cache,
+                    pool=pool,
+                    strategy=strategy,
+                ): annex
+                for annex in annexes
+            }
+            for future in as_completed(futures):
+                annex = futures[future]
+                try:
+                    results[annex] = future.result()
+                    print(f"Processed {annex}")
+                except Exception as e:
+                    print(f"Error processing {annex}: {e}")
+
+        # Keep the output ordering stable regardless of completion order
+        for annex in annexes:
+            if annex in results:
+                all_data[annex] = results[annex]
+        return all_data
+    finally:
+        if own_pool:
+            pool.close()
+
 
 def main():
     parser = argparse.ArgumentParser(description='REACH ETL Pipeline')
     parser.add_argument('--skip-download', action='store_true', help='Skip downloading CSVs and use existing files')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of annexes to fetch and parse in parallel (default: 1, sequential)')
+    parser.add_argument('--xml-parser', choices=['stream', 'tree'], default='stream',
+                        help='XML engine: incremental iterparse (stream) or full ElementTree (tree)')
+    parser.add_argument('--strategy', choices=['direct', 'selenium'], default='direct',
+                        help='direct: requests-based export first, Selenium only as fallback; selenium: browser only')
+    parser.add_argument('--columnar', choices=['auto'] + list(COLUMNAR_WRITERS),
+                        help='Also write each annex as a columnar file under data/columnar/ (auto: parquet if pyarrow is installed, else npz)')
+    parser.add_argument('--no-snapshot', action='store_true',
+                        help='Do not write row-level deltas to data/snapshots/')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Disable the data/http_cache download cache and always re-parse exports')
+    parser.add_argument('--no-index', action='store_true',
+                        help='Do not update the cross-source substance index (data/substance_index.sqlite)')
     args = parser.parse_args()
 
     os.makedirs('data', exist_ok=True)
+    cache = None if args.no_cache else HttpCache()
     
-    all_data = {}
-    for annex in ['svhc', 'annex_xiv', 'annex_xvii']:
-        try:
-            all_data[annex] = etl_process(annex, skip_download=args.skip_download)
-            print(f"Processed {annex}")
-        except Exception as e:
-            print(f"Error processing {annex}: {e}")
+    all_data = run_annexes(['svhc', 'annex_xiv', 'annex_xvii'],
+                           skip_download=args.skip_download, workers=args.workers,
+                           xml_parser=args.xml_parser, cache=cache, strategy=args.strategy)
     
     json_file = 'data/reach_data.json'
-    with open(json_file, 'w') as f:
-        json.dump(all_data, f, indent=4)
+    write_json(json_file, all_data)
     print(f"Saved to {json_file}")
 
+    if args.columnar:
+        for annex, result in all_data.items():
+            write_columnar(f"reach_{annex}", result, fmt=args.columnar)
+
+    if not args.no_snapshot:
+        store = SnapshotStore()
+        for annex, result in all_data.items():
+            summary = store.update(annex, result['data'])
+            print(f"Snapshot {annex} #{summary['seq']}: +{summary['added']} "
+                  f"-{summary['removed']} ~{summary['changed']}")
+
+    if not args.no_index:
+        index_datasets('reach', {annex: result['data'] for annex, result in all_data.items()})
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,184 @@
+"""
+Incremental REACH snapshots with row-level diffing.
+
+Each annex has a compacted base (all rows keyed by a stable row identity) plus a chain of
+small delta files holding only the rows added, removed or changed by each ETL run:
+
+    data/snapshots/<annex>/base.json
+    data/snapshots/<annex>/delta-000042.json
+
+Consumers that only care about changes read the newest delta files instead of the whole
+dataset. After `compact_every` deltas the chain is folded back into a new base.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+DEFAULT_SNAPSHOT_DIR = Path('data') / 'snapshots'
+
+# Candidate column names (after tag normalization) making up the row identity
+IDENTITY_FIELDS = [
+    ('ec_no', 'ec_number', 'ec'),
+    ('cas_no', 'cas_number', 'cas'),
+    ('entry_id', 'entry_no', 'entry', 'id'),
+]
+
+
+def _content_hash(row: dict) -> str:
+    payload = json.dumps(row, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return hashlib.sha1(payload).hexdigest()
+
+
+def row_key(row: dict) -> str:
+    """Stable identity for a row: EC/CAS plus entry ID, or a content hash if none is present."""
+    parts = []
+    for candidates in IDENTITY_FIELDS:
+        value = next((row[f] for f in candidates if row.get(f)), None)
+        parts.append(str(value).strip() if value else '')
+    if any(parts):
+        return '|'.join(parts)
+    return 'sha1:' + _content_hash(row)
+
+
+def index_rows(rows: list) -> dict:
+    """Key rows by row_key; repeated identities get a #n suffix.
+
+    Rows sharing an identity are numbered in order of their content hash rather than
+    input order, so the same rows returned in a different order get the same keys.
+    """
+    groups = {}
+    for row in rows:
+        groups.setdefault(row_key(row), []).append(row)
+
+    indexed = {}
+    for key, group in groups.items():
+        if len(group) > 1:
+            group.sort(key=_content_hash)
+        for n, row in enumerate(group, start=1):
+            indexed[key if n == 1 else f"{key}#{n}"] = row
+    return indexed
+
+
+def diff_rows(old: dict, new: dict) -> dict:
+    """Row-level diff between two keyed snapshots."""
+    return {
+        'added': {k: v for k, v in new.items() if k not in old},
+        'removed': [k for k in old if k not in new],
+        'changed': {k: v for k, v in new.items() if k in old and old[k] != v},
+    }
+
+
+def _write_json(path: Path, payload):
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+
+def _read_json(path: Path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class SnapshotStore:
+    """Per-annex base + delta chain under data/snapshots/."""
+
+    def __init__(self, snapshot_dir=DEFAULT_SNAPSHOT_DIR, compact_every: int = 30):
+        self.snapshot_dir = Path(snapshot_dir)
+        self.compact_every = compact_every
+
+    def _annex_dir(self, annex_type: str) -> Path:
+        return self.snapshot_dir / annex_type
+
+    def _delta_files(self, annex_type: str) -> list:
+        return sorted(self._annex_dir(annex_type).glob('delta-*.json'))
+
+    def _load_base(self, annex_type: str) -> dict:
+        base_file = self._annex_dir(annex_type) / 'base.json'
+        if not base_file.exists():
+            return {'seq': 0, 'rows': {}}
+        return _read_json(base_file)
+
+    def load(self, annex_type: str):
+        """Return (seq, rows) for the current state: base with every delta replayed."""
+        base = self._load_base(annex_type)
+        seq, rows = base['seq'], base['rows']
+        for delta_file in self._delta_files(annex_type):
+            delta = _read_json(delta_file)
+            if delta['seq'] <= seq:
+                continue  # already folded into the base
+            for key in delta['removed']:
+                rows.pop(key, None)
+            rows.update(delta['added'])
+            rows.update(delta['changed'])
+            seq = delta['seq']
+        return seq, rows
+
+    def deltas_since(self, annex_type: str, seq: int) -> list:
+        """Deltas newer than seq, oldest first (what a change-alerting job should read).
+
+        If seq is older than the current base, the chain has been compacted past it and
+        the caller should reload the full state with load().
+        """
+        deltas = [_read_json(p) for p in self._delta_files(annex_type)]
+        return [d for d in deltas if d['seq'] > seq]
+
+    def update(self, annex_type: str, rows: list) -> dict:
+        """Diff rows against the stored state and write a delta if anything changed.
+
+        Returns the delta summary: seq plus added/removed/changed counts.
+        """
+        annex_dir = self._annex_dir(annex_type)
+        annex_dir.mkdir(parents=True, exist_ok=True)
+
+        seq, current = self.load(annex_type)
+        new_rows = index_rows(rows)
+        delta = diff_rows(current, new_rows)
+        summary = {
+            'seq': seq,
+            'added': len(delta['added']),
+            'removed': len(delta['removed']),
+            'changed': len(delta['changed']),
+        }
+        if not (delta['added'] or delta['removed'] or delta['changed']):
+            return summary
+
+        seq += 1
+        summary['seq'] = seq
+        if seq == 1:
+            # First run: the whole dataset goes straight into the base
+            self.compact(annex_type, seq, new_rows)
+            return summary
+
+        delta.update({
+            'seq': seq,
+            'annex_type': annex_type,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'row_count': len(new_rows),
+        })
+        _write_json(annex_dir / f'delta-{seq:06d}.json', delta)
+
+        if len(self._delta_files(annex_type)) >= self.compact_every:
+            self.compact(annex_type, seq, new_rows)
+        return summary
+
+    def compact(self, annex_type: str, seq: int = None, rows: dict = None):
+        """Fold the delta chain into a new base and drop the folded delta files.
+
+        The delta matching the new base seq is kept so readers still see the latest change.
+        """
+        if rows is None:
+            seq, rows = self.load(annex_type)
+        annex_dir = self._annex_dir(annex_type)
+        _write_json(annex_dir / 'base.json', {
+            'seq': seq,
+            'annex_type': annex_type,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'rows': rows,
+        })
+        for delta_file in self._delta_files(annex_type):
+            if int(delta_file.stem.split('-')[1]) < seq:
+                delta_file.unlink()
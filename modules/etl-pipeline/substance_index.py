@@ -0,0 +1,323 @@
+"""
+Cross-source chemical identity index (REACH, KOSHA, PDF) in a local SQLite file.
+
+Every ETL run replaces its own slice of the index, keyed by (source, list):
+
+    reach / svhc, annex_xiv, annex_xvii      (reach_etl.py)
+    kosha / special_materials, ...            (kosha_etl.py)
+    pdf   / <document name>                   (pdf_parser.py)
+
+Each record is stored once per CAS number it carries, with the EC number and a
+normalized substance name. All three columns are indexed, so "is this CAS regulated
+anywhere?" is a single index probe instead of a scan over every JSON file. A list of
+CAS numbers is checked with a single join against the CAS index.
+
+Usage:
+    python modules/etl-pipeline/substance_index.py lookup --cas 117-81-7
+    python modules/etl-pipeline/substance_index.py check cas_list.txt --output hits.csv
+    python modules/etl-pipeline/substance_index.py build --reach data/reach_data.json --kosha data/kosha_data.json
+    python modules/etl-pipeline/substance_index.py stats
+"""
+
+import argparse
+import csv
+import json
+import re
+import sqlite3
+import sys
+import time
+import unicodedata
+from pathlib import Path
+
+DEFAULT_INDEX_FILE = Path('data') / 'substance_index.sqlite'
+
+# Record keys (after lowercasing, ' '/'.' -> '_') that hold each identifier, in priority order
+CAS_KEYS = ('cas_no', 'cas_number', 'cas', 'cas_rn')
+EC_KEYS = ('ec_no', 'ec_number', 'ec', 'ec_list_no')
+NAME_KEYS = ('substance_name', 'name', '물질명', 'substance_name_korean', 'chemical_name', '영문명')
+
+CAS_RE = re.compile(r'(?<![\d-])(\d{2,7})-(\d{2})-(\d)(?![\d-])')
+EC_RE = re.compile(r'(?<![\d-])(\d{3})-(\d{3})-(\d)(?![\d-])')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS substances (
+    source    TEXT NOT NULL,
+    list      TEXT NOT NULL,
+    cas       TEXT,
+    ec        TEXT,
+    name      TEXT,
+    name_norm TEXT,
+    record    TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_substances_cas ON substances(cas);
+CREATE INDEX IF NOT EXISTS idx_substances_ec ON substances(ec);
+CREATE INDEX IF NOT EXISTS idx_substances_name ON substances(name_norm);
+CREATE INDEX IF NOT EXISTS idx_substances_list ON substances(source, list);
+CREATE TABLE IF NOT EXISTS lists (
+    source     TEXT NOT NULL,
+    list       TEXT NOT NULL,
+    records    INTEGER,
+    rows       INTEGER,
+    indexed_at TEXT,
+    PRIMARY KEY (source, list)
+);
+"""
+
+
+def normalize_cas(value) -> list:
+    """All CAS numbers in value, without leading zeros ('0000050-00-0' -> '50-00-0')."""
+    if value is None:
+        return []
+    return [f"{int(a)}-{b}-{c}" for a, b, c in CAS_RE.findall(str(value))]
+
+
+def normalize_ec(value):
+    """First EC number in value, or None."""
+    match = EC_RE.search(str(value)) if value is not None else None
+    return '-'.join(match.groups()) if match else None
+
+
+def normalize_name(value):
+    """Case/width-insensitive name key: NFKC, casefold, punctuation and spaces collapsed."""
+    if value is None:
+        return None
+    name = unicodedata.normalize('NFKC', str(value)).casefold()
+    name = re.sub(r'[\s,;:()\[\]{}\'"]+', ' ', name).strip()
+    return name or None
+
+
+def _field(record: dict, keys: tuple):
+    """First non-empty value among keys (record keys compared case-insensitively)."""
+    normalized = {str(k).lower().replace(' ', '_').replace('.', '_').strip('_'): v for k, v in record.items()}
+    for key in keys:
+        value = normalized.get(key.lower())
+        if value not in (None, ''):
+            return value
+    return None
+
+
+def record_rows(source: str, list_name: str, record: dict) -> list:
+    """Index rows for one source record: one per CAS number (or one with cas NULL)."""
+    name = _field(record, NAME_KEYS)
+    ec = normalize_ec(_field(record, EC_KEYS))
+    payload = json.dumps(record, ensure_ascii=False, default=str)
+    cas_numbers = normalize_cas(_field(record, CAS_KEYS)) or [None]
+    name_norm = normalize_name(name)
+    return [(source, list_name, cas, ec, name, name_norm, payload) for cas in dict.fromkeys(cas_numbers)]
+
+
+def _hit(row) -> dict:
+    source, list_name, cas, ec, name, record = row
+    return {'source': source, 'list': list_name, 'cas': cas, 'ec': ec, 'name': name, 'record': json.loads(record)}
+
+
+class SubstanceIndex:
+    """SQLite-backed substance index; usable as a context manager."""
+
+    def __init__(self, index_file=DEFAULT_INDEX_FILE):
+        self.index_file = Path(index_file)
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.index_file)
+        # WAL lets the dashboard / CLI read while an ETL run rewrites its slice
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def replace_list(self, source: str, list_name: str, records: list) -> int:
+        """Atomically replace every row of (source, list) with records; returns the row count."""
+        rows = [row for record in records if isinstance(record, dict)
+                for row in record_rows(source, list_name, record)]
+        with self.conn:
+            self.conn.execute('DELETE FROM substances WHERE source = ? AND list = ?', (source, list_name))
+            self.conn.executemany('INSERT INTO substances VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+            self.conn.execute(
+                'INSERT OR REPLACE INTO lists VALUES (?, ?, ?, ?, ?)',
+                (source, list_name, len(records), len(rows), time.strftime('%Y-%m-%dT%H:%M:%S')),
+            )
+        return len(rows)
+
+    def lookup(self, cas: str = None, ec: str = None, name: str = None) -> list:
+        """Records matching every given identifier (exact match after normalization)."""
+        clauses, params = [], []
+        if cas is not None:
+            cas_numbers = normalize_cas(cas)
+            if not cas_numbers:
+                return []
+            clauses.append('cas = ?')
+            params.append(cas_numbers[0])
+        if ec is not None:
+            ec = normalize_ec(ec)
+            if ec is None:
+                return []
+            clauses.append('ec = ?')
+            params.append(ec)
+        if name is not None:
+            clauses.append('name_norm = ?')
+            params.append(normalize_name(name))
+        if not clauses:
+            raise ValueError("lookup needs at least one of cas, ec, name")
+        query = ('SELECT source, list, cas, ec, name, record FROM substances WHERE '
+                 + ' AND '.join(clauses) + ' ORDER BY source, list')
+        return [_hit(row) for row in self.conn.execute(query, params)]
+
+    def check_cas(self, cas_numbers) -> dict:
+        """
+        Bulk screening: {input CAS: [hits]} for every input, in input order.
+
+        Inputs are normalized and passed as one JSON array that SQLite joins against the
+        CAS index (json_each), so 10k numbers cost one indexed join rather than 10k
+        queries or inserts. Inputs that are not valid CAS numbers map to an empty list.
+        """
+        cas_numbers = list(cas_numbers)
+        keys = {value: (normalize_cas(value) or [None])[0] for value in cas_numbers}
+        query_cas = json.dumps(sorted({cas for cas in keys.values() if cas}))
+        hits = {}
+        rows = self.conn.execute(
+            'SELECT s.source, s.list, s.cas, s.ec, s.name, s.record '
+            'FROM json_each(?) q JOIN substances s ON s.cas = q.value ORDER BY s.source, s.list',
+            (query_cas,),
+        )
+        for row in rows:
+            hits.setdefault(row[2], []).append(_hit(row))
+        return {value: hits.get(keys[value], []) for value in cas_numbers}
+
+    def stats(self) -> list:
+        """Per (source, list): record count, index rows and last indexing time."""
+        rows = self.conn.execute('SELECT source, list, records, rows, indexed_at FROM lists ORDER BY source, list')
+        return [dict(zip(('source', 'list', 'records', 'rows', 'indexed_at'), row)) for row in rows]
+
+
+def index_datasets(source: str, datasets: dict, index_file=DEFAULT_INDEX_FILE):
+    """Replace the index slices of one ETL run: datasets maps list name -> record list."""
+    with SubstanceIndex(index_file) as index:
+        for list_name, records in datasets.items():
+            if not isinstance(records, list):
+                print(f"Skipped substance index for {source}/{list_name}: data is not a record list")
+                continue
+            count = index.replace_list(source, list_name, records)
+            print(f"Indexed {source}/{list_name}: {len(records)} records, {count} identity rows")
+
+
+def _load_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def kosha_datasets(result: dict, list_name: str = None, default_name: str = 'kosha') -> dict:
+    """Record lists per KOSHA data_type; a combined ('all') run is split by each record's data_type.
+
+    list_name overrides the name of a single-source result; default_name is used when
+    the metadata has no data_type.
+    """
+    metadata = result.get('metadata', {})
+    records = result.get('data') or []
+    if metadata.get('data_type') != 'all':
+        return {list_name or metadata.get('data_type') or default_name: records}
+    datasets = {data_type: [] for data_type, info in metadata.get('sources', {}).items()
+                if info.get('status') == 'ok'}
+    for record in records:
+        if isinstance(record, dict):
+            datasets.setdefault(record.get('data_type') or default_name, []).append(record)
+    return datasets
+
+
+def build_from_files(index_file, reach_file=None, kosha_file=None, kosha_list=None, pdf_files=()):
+    """Rebuild index slices from ETL output files already on disk."""
+    if reach_file:
+        reach = _load_json(reach_file)
+        index_datasets('reach', {annex: result.get('data', []) for annex, result in reach.items()
+                                 if isinstance(result, dict) and 'data' in result}, index_file)
+    if kosha_file:
+        kosha = _load_json(kosha_file)
+        index_datasets('kosha', kosha_datasets(kosha, kosha_list, Path(kosha_file).stem), index_file)
+    for pdf_file in pdf_files:
+        result = _load_json(pdf_file)
+        documents = {}
+        for record in result.get('data', []):
+            # Merged batch output carries the document per record
+            documents.setdefault(record.get('source_document', Path(pdf_file).stem), []).append(record)
+        index_datasets('pdf', documents, index_file)
+
+
+def _read_cas_list(path) -> list:
+    """CAS numbers from a text file (one per line) or the first column of a CSV."""
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        rows = [row[0].strip() for row in csv.reader(f) if row and row[0].strip()]
+    if rows and not normalize_cas(rows[0]):
+        rows = rows[1:]  # header line
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cross-source substance index (REACH, KOSHA, PDF)')
+    parser.add_argument('--index-file', default=str(DEFAULT_INDEX_FILE), help='SQLite index file')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    lookup = commands.add_parser('lookup', help='Find records by CAS, EC and/or substance name')
+    lookup.add_argument('--cas')
+    lookup.add_argument('--ec')
+    lookup.add_argument('--name')
+
+    check = commands.add_parser('check', help='Screen a list of CAS numbers (text file or CSV first column)')
+    check.add_argument('cas_file')
+    check.add_argument('--output', help='Write one CSV row per (input, hit) instead of a summary')
+
+    build = commands.add_parser('build', help='(Re)index ETL output files already on disk')
+    build.add_argument('--reach', help='reach_data.json')
+    build.add_argument('--kosha', help='kosha_data.json')
+    build.add_argument('--kosha-list', help='List name for a single-source KOSHA file (default: metadata data_type)')
+    build.add_argument('--pdf', nargs='*', default=[], help='pdf_parser output JSON files')
+
+    commands.add_parser('stats', help='Show indexed lists')
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        build_from_files(args.index_file, args.reach, args.kosha, args.kosha_list, args.pdf)
+        return
+
+    if not Path(args.index_file).exists():
+        print(f"Index not found: {args.index_file} (run an ETL module or 'build' first)")
+        sys.exit(1)
+
+    with SubstanceIndex(args.index_file) as index:
+        if args.command == 'stats':
+            for entry in index.stats():
+                print(f"{entry['source']}/{entry['list']}: {entry['records']} records, "
+                      f"{entry['rows']} rows (indexed {entry['indexed_at']})")
+
+        elif args.command == 'lookup':
+            if not (args.cas or args.ec or args.name):
+                parser.error('lookup needs --cas, --ec or --name')
+            hits = index.lookup(cas=args.cas, ec=args.ec, name=args.name)
+            for hit in hits:
+                print(f"{hit['source']}/{hit['list']}: {hit['name']} (CAS {hit['cas']}, EC {hit['ec']})")
+            print(f"{len(hits)} matching records")
+
+        elif args.command == 'check':
+            cas_numbers = _read_cas_list(args.cas_file)
+            start = time.perf_counter()
+            results = index.check_cas(cas_numbers)
+            elapsed = time.perf_counter() - start
+            if args.output:
+                with open(args.output, 'w', encoding='utf-8-sig', newline='') as f:
+                    writer = csv.writer(f)
+                    writer.writerow(['input', 'cas', 'source', 'list', 'name', 'ec'])
+                    for value, hits in results.items():
+                        for hit in hits or [None]:
+                            writer.writerow([value] + ([hit['cas'], hit['source'], hit['list'], hit['name'], hit['ec']]
+                                                       if hit else ['', '', '', '', '']))
+                print(f"Saved screening results to {args.output}")
+            regulated = sum(1 for hits in results.values() if hits)
+            print(f"Checked {len(results)} CAS numbers in {elapsed * 1000:.1f} ms: {regulated} found in the index")
+
+
+if __name__ == "__main__":
+    main()
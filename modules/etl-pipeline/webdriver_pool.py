@@ -0,0 +1,238 @@
+"""
+Reusable headless WebDriver pool for the ETL modules.
+
+Browser startup (driver resolution + launching Chrome/Edge) is the largest fixed cost
+per source. The pool keeps launched browsers alive between leases, resets cookies and
+the download directory when a browser is handed out again, caches the driver binary
+path resolved by webdriver-manager and counts how many launches were avoided.
+"""
+
+import platform
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.edge.options import Options as EdgeOptions
+from selenium.webdriver.edge.service import Service as EdgeService
+
+# WebDriver manager for automatic driver installation
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.microsoft import EdgeChromiumDriverManager
+
+# Resolved driver binaries per browser, so ChromeDriverManager().install() runs once per process
+_DRIVER_PATHS = {}
+_DRIVER_PATHS_LOCK = threading.Lock()
+
+
+def _driver_path(browser_name: str) -> str:
+    with _DRIVER_PATHS_LOCK:
+        if browser_name not in _DRIVER_PATHS:
+            if browser_name == "Chrome":
+                _DRIVER_PATHS[browser_name] = ChromeDriverManager().install()
+            else:
+                _DRIVER_PATHS[browser_name] = EdgeChromiumDriverManager().install()
+        return _DRIVER_PATHS[browser_name]
+
+
+def set_download_dir(driver, download_dir: Path) -> str:
+    """Point browser downloads at download_dir (Chromium CDP) and return the absolute path."""
+    download_path = str(Path(download_dir).resolve())
+    driver.execute_cdp_cmd('Page.setDownloadBehavior', {
+        'behavior': 'allow',
+        'downloadPath': download_path
+    })
+    return download_path
+
+
+def clear_browser_state(driver):
+    """Delete cookies for every domain, plus the current origin's site storage.
+
+    delete_all_cookies() only reaches cookies visible to the open page, so cookies from
+    other (sub)domains visited during a lease would survive; Chromium CDP clears the
+    whole cookie jar. Falls back to delete_all_cookies() where CDP is not available.
+    """
+    try:
+        driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+    except Exception:
+        driver.delete_all_cookies()
+        return
+    origin = urlsplit(driver.current_url or '')
+    if origin.scheme in ('http', 'https'):
+        driver.execute_cdp_cmd('Storage.clearDataForOrigin', {
+            'origin': f"{origin.scheme}://{origin.netloc}",
+            'storageTypes': 'local_storage,session_storage,indexeddb,cache_storage,service_workers',
+        })
+
+
+def build_webdriver(download_dir: Path, extra_args=()):
+    """Create cross-platform WebDriver in headless mode with download directory configured."""
+    system = platform.system()
+
+    # Browser priority: Chrome first (cross-platform), then Edge on Windows
+    if system == "Windows":
+        browser_configs = [
+            (ChromeOptions, webdriver.Chrome, ChromeService, "Chrome"),
+            (EdgeOptions, webdriver.Edge, EdgeService, "Edge")
+        ]
+    else:
+        # Mac/Linux: Chrome primarily
+        browser_configs = [
+            (ChromeOptions, webdriver.Chrome, ChromeService, "Chrome")
+        ]
+
+    # Common options for all browsers
+    def setup_options(opts):
+        opts.add_argument('--headless=new')
+        opts.add_argument('--disable-gpu')
+        opts.add_argument('--no-sandbox')
+        opts.add_argument('--disable-dev-shm-usage')
+        opts.add_argument('--disable-web-security')
+        opts.add_argument('--allow-running-insecure-content')
+        for arg in extra_args:
+            opts.add_argument(arg)
+
+        # Ensure downloads go to the specified folder without prompts
+        prefs = {
+            'download.default_directory': str(Path(download_dir).resolve()),
+            'download.prompt_for_download': False,
+            'download.directory_upgrade': True,
+            'safebrowsing.enabled': True,
+        }
+        opts.add_experimental_option('prefs', prefs)
+        return opts
+
+    # Try each browser configuration
+    last_error = None
+    for opts_class, driver_class, service_class, browser_name in browser_configs:
+        try:
+            opts = setup_options(opts_class())
+            service = service_class(_driver_path(browser_name))
+            driver = driver_class(service=service, options=opts)
+
+            # Force download behavior via CDP (Chromium-based browsers)
+            set_download_dir(driver, download_dir)
+            print(f"Successfully initialized {browser_name} WebDriver")
+            return driver
+        except Exception as e:
+            last_error = e
+            print(f"{browser_name} WebDriver initialization failed: {e}")
+            continue
+
+    # All browsers failed
+    error_msg = f"All WebDriver initializations failed. Last error: {last_error}"
+    if system == "Windows":
+        error_msg += "\nMake sure Chrome or Edge WebDriver is installed. Try: pip install webdriver-manager"
+    else:
+        error_msg += "\nMake sure Chrome WebDriver is installed. Try: pip install webdriver-manager"
+    raise Exception(error_msg)
+
+
+class WebDriverPool:
+    """Pool of headless browsers that ETL steps borrow with lease()."""
+
+    def __init__(self, max_size: int = 1, extra_args=()):
+        self.max_size = max(1, max_size)
+        self.extra_args = tuple(extra_args)
+        self._idle = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self.launches = 0
+        self.leases = 0
+
+    @property
+    def launches_avoided(self) -> int:
+        return self.leases - self.launches
+
+    def stats(self) -> dict:
+        return {
+            'launches': self.launches,
+            'leases': self.leases,
+            'launches_avoided': self.launches_avoided,
+        }
+
+    def _acquire(self, download_dir: Path):
+        with self._lock:
+            driver = self._idle.pop() if self._idle else None
+        if driver is not None:
+            try:
+                set_download_dir(driver, download_dir)
+                with self._lock:
+                    self.leases += 1
+                return driver
+            except Exception as e:
+                print(f"Discarding unusable pooled WebDriver: {e}")
+                self._quit(driver)
+
+        # A failed launch raises here and is counted neither as a launch nor as a lease
+        driver = build_webdriver(download_dir, extra_args=self.extra_args)
+        with self._lock:
+            self.launches += 1
+            self.leases += 1
+        return driver
+
+    def _release(self, driver):
+        try:
+            # Leave nothing behind for the next lease: cookies, session state, open page
+            clear_browser_state(driver)
+            driver.get('about:blank')
+        except Exception as e:
+            print(f"Discarding WebDriver that failed to reset: {e}")
+            self._quit(driver)
+            return
+        with self._lock:
+            self._idle.append(driver)
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @contextmanager
+    def lease(self, download_dir: Path):
+        """Borrow a browser whose downloads go to download_dir; it is reset and returned on exit."""
+        self._slots.acquire()
+        try:
+            driver = self._acquire(Path(download_dir))
+            try:
+                yield driver
+            finally:
+                self._release(driver)
+        finally:
+            self._slots.release()
+
+    def close(self):
+        """Quit every idle browser and print how many launches the pool saved."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._quit(driver)
+        if self.leases:
+            print(f"WebDriver pool: {self.launches} launches for {self.leases} leases "
+                  f"({self.launches_avoided} launches avoided)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+@contextmanager
+def borrow_webdriver(download_dir: Path, pool: WebDriverPool = None, extra_args=()):
+    """Lease a browser from pool, or launch a one-off browser and quit it afterwards."""
+    if pool is not None:
+        with pool.lease(download_dir) as driver:
+            yield driver
+        return
+
+    driver = build_webdriver(download_dir, extra_args=extra_args)
+    try:
+        yield driver
+    finally:
+        driver.quit()
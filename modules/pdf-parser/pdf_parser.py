@@ -10,17 +10,33 @@ PDF 파서 모듈 - 법령정보시스템 PDF에서 화학물질 데이터 추
 
 실행 방법:
     python modules/pdf-parser/pdf_parser.py --url <pdf_url> --output <output_file>
+    python modules/pdf-parser/pdf_parser.py --manifest <manifest.json> --workers 4 [--batch-output per-document]
 """
 
 import requests
+import hashlib
 import json
 import os
 import re
+import sys
+import threading
+import time
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 from urllib.parse import urlparse
 
+from requests.adapters import HTTPAdapter
+
+import numpy as np
+import pandas as pd
+
+# KOSHA/MOEL ETL과 공유하는 컬럼 어휘 (modules/etl-pipeline/column_vocabulary.py)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'etl-pipeline'))
+from column_vocabulary import ALIAS_FILE, get_header_normalizer  # noqa: E402
+from substance_index import index_datasets  # noqa: E402
+
 # PDF 처리 라이브러리들 (필요시 설치)
 try:
     import pdfplumber
@@ -53,14 +69,249 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 추출 로직이 바뀌면 올려서 이전 추출 결과 캐시를 무효화
+PARSER_VERSION = "4"
+
+# 행 → 레코드 변환 규칙 (_process_table_data, _extract_chemical_info 공용)
+CAS_PATTERN = r'(\d{1,7}-\d{2}-\d{1,2})'
+EMPTY_VALUES = ['-', '', 'N/A']
+# 이 행 수 이상인 표만 컬럼 단위로 변환 - DataFrame 구성 비용(약 10ms) 때문에 손익분기점이
+# 5,000~10,000행이고, 페이지당 수십~수백 행인 실제 PDF 표는 행 단위가 더 빠름
+# (scripts/benchmarks/pdf_table_transform.py --sweep)
+VECTORIZE_MIN_ROWS = 10_000
+
+# 특별관리물질 표시 키워드
+SPECIAL_MANAGEMENT_KEYWORDS = [
+    '특별관리',
+    'special management',
+    '특별',
+    'special',
+    '○',  # 동그라미 표시
+    '●',  # 검은 동그라미
+    'yes',
+    'true',
+    '1'
+]
+SPECIAL_MANAGEMENT_PATTERN = '|'.join(re.escape(keyword) for keyword in SPECIAL_MANAGEMENT_KEYWORDS)
+
+def _extract_page_range(pdf_path: str, start: int, end: int) -> List[Tuple[int, int, List]]:
+    """
+    pdfplumber로 [start, end) 페이지의 표를 추출합니다.
+
+    프로세스 풀 워커에서도 호출되므로 모듈 수준 함수이며, 워커마다 자체 pdfplumber 핸들을 엽니다.
+
+    Returns:
+        (page_num, table_idx, table) 리스트 (페이지 순서)
+    """
+    raw_tables = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for page_num in range(start, end):
+            logger.info(f"Processing page {page_num + 1}")
+            page = pdf.pages[page_num]
+            for table_idx, table in enumerate(page.extract_tables()):
+                raw_tables.append((page_num, table_idx, table))
+            # 페이지 캐시 해제 (긴 문서에서 메모리 누적 방지)
+            page.flush_cache()
+    return raw_tables
+
+def _page_ranges(page_count: int, workers: int) -> List[Tuple[int, int]]:
+    """페이지를 워커 수의 약 4배 구간으로 나눕니다 (페이지별 처리 시간 편차 완화)."""
+    chunk = max(1, -(-page_count // (workers * 4)))
+    return [(start, min(start + chunk, page_count)) for start in range(0, page_count, chunk)]
+
+# method='auto'의 페이지별 엔진 선택 기준
+RULED_MIN_LINES = 2          # 가로/세로 괘선이 각각 이 개수 이상이면 괘선 표 페이지
+DENSE_TEXT_DENSITY = 20.0    # 100x100pt당 글자 수가 이 이상이면 괘선 없는 텍스트 표로 간주
+
+# pdfplumber 텍스트 정렬 기반 표 탐지 설정 (괘선 없는 표, tabula/camelot이 없을 때)
+TEXT_TABLE_SETTINGS = {'vertical_strategy': 'text', 'horizontal_strategy': 'text'}
+
+def _probe_page(page) -> Dict[str, Any]:
+    """
+    페이지 레이아웃 분석 없이 괘선 수와 글자 밀도만 빠르게 측정합니다.
+
+    Returns:
+        h_lines, v_lines, chars, text_density(100x100pt당 글자 수)
+    """
+    h_lines = v_lines = 0
+    for edge in page.edges:
+        if edge['orientation'] == 'h':
+            h_lines += 1
+        else:
+            v_lines += 1
+    chars = len(page.chars)
+    area = float(page.width * page.height) or 1.0
+    return {
+        'h_lines': h_lines,
+        'v_lines': v_lines,
+        'chars': chars,
+        'text_density': round(chars * 10000 / area, 2),
+    }
+
+def _choose_page_engine(probe: Dict[str, Any]) -> str:
+    """
+    프로브 결과로 페이지를 처리할 가장 빠른 엔진을 고릅니다.
+
+    - 텍스트 레이어 없음 (스캔 이미지): 'skip'
+    - 괘선 표: 'pdfplumber' (표를 못 찾으면 camelot lattice로 재시도)
+    - 괘선 없이 글자가 빽빽한 페이지: 'tabula' → 'camelot_stream' → 'pdfplumber_text' 중 설치된 것
+    - 그 외 (본문 위주): 'pdfplumber'
+    """
+    if probe['chars'] == 0:
+        return 'skip'
+    if probe['h_lines'] >= RULED_MIN_LINES and probe['v_lines'] >= RULED_MIN_LINES:
+        return 'pdfplumber'
+    if probe['text_density'] >= DENSE_TEXT_DENSITY:
+        if HAS_TABULA:
+            return 'tabula'
+        if HAS_CAMELOT:
+            return 'camelot_stream'
+        return 'pdfplumber_text'
+    return 'pdfplumber'
+
+def _frame_to_table(df: pd.DataFrame, header_in_columns: bool) -> List[List]:
+    """tabula/camelot DataFrame을 pdfplumber와 같은 행 리스트(첫 행이 헤더)로 변환합니다."""
+    rows = df.values.tolist()
+    return [df.columns.tolist()] + rows if header_in_columns else rows
+
+def _extract_page_tables(engine: str, page) -> List[List]:
+    """pdfplumber 계열 엔진으로 한 페이지의 표를 행 리스트로 추출합니다."""
+    if engine == 'skip':
+        return []
+    if engine == 'pdfplumber':
+        return page.extract_tables()
+    if engine == 'pdfplumber_text':
+        return page.extract_tables(TEXT_TABLE_SETTINGS)
+    raise ValueError(f"Unsupported page engine: {engine}")
+
+def _extract_batch_tables(engine: str, pdf_path: str, page_nums: List[int]) -> Dict[int, List[List]]:
+    """
+    tabula/camelot을 페이지 묶음당 한 번 호출해 표를 페이지 번호(0부터)별로 돌려줍니다.
+
+    tabula는 호출마다 JVM을 띄우고 camelot은 호출마다 PDF를 다시 읽으므로, 같은 엔진으로
+    보낼 페이지를 모아 한 번에 처리합니다.
+    """
+    tables = {page_num: [] for page_num in page_nums}
+    if engine == 'tabula':
+        # DataFrame 출력에는 페이지 번호가 없어 JSON 출력(표마다 page_number 포함)을 사용
+        raw = tabula.read_pdf(pdf_path, pages=[page_num + 1 for page_num in page_nums],
+                              multiple_tables=True, stream=True, output_format='json')
+        for table in raw:
+            rows = [[cell.get('text', '') for cell in row] for row in table.get('data', [])]
+            if rows:
+                tables[int(table['page_number']) - 1].append(rows)
+        return tables
+    if engine in ('camelot_lattice', 'camelot_stream'):
+        flavor = engine.split('_', 1)[1]
+        pages = ','.join(str(page_num + 1) for page_num in page_nums)
+        for table in camelot.read_pdf(pdf_path, pages=pages, flavor=flavor):
+            if not table.df.empty:
+                tables[int(table.page) - 1].append(_frame_to_table(table.df, False))
+        return tables
+    raise ValueError(f"Unsupported batch engine: {engine}")
+
+def _route_page_range(pdf_path: str, start: int, end: int) -> Tuple[List[Tuple[int, int, List]], List[Dict[str, Any]]]:
+    """
+    [start, end) 페이지를 프로브해 엔진을 고르고 표를 추출합니다 (method='auto').
+
+    pdfplumber 페이지는 프로브하면서 바로 추출하고, tabula/camelot으로 보낼 페이지는 모아 두었다가
+    엔진마다 한 번씩 호출합니다 (_extract_batch_tables). 묶음 호출이 실패하면 해당 페이지는
+    pdfplumber로 처리합니다. _extract_page_range처럼 프로세스 풀 워커에서도 호출됩니다.
+
+    Returns:
+        ((page_num, table_idx, table) 리스트, 페이지별 엔진/소요 시간 리포트)
+    """
+    page_tables = {}
+    reports = {}
+    batches = {}
+    with pdfplumber.open(pdf_path) as pdf:
+        for page_num in range(start, end):
+            page = pdf.pages[page_num]
+            started = time.perf_counter()
+            probe = _probe_page(page)
+            engine = _choose_page_engine(probe)
+            tables = []
+            if engine in ('tabula', 'camelot_stream'):
+                batches.setdefault(engine, []).append(page_num)
+            else:
+                tables = _extract_page_tables(engine, page)
+                # 괘선은 있는데 pdfplumber가 표를 못 찾은 경우 (병합 셀 등) camelot lattice로 재시도
+                if not tables and engine == 'pdfplumber' and HAS_CAMELOT and \
+                        probe['h_lines'] >= RULED_MIN_LINES and probe['v_lines'] >= RULED_MIN_LINES:
+                    batches.setdefault('camelot_lattice', []).append(page_num)
+            page.flush_cache()
+            page_tables[page_num] = tables
+            reports[page_num] = {
+                'page': page_num + 1,
+                'engine': engine,
+                'tables': len(tables),
+                'seconds': round(time.perf_counter() - started, 4),
+                **probe,
+            }
+
+        for engine, page_nums in batches.items():
+            started = time.perf_counter()
+            try:
+                found = _extract_batch_tables(engine, pdf_path, page_nums)
+            except Exception as e:
+                if engine == 'camelot_lattice':
+                    logger.warning(f"Pages {page_nums[0] + 1}-{page_nums[-1] + 1}: camelot lattice failed ({e})")
+                    found = {}
+                else:
+                    logger.warning(f"Pages {page_nums[0] + 1}-{page_nums[-1] + 1}: {engine} failed ({e}), "
+                                   f"falling back to pdfplumber")
+                    engine = 'pdfplumber'
+                    found = {page_num: _extract_page_tables(engine, pdf.pages[page_num]) for page_num in page_nums}
+            # 묶음 호출 시간은 페이지 수로 나눠 각 페이지 리포트에 더함
+            share = (time.perf_counter() - started) / len(page_nums)
+            for page_num in page_nums:
+                tables = found.get(page_num, [])
+                report = reports[page_num]
+                if tables or report['engine'] != 'pdfplumber':
+                    page_tables[page_num] = tables
+                    report['engine'] = engine
+                    report['tables'] = len(tables)
+                report['seconds'] = round(report['seconds'] + share, 4)
+
+    raw_tables = []
+    for page_num in range(start, end):
+        tables = page_tables[page_num]
+        for table_idx, table in enumerate(tables):
+            raw_tables.append((page_num, table_idx, table))
+        logger.info(f"Page {page_num + 1}: {reports[page_num]['engine']} ({len(tables)} tables)")
+    return raw_tables, [reports[page_num] for page_num in range(start, end)]
+
 class PDFChemicalParser:
     """
     PDF에서 화학물질 정보를 추출하는 클래스
     """
 
-    def __init__(self, download_dir: str = "data/pdfs"):
+    def __init__(self, download_dir: str = "data/pdfs", cache_ttl: int = 24 * 3600,
+                 max_cache_bytes: int = 1024 ** 3, refresh: bool = False,
+                 alias_file: Optional[str] = None):
+        """
+        Args:
+            download_dir: PDF 저장 및 캐시 디렉토리
+            cache_ttl: 이 시간(초) 안에 확인한 URL은 서버에 재확인하지 않고 캐시 사용
+            max_cache_bytes: 캐시된 PDF 총 크기 상한 (초과 시 오래 사용하지 않은 파일부터 삭제)
+            refresh: True면 캐시를 무시하고 다시 다운로드/추출
+            alias_file: 헤더 별칭 테이블 JSON (기본값: config/column_aliases.json)
+        """
         self.download_dir = Path(download_dir)
         self.download_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_ttl = cache_ttl
+        self.max_cache_bytes = max_cache_bytes
+        self.refresh = refresh
+        self.alias_file = alias_file
+        self.session = requests.Session()
+        self.header_normalizer = get_header_normalizer(Path(alias_file) if alias_file else ALIAS_FILE)
+
+        # 캐시: URL → (ETag, Last-Modified, SHA-256) 인덱스와 (해시, 추출 방법, 파서 버전, 별칭 테이블)별 추출 결과
+        self.cache_index_file = self.download_dir / 'cache_index.json'
+        self.extracted_dir = self.download_dir / 'extracted'
+        self.extracted_dir.mkdir(parents=True, exist_ok=True)
+        # 배치 모드에서 여러 스레드가 동시에 다운로드하므로 인덱스 갱신은 잠금 안에서 수행
+        self._index_lock = threading.RLock()
 
         # PDF 라이브러리 사용 가능 여부 확인
         self.available_libraries = {
@@ -72,16 +323,43 @@ class PDFChemicalParser:
 
         logger.info(f"Available PDF libraries: {self.available_libraries}")
 
-    def download_pdf(self, url: str, filename: Optional[str] = None) -> Path:
+    def _load_cache_index(self) -> Dict[str, Any]:
+        if not self.cache_index_file.exists():
+            return {}
+        try:
+            with open(self.cache_index_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable PDF cache index: {e}")
+            return {}
+
+    def _save_cache_index(self, index: Dict[str, Any]):
+        tmp_path = self.cache_index_file.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.cache_index_file)
+
+    def _update_cache_index(self, url: str, entry: Dict[str, Any]):
+        with self._index_lock:
+            index = self._load_cache_index()
+            index[url] = entry
+            self._save_cache_index(index)
+
+    def _fetch_pdf(self, url: str, filename: Optional[str] = None, evict: bool = True) -> Tuple[Path, str]:
         """
-        PDF 파일을 다운로드합니다.
+        캐시를 고려하여 PDF를 가져옵니다.
+
+        최근(cache_ttl 이내)에 확인한 URL은 바로 캐시 파일을 쓰고, 그 외에는 ETag/Last-Modified로
+        조건부 요청을 보내 304이면 캐시 파일을 재사용합니다. 새로 받은 파일은 SHA-256 기반 이름
+        (`<해시 앞 12자리>_<파일명>`)으로 저장됩니다.
 
         Args:
-            url: PDF 파일 URL
-            filename: 저장할 파일명 (없으면 URL에서 추출)
+            url: PDF URL
+            filename: 저장 파일명 (기본값: URL 경로의 파일명)
+            evict: 다운로드 후 캐시 용량 정리 여부 (배치 모드는 파싱이 끝난 뒤 한 번만 정리)
 
         Returns:
-            다운로드된 파일 경로
+            (파일 경로, SHA-256)
         """
         if not filename:
             parsed_url = urlparse(url)
@@ -89,53 +367,271 @@ class PDFChemicalParser:
             if not filename.endswith('.pdf'):
                 filename += '.pdf'
 
-        filepath = self.download_dir / filename
+        index = self._load_cache_index()
+        entry = index.get(url, {})
+        cached_path = Path(entry['path']) if entry.get('path') else None
+        has_cached_file = cached_path is not None and cached_path.exists()
+        now = time.time()
+
+        if has_cached_file and not self.refresh:
+            if now - entry.get('checked_at', 0) < self.cache_ttl:
+                logger.info(f"Using cached PDF (checked within {self.cache_ttl}s): {cached_path}")
+                os.utime(cached_path)
+                return cached_path, entry['sha256']
+
+        headers = {}
+        if has_cached_file and not self.refresh:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
 
         logger.info(f"Downloading PDF from: {url}")
-        logger.info(f"Saving to: {filepath}")
 
+        tmp_path = None
         try:
-            response = requests.get(url, timeout=30, stream=True)
+            response = self.session.get(url, headers=headers, timeout=30, stream=True)
+            if response.status_code == 304 and has_cached_file:
+                logger.info(f"PDF not modified (304), using cache: {cached_path}")
+                entry['checked_at'] = now
+                self._update_cache_index(url, entry)
+                os.utime(cached_path)
+                return cached_path, entry['sha256']
             response.raise_for_status()
 
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+            digest = hashlib.sha256()
+            tmp_path = self.download_dir / f".{filename}.{os.getpid()}-{threading.get_ident()}.part"
+            with open(tmp_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    digest.update(chunk)
                     f.write(chunk)
+            sha256 = digest.hexdigest()
 
+            filepath = self.download_dir / f"{sha256[:12]}_{filename}"
+            os.replace(tmp_path, filepath)
             logger.info(f"PDF download completed: {filepath}")
-            return filepath
 
         except Exception as e:
             logger.error(f"PDF download failed: {e}")
+            # 중간에 끊긴 다운로드(연결 끊김, 디스크 부족 등)의 임시 파일 정리
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
             raise
 
-    def extract_tables_pdfplumber(self, pdf_path: Path) -> List[Dict[str, Any]]:
+        self._update_cache_index(url, {
+            'path': str(filepath),
+            'sha256': sha256,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'checked_at': now,
+        })
+        if evict:
+            self.evict_pdf_cache(keep=[filepath])
+        return filepath, sha256
+
+    def _resolve_pdf(self, source: str, evict: bool = True) -> Tuple[Path, str]:
+        """
+        URL이면 캐시를 거쳐 다운로드하고, 로컬 경로(또는 file:// URL)면 그대로 사용합니다.
+
+        Returns:
+            (파일 경로, SHA-256)
+        """
+        parsed = urlparse(source)
+        if parsed.scheme in ('http', 'https'):
+            return self._fetch_pdf(source, evict=evict)
+
+        path = Path(parsed.path if parsed.scheme == 'file' else source)
+        if not path.exists():
+            raise FileNotFoundError(f"PDF not found: {source}")
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return path, digest.hexdigest()
+
+    def download_pdf(self, url: str, filename: Optional[str] = None) -> Path:
+        """
+        PDF 파일을 다운로드합니다 (캐시된 파일이 유효하면 재사용).
+
+        Args:
+            url: PDF 파일 URL
+            filename: 저장할 파일명 (없으면 URL에서 추출)
+
+        Returns:
+            다운로드된 파일 경로
+        """
+        return self._fetch_pdf(url, filename)[0]
+
+    def evict_pdf_cache(self, keep: Iterable[Path] = ()):
+        """
+        캐시된 PDF 총 크기가 max_cache_bytes를 넘으면 오래 사용하지 않은 파일부터 삭제합니다.
+
+        Args:
+            keep: 용량을 넘더라도 지우지 않을 PDF 경로 (방금 받은 파일, 배치에서 쓴 파일)
+        """
+        keep = {Path(p).resolve() for p in keep}
+        pdfs = [p for p in self.download_dir.glob('*.pdf') if p.resolve() not in keep]
+        total = sum(p.stat().st_size for p in self.download_dir.glob('*.pdf'))
+        if total <= self.max_cache_bytes:
+            return
+
+        evicted = set()
+        for pdf in sorted(pdfs, key=lambda p: p.stat().st_mtime):
+            if total <= self.max_cache_bytes:
+                break
+            total -= pdf.stat().st_size
+            pdf.unlink()
+            evicted.add(str(pdf))
+            logger.info(f"Evicted cached PDF: {pdf}")
+
+        with self._index_lock:
+            index = self._load_cache_index()
+            evicted_hashes = {e['sha256'] for e in index.values() if e.get('path') in evicted}
+            index = {u: e for u, e in index.items() if e.get('path') not in evicted}
+            # 남은 PDF가 참조하지 않는 추출 결과도 함께 정리
+            for sha256 in evicted_hashes - {e['sha256'] for e in index.values()}:
+                for result_file in self.extracted_dir.glob(f"{sha256}-*.json"):
+                    result_file.unlink()
+            self._save_cache_index(index)
+
+    def _extraction_cache_path(self, sha256: str, method: str) -> Path:
+        # 별칭 테이블이 바뀌면 컬럼명도 바뀌므로 테이블 지문도 키에 포함
+        if method == 'auto':
+            # auto는 설치된 엔진에 따라 결과가 달라지므로 엔진 조합도 키에 포함
+            engines = [name for name, available in (('pdfplumber', HAS_PDFPLUMBER), ('tabula', HAS_TABULA),
+                                                    ('camelot', HAS_CAMELOT)) if available]
+            method = f"auto_{'+'.join(engines) or 'none'}"
+        return self.extracted_dir / (
+            f"{sha256}-{method}-v{PARSER_VERSION}-{self.header_normalizer.fingerprint}.json"
+        )
+
+    def _load_cached_extraction(self, sha256: str, method: str) -> Optional[Dict[str, Any]]:
+        cache_path = self._extraction_cache_path(sha256, method)
+        if self.refresh or not cache_path.exists():
+            return None
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _store_cached_extraction(self, sha256: str, method: str, chemicals: List[Dict[str, Any]],
+                                 page_report: Optional[List[Dict[str, Any]]] = None):
+        cache_path = self._extraction_cache_path(sha256, method)
+        # 배치 모드에서는 같은 내용의 PDF를 여러 워커가 동시에 저장할 수 있어 임시 파일명을 구분
+        tmp_path = cache_path.with_suffix(f'.{os.getpid()}-{threading.get_ident()}.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'data': chemicals, 'page_report': page_report}, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+
+    def extract_tables_pdfplumber(self, pdf_path: Path, workers: int = 1) -> List[Dict[str, Any]]:
         """
         pdfplumber를 사용하여 PDF에서 표를 추출합니다.
+
+        Args:
+            pdf_path: PDF 파일 경로
+            workers: 1보다 크면 페이지 구간별로 프로세스 풀에서 병렬 추출
         """
         if not HAS_PDFPLUMBER:
             raise ImportError("pdfplumber is not installed")
 
-        tables_data = []
+        with pdfplumber.open(pdf_path) as pdf:
+            page_count = len(pdf.pages)
+
+        if workers > 1 and page_count > 1:
+            ranges = _page_ranges(page_count, workers)
+            logger.info(f"Extracting {page_count} pages in {len(ranges)} ranges with {workers} workers")
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # map은 제출 순서대로 결과를 돌려주므로 페이지 순서가 유지됨
+                chunks = executor.map(
+                    _extract_page_range,
+                    [str(pdf_path)] * len(ranges),
+                    [start for start, _ in ranges],
+                    [end for _, end in ranges],
+                )
+                raw_tables = [table for chunk in chunks for table in chunk]
+        else:
+            raw_tables = _extract_page_range(str(pdf_path), 0, page_count)
+
+        return self._raw_tables_to_chemicals(raw_tables)
+
+    def extract_tables_auto(self, pdf_path: Path, workers: int = 1) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        페이지마다 괘선 수와 글자 밀도를 프로브해 pdfplumber / tabula / camelot lattice·stream 중
+        처리 가능한 가장 빠른 엔진으로 표를 추출합니다.
+
+        Args:
+            pdf_path: PDF 파일 경로
+            workers: 1보다 크면 페이지 구간별로 프로세스 풀에서 병렬 처리
+
+        Returns:
+            (화학물질 레코드, 페이지별 엔진/소요 시간 리포트)
+        """
+        if not HAS_PDFPLUMBER:
+            raise ImportError("pdfplumber is not installed")
 
         with pdfplumber.open(pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages):
-                logger.info(f"Processing page {page_num + 1}")
+            page_count = len(pdf.pages)
+
+        if workers > 1 and page_count > 1:
+            ranges = _page_ranges(page_count, workers)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                chunks = list(executor.map(
+                    _route_page_range,
+                    [str(pdf_path)] * len(ranges),
+                    [start for start, _ in ranges],
+                    [end for _, end in ranges],
+                ))
+            raw_tables = [table for tables, _ in chunks for table in tables]
+            page_report = [report for _, reports in chunks for report in reports]
+        else:
+            raw_tables, page_report = _route_page_range(str(pdf_path), 0, page_count)
+
+        return self._raw_tables_to_chemicals(raw_tables), page_report
+
+    def extract_tables_camelot(self, pdf_path: Path, flavor: str = 'lattice') -> List[Dict[str, Any]]:
+        """
+        camelot을 사용하여 PDF에서 표를 추출합니다.
+
+        Args:
+            pdf_path: PDF 파일 경로
+            flavor: 'lattice' (괘선 표) 또는 'stream' (공백 정렬 표).
+                    lattice로 표를 하나도 찾지 못하면 stream으로 한 번 더 시도합니다.
+        """
+        if not HAS_CAMELOT:
+            raise ImportError("camelot-py is not installed")
+
+        tables = camelot.read_pdf(str(pdf_path), pages='all', flavor=flavor)
+        if tables.n == 0 and flavor == 'lattice':
+            logger.info("Camelot lattice found no tables, retrying with stream")
+            tables = camelot.read_pdf(str(pdf_path), pages='all', flavor='stream')
+
+        raw_tables = []
+        table_counts = {}
+        for table in tables:
+            if table.df.empty:
+                continue
+            page_num = int(table.page) - 1
+            table_idx = table_counts.get(page_num, 0)
+            table_counts[page_num] = table_idx + 1
+            raw_tables.append((page_num, table_idx, _frame_to_table(table.df, False)))
 
-                # 표 추출
-                tables = page.extract_tables()
+        return self._raw_tables_to_chemicals(raw_tables)
 
-                for table_idx, table in enumerate(tables):
-                    if not table:
-                        continue
+    def _raw_tables_to_chemicals(self, raw_tables: List[Tuple[int, int, List]]) -> List[Dict[str, Any]]:
+        """(page_num, table_idx, table) 목록을 화학물질 레코드로 변환합니다 (첫 행이 헤더)."""
+        tables_data = []
+        for page_num, table_idx, table in raw_tables:
+            if not table:
+                continue
 
-                    # 표 데이터를 구조화
-                    headers = table[0] if len(table) > 0 else []
-                    rows = table[1:] if len(table) > 1 else []
+            # 표 데이터를 구조화
+            headers = table[0] if len(table) > 0 else []
+            rows = table[1:] if len(table) > 1 else []
 
-                    # 화학물질 데이터로 변환
-                    chemicals = self._process_table_data(headers, rows, page_num, table_idx)
-                    tables_data.extend(chemicals)
+            # 화학물질 데이터로 변환
+            chemicals = self._process_table_data(headers, rows, page_num, table_idx)
+            tables_data.extend(chemicals)
 
         return tables_data
 
@@ -172,71 +668,109 @@ class PDFChemicalParser:
                            page_num: int, table_num: int) -> List[Dict[str, Any]]:
         """
         추출된 표 데이터를 화학물질 정보로 변환합니다.
+
+        VECTORIZE_MIN_ROWS행 이상인 큰 표만 컬럼 단위로, 나머지는 행 단위로 처리합니다.
+        두 방식의 결과는 같으며, tabula 표의 NaN 셀은 'nan' 문자열 대신 빈 셀로 처리됩니다.
         """
-        chemicals = []
+        if len(rows) >= VECTORIZE_MIN_ROWS:
+            return self._process_table_columns(headers, rows, page_num, table_num)
+        return self._process_table_rows(headers, rows, page_num, table_num)
 
-        # 헤더 정리 (한글로 변환)
+    def _process_table_rows(self, headers: List[str], rows: List[List],
+                            page_num: int, table_num: int) -> List[Dict[str, Any]]:
+        """행마다 _extract_chemical_info를 호출하는 변환 (작은 표용)."""
+        chemicals = []
         clean_headers = [self._clean_header(header) for header in headers]
-
         for row_idx, row in enumerate(rows):
-            if not row or all(not cell or str(cell).strip() == '' for cell in row):
+            cells = [None if isinstance(cell, float) and cell != cell else cell for cell in row or []]
+            if all(not cell or str(cell).strip() == '' for cell in cells):
                 continue
-
             chemical_data = {
                 'source_page': page_num + 1,
                 'source_table': table_num + 1,
                 'source_row': row_idx + 1,
                 'raw_data': dict(zip(clean_headers, row))
             }
+            chemical_data.update(self._extract_chemical_info(cells, clean_headers))
+            chemicals.append(chemical_data)
+        return chemicals
+
+    def _process_table_columns(self, headers: List[str], rows: List[List],
+                               page_num: int, table_num: int) -> List[Dict[str, Any]]:
+        """
+        표 전체를 DataFrame으로 한 번 변환한 뒤 공백 정리, 빈 값('', '-', 'N/A') 마스킹,
+        CAS 번호 추출, 특별관리물질 판별을 컬럼 단위 문자열 연산으로 처리합니다 (큰 표용).
+        """
+        if not rows:
+            return []
+
+        # 헤더 정리 (한글로 변환)
+        clean_headers = [self._clean_header(header) for header in headers]
+
+        # 길이가 짧은 행은 None으로 채워지며, None/NaN은 빈 셀로 취급
+        frame = pd.DataFrame([row if row else [] for row in rows], dtype=object)
+        present = frame.to_numpy().astype(bool)
+        text = frame.astype('string').apply(lambda column: column.str.strip())
+        filled = present & text.notna().to_numpy() & text.ne('').fillna(False).to_numpy(dtype=bool)
+
+        # 모든 셀이 비어 있는 행은 건너뜀
+        kept_rows = np.flatnonzero(filled.any(axis=1))
+        if not len(kept_rows):
+            return []
+        text = text.iloc[kept_rows]
+        valid = filled[kept_rows] & ~text.isin(EMPTY_VALUES).to_numpy(dtype=bool)
+
+        # 헤더 순서대로 (출력 키, 컬럼 번호, 값 목록)
+        fields = []
+        for i, header in enumerate(clean_headers[:text.shape[1]]):
+            values = text.iloc[:, i]
+            if header == '물질명':
+                keys = ['substance_name', 'substance_name_korean']
+            elif header == 'CAS_No':
+                keys = ['cas_number']
+                values = values.str.extract(CAS_PATTERN, expand=False).fillna(values)
+            elif header == '관리등급':
+                keys = ['management_grade']
+            elif header == '특별관리물질':
+                keys = ['is_special_management']
+                values = values.str.lower().str.contains(SPECIAL_MANAGEMENT_PATTERN, regex=True)
+                values = values.fillna(False).astype(bool)
+            else:
+                keys = [header.lower().replace(' ', '_')]
 
-            # 구조화된 데이터 추출
-            structured_data = self._extract_chemical_info(row, clean_headers)
-            chemical_data.update(structured_data)
+            if values.dtype == bool:
+                value_array = values.to_numpy(dtype=bool)
+            else:
+                value_array = values.to_numpy(dtype=object, na_value=None)
+            for key in keys:
+                fields.append((key, i, value_array))
 
+        # 값 배열은 컬럼 단위로 이미 계산되어 있으므로 행마다 유효한 필드만 골라 담음
+        # (중복 키는 첫 위치에 마지막 값이 들어가 행 단위 처리와 동일)
+        chemicals = []
+        for position, row_idx in enumerate(kept_rows.tolist()):
+            chemical_data = {
+                'source_page': page_num + 1,
+                'source_table': table_num + 1,
+                'source_row': row_idx + 1,
+                'raw_data': dict(zip(clean_headers, rows[row_idx]))
+            }
+            row_valid = valid[position]
+            for key, i, values in fields:
+                if row_valid[i]:
+                    chemical_data[key] = values[position]
             chemicals.append(chemical_data)
 
         return chemicals
 
     def _clean_header(self, header: str) -> str:
-        """헤더 텍스트를 정리합니다."""
-        if not header:
-            return ""
-
-        # 문자열로 변환 및 정리
-        header = str(header).strip()
-
-        # 한글 헤더 매핑
-        header_mapping = {
-            '물질명': '물질명',
-            '유해물질': '물질명',
-            '화학물질명': '물질명',
-            '명칭': '물질명',
-            '이름': '물질명',
-
-            'cas': 'CAS_No',
-            'cas no': 'CAS_No',
-            'cas_no': 'CAS_No',
-            'cas번호': 'CAS_No',
-
-            '관리등급': '관리등급',
-            '등급': '관리등급',
-            '위험등급': '관리등급',
-
-            '특별관리': '특별관리물질',
-            '특별관리물질': '특별관리물질',
-            '관리대상': '관리대상',
-
-            '비고': '비고',
-            'remarks': '비고'
-        }
-
-        # 대소문자 통일 및 매핑
-        header_lower = header.lower()
-        for key, value in header_mapping.items():
-            if key.lower() in header_lower:
-                return value
+        """
+        헤더 텍스트를 공통 컬럼명으로 정리합니다.
 
-        return header
+        별칭 테이블 순서상 먼저 나오는 별칭이 포함된 헤더는 해당 표준 컬럼명으로 바뀝니다.
+        컴파일된 정규식 한 번으로 검사하고, 같은 헤더 문자열의 결과는 메모이즈됩니다.
+        """
+        return self.header_normalizer.normalize(header)
 
     def _extract_chemical_info(self, row: List, headers: List[str]) -> Dict[str, Any]:
         """
@@ -250,7 +784,7 @@ class PDFChemicalParser:
                 continue
 
             value = row[i]
-            if not value or str(value).strip() in ['-', '', 'N/A']:
+            if not value or str(value).strip() in EMPTY_VALUES:
                 continue
 
             value_str = str(value).strip()
@@ -262,7 +796,7 @@ class PDFChemicalParser:
 
             # CAS 번호 추출
             elif header == 'CAS_No':
-                cas_match = re.search(r'\d{1,7}-\d{2}-\d{1,2}', value_str)
+                cas_match = re.search(CAS_PATTERN, value_str)
                 if cas_match:
                     info['cas_number'] = cas_match.group()
                 else:
@@ -291,43 +825,29 @@ class PDFChemicalParser:
 
         value_lower = str(value).lower()
 
-        # 특별관리물질 표시 키워드
-        special_keywords = [
-            '특별관리',
-            'special management',
-            '특별',
-            'special',
-            '○',  # 동그라미 표시
-            '●',  # 검은 동그라미
-            'yes',
-            'true',
-            '1'
-        ]
+        return any(keyword in value_lower for keyword in SPECIAL_MANAGEMENT_KEYWORDS)
 
-        return any(keyword in value_lower for keyword in special_keywords)
-
-    def parse_pdf(self, pdf_url: str, method: str = 'auto') -> Dict[str, Any]:
+    def parse_pdf(self, pdf_url: str, method: str = 'auto', workers: int = 1) -> Dict[str, Any]:
         """
         PDF를 파싱하여 화학물질 데이터를 추출합니다.
 
         Args:
-            pdf_url: PDF 파일 URL
-            method: 추출 방법 ('auto', 'pdfplumber', 'tabula', 'camelot')
+            pdf_url: PDF 파일 URL 또는 로컬 경로
+            method: 추출 방법 ('auto': 페이지별 엔진 자동 선택, 'pdfplumber', 'tabula', 'camelot')
+            workers: pdfplumber 페이지 병렬 추출 프로세스 수
 
         Returns:
             추출된 데이터와 메타정보
         """
         logger.info(f"Starting PDF parsing: {pdf_url}")
 
-        # PDF 다운로드
-        pdf_path = self.download_pdf(pdf_url)
+        # PDF 다운로드 (캐시 확인 포함) 또는 로컬 파일 사용
+        pdf_path, pdf_sha256 = self._resolve_pdf(pdf_url)
 
-        # 추출 방법 선택
-        if method == 'auto':
-            # 사용 가능한 라이브러리 우선순위대로 시도
+        # 추출 방법 선택: auto는 페이지별 엔진 선택 (pdfplumber로 프로브),
+        # pdfplumber가 없으면 설치된 라이브러리 하나로 문서 전체 처리
+        if method == 'auto' and not HAS_PDFPLUMBER:
             methods = []
-            if HAS_PDFPLUMBER:
-                methods.append('pdfplumber')
             if HAS_TABULA:
                 methods.append('tabula')
             if HAS_CAMELOT:
@@ -340,29 +860,52 @@ class PDFChemicalParser:
 
         logger.info(f"Using extraction method: {method}")
 
-        # 데이터 추출
+        # 데이터 추출 (같은 내용/방법/파서 버전의 결과가 캐시에 있으면 재사용)
         try:
-            if method == 'pdfplumber':
-                chemicals = self.extract_tables_pdfplumber(pdf_path)
+            started = time.perf_counter()
+            page_report = None
+            cached = self._load_cached_extraction(pdf_sha256, method)
+            cache_hit = cached is not None
+            if cache_hit:
+                logger.info(f"Using cached extraction result for {pdf_sha256[:12]} ({method})")
+                chemicals, page_report = cached['data'], cached.get('page_report')
+            elif method == 'auto':
+                chemicals, page_report = self.extract_tables_auto(pdf_path, workers=workers)
+            elif method == 'pdfplumber':
+                chemicals = self.extract_tables_pdfplumber(pdf_path, workers=workers)
             elif method == 'tabula':
                 chemicals = self.extract_tables_tabula(pdf_path)
             elif method == 'camelot':
-                # camelot 구현 (향후 추가)
-                raise NotImplementedError("Camelot method not yet implemented")
+                chemicals = self.extract_tables_camelot(pdf_path)
             else:
                 raise ValueError(f"Unsupported method: {method}")
 
+            if not cache_hit:
+                self._store_cached_extraction(pdf_sha256, method, chemicals, page_report)
+
             # 메타데이터 추가
             result = {
                 'metadata': {
                     'source_url': pdf_url,
                     'local_file': str(pdf_path),
+                    'sha256': pdf_sha256,
                     'extraction_method': method,
+                    'parser_version': PARSER_VERSION,
+                    'cache_hit': cache_hit,
+                    'workers': workers,
+                    'extraction_seconds': round(time.perf_counter() - started, 3),
                     'total_chemicals': len(chemicals),
                     'extraction_timestamp': str(pd.Timestamp.now())
                 },
                 'data': chemicals
             }
+            if page_report is not None:
+                # auto 모드: 페이지별 엔진, 소요 시간, 프로브 결과 (캐시 적중 시 최초 추출 때의 값)
+                result['metadata']['page_engines'] = page_report
+                engine_counts = {}
+                for report in page_report:
+                    engine_counts[report['engine']] = engine_counts.get(report['engine'], 0) + 1
+                result['metadata']['engine_summary'] = engine_counts
 
             logger.info(f"PDF parsing completed. Extracted {len(chemicals)} chemical records.")
             return result
@@ -371,25 +914,243 @@ class PDFChemicalParser:
             logger.error(f"PDF parsing failed: {e}")
             raise
 
+    def _init_kwargs(self) -> Dict[str, Any]:
+        """배치 워커 프로세스에서 같은 설정의 파서를 만들기 위한 생성자 인자."""
+        return {
+            'download_dir': str(self.download_dir),
+            'cache_ttl': self.cache_ttl,
+            'max_cache_bytes': self.max_cache_bytes,
+            'refresh': self.refresh,
+            'alias_file': self.alias_file,
+        }
+
+    def parse_batch(self, documents: List[Dict[str, Any]], workers: int = 4) -> Dict[str, Any]:
+        """
+        여러 PDF를 한 프로세스에서 일괄 처리합니다.
+
+        1. 공유 세션(연결 풀 크기 = workers)으로 URL 문서를 스레드 풀에서 동시에 다운로드
+        2. 받은 파일을 프로세스 풀(워커마다 파서 하나)에서 동시에 파싱
+        3. 캐시 용량 정리는 파싱이 끝난 뒤 한 번만 수행
+
+        한 문서가 실패해도 나머지는 계속 처리하고, 실패 내용은 리포트에 남깁니다.
+
+        Args:
+            documents: load_manifest() 결과 ([{'name', 'source', 'method'}, ...])
+            workers: 동시 다운로드/파싱 수
+
+        Returns:
+            {'report': 배치 타이밍 리포트, 'results': {문서 이름: parse_pdf 결과}}
+        """
+        workers = max(1, workers)
+        batch_started = time.perf_counter()
+        adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        reports = {doc['name']: {
+            'name': doc['name'],
+            'source': doc['source'],
+            'method': doc['method'],
+            'status': 'pending',
+        } for doc in documents}
+
+        # 1. 다운로드 (I/O 대기 위주이므로 스레드)
+        def fetch(doc):
+            started = time.perf_counter()
+            path, _ = self._resolve_pdf(doc['source'], evict=False)
+            return path, time.perf_counter() - started
+
+        local_paths = {}
+        download_started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(fetch, doc): doc for doc in documents}
+            for future, doc in futures.items():
+                report = reports[doc['name']]
+                try:
+                    local_paths[doc['name']], seconds = future.result()
+                    report['download_seconds'] = round(seconds, 3)
+                except Exception as e:
+                    logger.error(f"[{doc['name']}] download failed: {e}")
+                    report.update({'status': 'failed', 'error': str(e)})
+        download_seconds = time.perf_counter() - download_started
+
+        # 2. 파싱 (CPU 위주이므로 프로세스; 문서 단위로 병렬이므로 페이지 병렬은 사용하지 않음)
+        pending = [doc for doc in documents if doc['name'] in local_paths]
+        results = {}
+        parse_started = time.perf_counter()
+        if workers > 1 and len(pending) > 1:
+            with ProcessPoolExecutor(max_workers=min(workers, len(pending)),
+                                     initializer=_init_batch_worker,
+                                     initargs=(self._init_kwargs(),)) as executor:
+                futures = {
+                    executor.submit(_parse_batch_document, str(local_paths[doc['name']]), doc['method']): doc
+                    for doc in pending
+                }
+                outcomes = [(doc, future.result) for future, doc in futures.items()]
+        else:
+            outcomes = [
+                (doc, lambda doc=doc: _parse_document(self, str(local_paths[doc['name']]), doc['method']))
+                for doc in pending
+            ]
+
+        for doc, get_result in outcomes:
+            report = reports[doc['name']]
+            try:
+                result, seconds = get_result()
+            except Exception as e:
+                logger.error(f"[{doc['name']}] parsing failed: {e}")
+                report.update({'status': 'failed', 'error': str(e)})
+                continue
+            result['metadata']['source_url'] = doc['source']
+            result['metadata']['document_name'] = doc['name']
+            results[doc['name']] = result
+            report.update({
+                'status': 'ok',
+                'parse_seconds': round(seconds, 3),
+                'cache_hit': result['metadata']['cache_hit'],
+                'total_chemicals': result['metadata']['total_chemicals'],
+            })
+        parse_seconds = time.perf_counter() - parse_started
+
+        # 이번 배치의 PDF는 합계가 상한을 넘어도 남겨 두어 다음 실행에서 다시 받지 않도록 함
+        self.evict_pdf_cache(keep=local_paths.values())
+
+        document_reports = list(reports.values())
+        wall_seconds = time.perf_counter() - batch_started
+        batch_report = {
+            'document_count': len(documents),
+            'succeeded': sum(1 for r in document_reports if r['status'] == 'ok'),
+            'failed': sum(1 for r in document_reports if r['status'] == 'failed'),
+            'total_chemicals': sum(r.get('total_chemicals', 0) for r in document_reports),
+            'workers': workers,
+            'download_seconds': round(download_seconds, 3),
+            'parse_seconds': round(parse_seconds, 3),
+            'wall_seconds': round(wall_seconds, 3),
+            # 문서별 소요 시간 합 / 실제 경과 시간 (동시 처리로 얻은 배수)
+            'parallel_speedup': round(
+                sum(r.get('download_seconds', 0) + r.get('parse_seconds', 0) for r in document_reports)
+                / max(wall_seconds, 1e-9), 2),
+            'documents': document_reports,
+            'timestamp': str(pd.Timestamp.now()),
+        }
+        logger.info(f"Batch completed: {batch_report['succeeded']}/{len(documents)} documents, "
+                    f"{batch_report['total_chemicals']} chemicals in {batch_report['wall_seconds']}s")
+        return {'report': batch_report, 'results': results}
+
+def _parse_document(parser: PDFChemicalParser, source: str, method: str) -> Tuple[Dict[str, Any], float]:
+    started = time.perf_counter()
+    result = parser.parse_pdf(source, method=method)
+    return result, time.perf_counter() - started
+
+# 배치 파싱 워커 프로세스마다 하나씩 만드는 파서 (_init_batch_worker에서 생성)
+_BATCH_PARSER: Optional[PDFChemicalParser] = None
+
+def _init_batch_worker(parser_kwargs: Dict[str, Any]):
+    global _BATCH_PARSER
+    _BATCH_PARSER = PDFChemicalParser(**parser_kwargs)
+
+def _parse_batch_document(source: str, method: str) -> Tuple[Dict[str, Any], float]:
+    return _parse_document(_BATCH_PARSER, source, method)
+
+def load_manifest(manifest_path: str) -> List[Dict[str, Any]]:
+    """
+    배치 매니페스트를 읽어 [{'name', 'source', 'method'}, ...]로 정규화합니다.
+
+    - JSON: [{"source": "<URL 또는 경로>", "method": "auto", "name": "annex12"}, ...]
+      또는 {"documents": [...]} ("source" 대신 "url"/"path", 문자열 항목도 허용)
+    - 텍스트: 한 줄에 "<URL 또는 경로> [method]", #으로 시작하는 줄은 주석
+
+    name이 없으면 파일명에서 만들고, 중복 이름에는 _2, _3...을 붙입니다.
+    """
+    manifest_path = Path(manifest_path)
+    if manifest_path.suffix.lower() == '.json':
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+        if isinstance(entries, dict):
+            entries = entries.get('documents', [])
+    else:
+        entries = []
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                parts = line.split()
+                if not parts or parts[0].startswith('#'):
+                    continue
+                entries.append({'source': parts[0], 'method': parts[1] if len(parts) > 1 else 'auto'})
+
+    documents = []
+    names = set()
+    for entry in entries:
+        if isinstance(entry, str):
+            entry = {'source': entry}
+        source = entry.get('source') or entry.get('url') or entry.get('path')
+        if not source:
+            raise ValueError(f"Manifest entry without source: {entry}")
+        method = entry.get('method', 'auto')
+        if method not in ('auto', 'pdfplumber', 'tabula', 'camelot'):
+            raise ValueError(f"Unsupported method in manifest: {method} ({source})")
+
+        base_name = entry.get('name') or Path(urlparse(source).path).stem or 'document'
+        name, n = base_name, 2
+        while name in names:
+            name, n = f"{base_name}_{n}", n + 1
+        names.add(name)
+        documents.append({'name': name, 'source': source, 'method': method})
+    return documents
+
+def merge_batch_results(batch: Dict[str, Any]) -> Dict[str, Any]:
+    """배치 결과를 하나의 데이터셋으로 합칩니다 (레코드마다 source_document 추가)."""
+    data = []
+    for name, result in batch['results'].items():
+        for record in result['data']:
+            data.append({'source_document': name, **record})
+    return {
+        'metadata': {
+            'batch': batch['report'],
+            'documents': {name: result['metadata'] for name, result in batch['results'].items()},
+            'total_chemicals': len(data),
+        },
+        'data': data
+    }
+
 def main():
     """메인 함수"""
     import argparse
 
     parser = argparse.ArgumentParser(description='PDF 화학물질 데이터 추출기')
-    parser.add_argument('--url', required=True, help='PDF 파일 URL')
-    parser.add_argument('--output', default='pdf_chemicals.json', help='출력 JSON 파일명')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--url', help='PDF 파일 URL 또는 로컬 경로')
+    source.add_argument('--manifest', help='배치 매니페스트 (JSON 또는 한 줄에 "<URL/경로> [method]"인 텍스트)')
+    parser.add_argument('--output', default='pdf_chemicals.json', help='출력 JSON 파일명 (배치 merged 모드 포함)')
     parser.add_argument('--method', choices=['auto', 'pdfplumber', 'tabula', 'camelot'],
                        default='auto', help='추출 방법')
     parser.add_argument('--data-dir', default='data', help='데이터 저장 디렉토리')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='단일 PDF: pdfplumber 페이지 병렬 추출 프로세스 수 / 배치: 동시 처리 문서 수 (기본: 1)')
+    parser.add_argument('--batch-output', choices=['merged', 'per-document'], default='merged',
+                       help='배치 결과를 하나로 합칠지(merged), 문서별 파일로 저장할지(per-document)')
+    parser.add_argument('--output-dir', default='pdf_batch', help='per-document 모드 출력 디렉토리 (data-dir 기준)')
+    parser.add_argument('--refresh', action='store_true', help='캐시를 무시하고 다시 다운로드/추출')
+    parser.add_argument('--cache-ttl', type=int, default=24 * 3600,
+                       help='이 시간(초) 안에 확인한 PDF는 서버 재확인 없이 캐시 사용 (기본: 86400)')
+    parser.add_argument('--max-cache-mb', type=int, default=1024, help='캐시된 PDF 총 크기 상한 (MB)')
+    parser.add_argument('--alias-file', help='헤더 별칭 테이블 JSON (기본: config/column_aliases.json)')
+    parser.add_argument('--no-index', action='store_true',
+                       help='통합 물질 색인(<data-dir>/substance_index.sqlite)을 갱신하지 않음')
 
     args = parser.parse_args()
 
     # PDF 파서 초기화
-    parser = PDFChemicalParser(download_dir=f"{args.data_dir}/pdfs")
+    parser = PDFChemicalParser(download_dir=f"{args.data_dir}/pdfs", cache_ttl=args.cache_ttl,
+                               max_cache_bytes=args.max_cache_mb * 1024 * 1024, refresh=args.refresh,
+                               alias_file=args.alias_file)
+
+    if args.manifest:
+        run_batch(parser, args)
+        return
 
     try:
         # PDF 파싱
-        result = parser.parse_pdf(args.url, method=args.method)
+        result = parser.parse_pdf(args.url, method=args.method, workers=args.workers)
 
         # 결과 저장
         output_path = Path(args.data_dir) / args.output
@@ -399,9 +1160,54 @@ def main():
         logger.info(f"Results saved to: {output_path}")
         logger.info(f"Total chemicals extracted: {result['metadata']['total_chemicals']}")
 
+        if not args.no_index:
+            document_name = Path(urlparse(args.url).path).stem or 'document'
+            index_datasets('pdf', {document_name: result['data']}, Path(args.data_dir) / 'substance_index.sqlite')
+
     except Exception as e:
         logger.error(f"PDF parsing failed: {e}")
         raise
 
+def run_batch(parser: PDFChemicalParser, args):
+    """--manifest 실행: 배치 파싱 후 merged 또는 문서별 파일과 타이밍 리포트를 저장합니다."""
+    documents = load_manifest(args.manifest)
+    logger.info(f"Batch parsing {len(documents)} documents with {args.workers} workers")
+    batch = parser.parse_batch(documents, workers=args.workers)
+    report = batch['report']
+
+    if args.batch_output == 'merged':
+        output_path = Path(args.data_dir) / args.output
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(merge_batch_results(batch), f, indent=2, ensure_ascii=False)
+        logger.info(f"Merged results saved to: {output_path}")
+    else:
+        output_dir = Path(args.data_dir) / args.output_dir
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for name, result in batch['results'].items():
+            with open(output_dir / f"{name}.json", 'w', encoding='utf-8') as f:
+                json.dump(result, f, indent=2, ensure_ascii=False)
+        with open(output_dir / 'batch_report.json', 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        logger.info(f"Per-document results saved to: {output_dir}")
+
+    if not args.no_index:
+        index_datasets('pdf', {name: result['data'] for name, result in batch['results'].items()},
+                       Path(args.data_dir) / 'substance_index.sqlite')
+
+    # 타이밍 리포트
+    for doc in report['documents']:
+        if doc['status'] == 'ok':
+            logger.info(f"  {doc['name']}: {doc['total_chemicals']} chemicals, download "
+                        f"{doc.get('download_seconds', 0)}s, parse {doc['parse_seconds']}s"
+                        f"{' (cache)' if doc['cache_hit'] else ''}")
+        else:
+            logger.info(f"  {doc['name']}: FAILED - {doc.get('error')}")
+    logger.info(f"Batch: {report['succeeded']}/{report['document_count']} documents, "
+                f"{report['total_chemicals']} chemicals, wall {report['wall_seconds']}s "
+                f"(download {report['download_seconds']}s, parse {report['parse_seconds']}s, "
+                f"x{report['parallel_speedup']} vs sequential)")
+    if report['failed']:
+        sys.exit(1)
+
 if __name__ == "__main__":
     main()
@@ -10,12 +10,22 @@ import streamlit as st
 import pandas as pd
 import json
 import os
-import io
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 
+from search_index import SearchIndex, is_cas_query
+from export_service import EXPORT_FORMATS, ExportCache
+
+# 컬럼형 파일 (ETL --columnar 옵션) 읽기용 - 없으면 npz/JSON만 사용
+try:
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 # 페이지 설정
 st.set_page_config(
     page_title="Workflow Kaizen - ETL 데이터 대시보드",
@@ -28,118 +38,264 @@ st.set_page_config(
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
 REACH_DATA_FILE = DATA_DIR / "reach_data.json"
 KOSHA_DATA_FILE = DATA_DIR / "kosha_data.json"
+COLUMNAR_DIR = DATA_DIR / "columnar"
+EXPORT_DIR = DATA_DIR / "exports"
+REACH_CATEGORIES = ['svhc', 'annex_xiv', 'annex_xvii']
+
+# 데이터 테이블 페이지 설정
+PAGE_SIZE_OPTIONS = [25, 50, 100, 250, 500]
+DEFAULT_SORT_OPTION = "(기본 순서)"
+
+def read_columnar(path: Path) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """ETL이 저장한 컬럼형 파일(parquet/npz)을 DataFrame과 metadata로 읽습니다."""
+    if path.suffix == '.parquet':
+        table = pq.read_table(path)
+        schema_metadata = table.schema.metadata or {}
+        metadata = json.loads(schema_metadata.get(b'etl_metadata', b'{}').decode('utf-8'))
+        return table.to_pandas(), metadata
+
+    with np.load(path, allow_pickle=False) as archive:
+        columns = list(archive['__columns__'])
+        metadata = json.loads(str(archive['__metadata__']))
+        data = {}
+        for i, col in enumerate(columns):
+            if f'c{i}_codes' in archive:
+                codes = archive[f'c{i}_codes']
+                categories = archive[f'c{i}_categories'].astype(object)
+                data[col] = pd.Categorical.from_codes(codes, categories=categories)
+            else:
+                data[col] = archive[f'c{i}_values']
+    return pd.DataFrame(data, columns=columns), metadata
+
+def _file_signature(path: Path) -> Tuple[str, Optional[int], Optional[int]]:
+    """(경로, mtime_ns, 크기) - 파일이 없으면 mtime/크기는 None."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return (str(path), None, None)
+    return (str(path), stat.st_mtime_ns, stat.st_size)
+
+def data_version(json_file: Path, columnar_names: List[str]) -> Tuple:
+    """
+    JSON 파일과 컬럼형 파일들의 (경로, mtime, 크기) 튜플.
+
+    캐시 키로 사용하므로 ETL이 파일을 다시 쓰면 자동으로 새 버전이 됩니다.
+    """
+    paths = [json_file] + [
+        COLUMNAR_DIR / f"{name}{suffix}" for name in columnar_names for suffix in ('.parquet', '.npz')
+    ]
+    return tuple(_file_signature(path) for path in paths)
+
+def render_messages(messages: List[Tuple[str, str]]):
+    """데이터 로더가 돌려준 (level, text) 메시지를 표시합니다 (level: success/info/warning/error/code)."""
+    for level, text in messages:
+        getattr(st, level)(text)
+
+def _find_columnar_file(name: str, json_file: Path) -> Optional[Path]:
+    """JSON보다 오래되지 않은 컬럼형 파일을 찾습니다 (parquet 우선)."""
+    suffixes = ['.parquet', '.npz'] if HAS_PYARROW else ['.npz']
+    json_mtime = json_file.stat().st_mtime if json_file.exists() else 0
+    for suffix in suffixes:
+        path = COLUMNAR_DIR / f"{name}{suffix}"
+        if path.exists() and path.stat().st_mtime >= json_mtime:
+            return path
+    return None
+
+def load_reach_columnar() -> Tuple[Dict[str, Any], List[Tuple[str, str]]]:
+    """컬럼형 REACH 파일이 있으면 카테고리별 DataFrame으로 로드합니다."""
+    reach_data = {}
+    for category in REACH_CATEGORIES:
+        path = _find_columnar_file(f"reach_{category}", REACH_DATA_FILE)
+        if path is None:
+            continue
+        try:
+            frame, metadata = read_columnar(path)
+        except Exception as e:
+            return {}, [('warning', f"컬럼형 파일을 읽지 못해 JSON을 사용합니다: {path.name} ({e})")]
+        reach_data[category] = {'metadata': metadata, 'frame': frame}
+
+    if reach_data:
+        return reach_data, [('success', f"✅ REACH 데이터 로드 완료 (컬럼형): {len(reach_data)}개 카테고리")]
+    return {}, []
+
+def load_kosha_columnar() -> Tuple[Dict[str, Any], List[Tuple[str, str]]]:
+    """컬럼형 KOSHA 파일이 있으면 DataFrame으로 로드합니다."""
+    path = _find_columnar_file(KOSHA_DATA_FILE.stem, KOSHA_DATA_FILE)
+    if path is None:
+        return {}, []
+    try:
+        frame, metadata = read_columnar(path)
+    except Exception as e:
+        return {}, [('warning', f"컬럼형 파일을 읽지 못해 JSON을 사용합니다: {path.name} ({e})")]
+    return {'metadata': metadata, 'frame': frame}, [('success', "✅ KOSHA 데이터 로드 완료 (컬럼형)")]
 
-def load_reach_data() -> Dict[str, Any]:
-    """EU REACH 데이터를 로드합니다."""
+def load_reach_data() -> Tuple[Dict[str, Any], List[Tuple[str, str]]]:
+    """EU REACH 데이터를 로드합니다. 화면 출력 없이 (데이터, 메시지 목록)을 반환합니다."""
+    regenerate = ('code', "python modules/etl-pipeline/reach_etl.py --skip-download")
     try:
         # 파일 존재 및 크기 확인
         if not REACH_DATA_FILE.exists():
-            st.error(f"REACH 데이터 파일을 찾을 수 없습니다: {REACH_DATA_FILE}")
-            st.info("💡 EU REACH 데이터를 수집하려면 다음 명령을 실행하세요:")
-            st.code("python modules/etl-pipeline/reach_etl.py --skip-download")
-            return {}
+            return {}, [
+                ('error', f"REACH 데이터 파일을 찾을 수 없습니다: {REACH_DATA_FILE}"),
+                ('info', "💡 EU REACH 데이터를 수집하려면 다음 명령을 실행하세요:"),
+                regenerate,
+            ]
 
         # 파일 크기 확인 (너무 작은 파일은 오류)
         file_size = REACH_DATA_FILE.stat().st_size
         if file_size < 10:  # 10바이트 미만은 비정상
-            st.error(f"REACH 데이터 파일이 너무 작거나 손상되었습니다: {file_size} bytes")
-            st.info("💡 데이터를 다시 생성하려면 다음 명령을 실행하세요:")
-            st.code("python modules/etl-pipeline/reach_etl.py --skip-download")
-            return {}
+            return {}, [
+                ('error', f"REACH 데이터 파일이 너무 작거나 손상되었습니다: {file_size} bytes"),
+                ('info', "💡 데이터를 다시 생성하려면 다음 명령을 실행하세요:"),
+                regenerate,
+            ]
 
         with open(REACH_DATA_FILE, 'r', encoding='utf-8') as f:
             content = f.read().strip()
             if not content:
-                st.error("REACH 데이터 파일이 비어있습니다.")
-                return {}
+                return {}, [('error', "REACH 데이터 파일이 비어있습니다.")]
 
             data = json.loads(content)
 
             # 데이터 구조 검증
             if not isinstance(data, dict):
-                st.error("REACH 데이터 형식이 올바르지 않습니다 (dict 타입이 아님).")
-                return {}
+                return {}, [('error', "REACH 데이터 형식이 올바르지 않습니다 (dict 타입이 아님).")]
 
             # 필수 키 확인
             expected_keys = ['svhc', 'annex_xiv', 'annex_xvii']
             found_keys = [key for key in expected_keys if key in data]
             if not found_keys:
-                st.error("REACH 데이터에 필요한 카테고리가 없습니다.")
-                return {}
+                return {}, [('error', "REACH 데이터에 필요한 카테고리가 없습니다.")]
 
-            st.success(f"✅ REACH 데이터 로드 완료: {len(found_keys)}개 카테고리")
-            return data
+            return data, [('success', f"✅ REACH 데이터 로드 완료: {len(found_keys)}개 카테고리")]
 
     except json.JSONDecodeError as e:
-        st.error(f"REACH 데이터 JSON 파싱 오류: {e}")
-        st.info("💡 파일이 손상되었을 수 있습니다. 다음 명령으로 재생성하세요:")
-        st.code("python modules/etl-pipeline/reach_etl.py --skip-download")
-        return {}
+        return {}, [
+            ('error', f"REACH 데이터 JSON 파싱 오류: {e}"),
+            ('info', "💡 파일이 손상되었을 수 있습니다. 다음 명령으로 재생성하세요:"),
+            regenerate,
+        ]
     except UnicodeDecodeError as e:
-        st.error(f"REACH 데이터 파일 인코딩 오류: {e}")
-        st.info("💡 UTF-8 인코딩으로 파일을 다시 생성하세요.")
-        return {}
+        return {}, [
+            ('error', f"REACH 데이터 파일 인코딩 오류: {e}"),
+            ('info', "💡 UTF-8 인코딩으로 파일을 다시 생성하세요."),
+        ]
     except Exception as e:
-        st.error(f"REACH 데이터 로드 중 예상치 못한 오류 발생: {e}")
-        return {}
+        return {}, [('error', f"REACH 데이터 로드 중 예상치 못한 오류 발생: {e}")]
 
-def load_kosha_data() -> Dict[str, Any]:
-    """한국 KOSHA 데이터를 로드합니다."""
+def load_kosha_data() -> Tuple[Dict[str, Any], List[Tuple[str, str]]]:
+    """한국 KOSHA 데이터를 로드합니다. 화면 출력 없이 (데이터, 메시지 목록)을 반환합니다."""
     try:
         # 파일 존재 확인
         if not KOSHA_DATA_FILE.exists():
-            st.warning("🇰🇷 KOSHA 데이터 파일이 없습니다.")
-            st.info("💡 현재 한국 산안법 데이터는 샘플 데이터 기반입니다.")
-            st.info("💡 법령정보시스템 복구 후 실제 데이터를 수집할 예정입니다.")
-            st.code("# 향후 사용 예정\npython modules/etl-pipeline/kosha_etl.py --data-type special_materials")
-            return {}
+            return {}, [
+                ('warning', "🇰🇷 KOSHA 데이터 파일이 없습니다."),
+                ('info', "💡 현재 한국 산안법 데이터는 샘플 데이터 기반입니다."),
+                ('info', "💡 법령정보시스템 복구 후 실제 데이터를 수집할 예정입니다."),
+                ('code', "# 향후 사용 예정\npython modules/etl-pipeline/kosha_etl.py --data-type special_materials"),
+            ]
 
         # 파일 크기 확인
         file_size = KOSHA_DATA_FILE.stat().st_size
         if file_size < 10:  # 10바이트 미만은 비정상
-            st.error(f"KOSHA 데이터 파일이 너무 작거나 손상되었습니다: {file_size} bytes")
-            return {}
+            return {}, [('error', f"KOSHA 데이터 파일이 너무 작거나 손상되었습니다: {file_size} bytes")]
 
         with open(KOSHA_DATA_FILE, 'r', encoding='utf-8') as f:
             content = f.read().strip()
             if not content:
-                st.error("KOSHA 데이터 파일이 비어있습니다.")
-                return {}
+                return {}, [('error', "KOSHA 데이터 파일이 비어있습니다.")]
 
             data = json.loads(content)
 
             # 데이터 구조 검증
             if not isinstance(data, dict):
-                st.error("KOSHA 데이터 형식이 올바르지 않습니다 (dict 타입이 아님).")
-                return {}
+                return {}, [('error', "KOSHA 데이터 형식이 올바르지 않습니다 (dict 타입이 아님).")]
 
             # 메타데이터 확인
             if 'metadata' not in data:
-                st.error("KOSHA 데이터에 메타데이터가 없습니다.")
-                return {}
+                return {}, [('error', "KOSHA 데이터에 메타데이터가 없습니다.")]
 
-            st.success("✅ KOSHA 데이터 로드 완료 (샘플 데이터)")
-            return data
+            return data, [('success', "✅ KOSHA 데이터 로드 완료 (샘플 데이터)")]
 
     except json.JSONDecodeError as e:
-        st.error(f"KOSHA 데이터 JSON 파싱 오류: {e}")
-        return {}
+        return {}, [('error', f"KOSHA 데이터 JSON 파싱 오류: {e}")]
     except UnicodeDecodeError as e:
-        st.error(f"KOSHA 데이터 파일 인코딩 오류: {e}")
-        return {}
+        return {}, [('error', f"KOSHA 데이터 파일 인코딩 오류: {e}")]
     except Exception as e:
-        st.error(f"KOSHA 데이터 로드 중 예상치 못한 오류 발생: {e}")
-        return {}
+        return {}, [('error', f"KOSHA 데이터 로드 중 예상치 못한 오류 발생: {e}")]
+
+# 데이터 버전(파일 경로, mtime, 크기)별로 한 번만 만들어 모든 세션이 공유하는 DataFrame.
+# cache_resource는 복사본이 아닌 같은 객체를 돌려주므로 호출하는 쪽에서 수정하지 말 것.
+@st.cache_resource(show_spinner="REACH 데이터를 불러오는 중...", max_entries=2)
+def load_reach_frame(version: Tuple) -> Tuple[Optional[pd.DataFrame], List[Tuple[str, str]]]:
+    """data_version() 키로 캐시되는 REACH DataFrame과 로드 메시지 (데이터가 없으면 None)."""
+    reach_data, messages = load_reach_columnar()
+    if not reach_data:
+        reach_data, json_messages = load_reach_data()
+        messages = messages + json_messages
+    if not reach_data:
+        return None, messages
+    return flatten_reach_data(reach_data), messages
+
+@st.cache_resource(show_spinner="KOSHA 데이터를 불러오는 중...", max_entries=2)
+def load_kosha_frame(version: Tuple) -> Tuple[Optional[pd.DataFrame], List[Tuple[str, str]]]:
+    """data_version() 키로 캐시되는 KOSHA DataFrame과 로드 메시지 (데이터가 없으면 None)."""
+    kosha_data, messages = load_kosha_columnar()
+    if not kosha_data:
+        kosha_data, json_messages = load_kosha_data()
+        messages = messages + json_messages
+    if not kosha_data:
+        return None, messages
+    return process_kosha_data(kosha_data), messages
+
+# 검색 인덱스도 같은 데이터 버전 키로 한 번만 만들어 공유 (행 위치는 캐시된 DataFrame 기준)
+@st.cache_resource(show_spinner="검색 인덱스를 만드는 중...", max_entries=2)
+def load_reach_search_index(version: Tuple) -> Optional[SearchIndex]:
+    df, _ = load_reach_frame(version)
+    return SearchIndex(df) if df is not None else None
+
+@st.cache_resource(show_spinner="검색 인덱스를 만드는 중...", max_entries=2)
+def load_kosha_search_index(version: Tuple) -> Optional[SearchIndex]:
+    df, _ = load_kosha_frame(version)
+    return SearchIndex(df) if df is not None else None
+
+# 내보내기 파일 캐시 (프로세스 하나에 하나, 모든 세션이 공유)
+@st.cache_resource
+def get_export_cache() -> ExportCache:
+    return ExportCache(EXPORT_DIR)
+
+def reach_data_version() -> Tuple:
+    return data_version(REACH_DATA_FILE, [f"reach_{category}" for category in REACH_CATEGORIES])
+
+def kosha_data_version() -> Tuple:
+    return data_version(KOSHA_DATA_FILE, [KOSHA_DATA_FILE.stem])
+
+def invalidate_data_cache():
+    """캐시된 DataFrame을 모두 버립니다 (다음 실행 때 파일을 다시 읽음)."""
+    load_reach_frame.clear()
+    load_kosha_frame.clear()
+    load_reach_search_index.clear()
+    load_kosha_search_index.clear()
 
 def flatten_reach_data(reach_data: Dict[str, Any]) -> pd.DataFrame:
     """REACH 데이터를 평탄화하여 DataFrame으로 변환합니다."""
     all_data = []
+    frames = []
 
     for category, category_data in reach_data.items():
         if category == "metadata":
             continue
 
         metadata = category_data.get("metadata", {})
+
+        # 컬럼형 파일에서 읽은 경우 DataFrame을 그대로 사용
+        if "frame" in category_data:
+            frame = category_data["frame"].copy()
+            frame["category"] = category
+            frame["category_description"] = metadata.get("annex_type", category)
+            frames.append(frame)
+            continue
+
         data_list = category_data.get("data", [])
 
         for item in data_list:
@@ -148,10 +304,13 @@ def flatten_reach_data(reach_data: Dict[str, Any]) -> pd.DataFrame:
             item_copy["category_description"] = metadata.get("annex_type", category)
             all_data.append(item_copy)
 
-    if not all_data:
+    if all_data:
+        frames.append(pd.DataFrame(all_data))
+
+    if not frames:
         return pd.DataFrame()
 
-    df = pd.DataFrame(all_data)
+    df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
     # 컬럼명 정리
     df.columns = df.columns.str.replace('_', ' ').str.title()
     return df
@@ -159,12 +318,18 @@ def flatten_reach_data(reach_data: Dict[str, Any]) -> pd.DataFrame:
 def process_kosha_data(kosha_data: Dict[str, Any]) -> pd.DataFrame:
     """KOSHA 데이터를 DataFrame으로 변환합니다."""
     metadata = kosha_data.get("metadata", {})
-    data_list = kosha_data.get("data", [])
 
-    if not data_list:
-        return pd.DataFrame()
+    if "frame" in kosha_data:
+        df = kosha_data["frame"].copy()
+        if df.empty:
+            return df
+    else:
+        data_list = kosha_data.get("data", [])
 
-    df = pd.DataFrame(data_list)
+        if not data_list:
+            return pd.DataFrame()
+
+        df = pd.DataFrame(data_list)
     # 컬럼명 정리 (한글 유지)
     df.columns = df.columns.str.replace('_', ' ')
     return df
@@ -184,7 +349,8 @@ def display_data_summary(df: pd.DataFrame, title: str):
 
     with col2:
         # 물질명을 나타내는 컬럼 찾기
-        substance_series = df.get('Substance Name') or df.get('물질명') or (df.iloc[:, 0] if len(df.columns) > 0 else None)
+        substance_col = next((col for col in ['Substance Name', '물질명'] if col in df.columns), None)
+        substance_series = df[substance_col] if substance_col else (df.iloc[:, 0] if len(df.columns) > 0 else None)
         unique_count = substance_series.nunique() if substance_series is not None and len(df) > 0 else 0
         st.metric("고유 물질 수", unique_count)
 
@@ -215,8 +381,8 @@ def display_data_summary(df: pd.DataFrame, title: str):
         else:
             st.metric("최신 등록일", "N/A")
 
-def create_search_filter(df: pd.DataFrame) -> pd.DataFrame:
-    """검색 및 필터링 기능을 제공합니다."""
+def create_search_filter(df: pd.DataFrame, search_index: Optional[SearchIndex] = None) -> pd.DataFrame:
+    """검색 및 필터링 기능을 제공합니다 (search_index가 없으면 이 자리에서 만듦)."""
     st.subheader("🔍 검색 및 필터링")
 
     col1, col2 = st.columns([2, 1])
@@ -229,10 +395,16 @@ def create_search_filter(df: pd.DataFrame) -> pd.DataFrame:
         filter_options = ["전체"] + list(df.columns)
         selected_filter = st.selectbox("필터링할 컬럼 선택", filter_options)
 
-    # 검색 적용
+    exact_cas = False
+    if is_cas_query(search_term):
+        exact_cas = st.checkbox("CAS 번호 정확히 일치", value=False,
+                                help="체크하면 50-00-0 검색 시 150-00-0 같은 부분 일치를 제외합니다")
+
+    # 검색 적용 (미리 만든 인덱스로 후보 행만 확인)
     if search_term:
-        mask = df.astype(str).apply(lambda x: x.str.contains(search_term, case=False, na=False)).any(axis=1)
-        df_filtered = df[mask]
+        if search_index is None:
+            search_index = SearchIndex(df)
+        df_filtered = df.iloc[search_index.search(search_term, exact_cas=exact_cas)]
         st.info(f"검색 결과: {len(df_filtered)} 개 항목 (전체 {len(df)} 개 중)")
     else:
         df_filtered = df
@@ -251,44 +423,92 @@ def create_search_filter(df: pd.DataFrame) -> pd.DataFrame:
 
     return df_filtered
 
-def display_data_table(df: pd.DataFrame, title: str):
-    """데이터를 테이블 형태로 표시합니다."""
+def _sort_key(series: pd.Series) -> pd.Series:
+    """컬럼형 파일에서 읽은 범주형 컬럼은 범주 코드(등장 순서)가 아닌 실제 값으로 정렬."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.reorder_categories(series.cat.categories.sort_values(), ordered=True)
+    return series
+
+def sort_frame(df: pd.DataFrame, sort_column: Optional[str], ascending: bool = True) -> pd.DataFrame:
+    """정렬 컬럼이 지정되면 안정 정렬 (결측값은 마지막), 아니면 원래 순서 그대로."""
+    if not sort_column or sort_column not in df.columns:
+        return df
+    try:
+        return df.sort_values(sort_column, ascending=ascending, kind='stable', na_position='last',
+                              key=_sort_key)
+    except TypeError:
+        # 문자열과 숫자가 섞인 컬럼은 문자열로 비교
+        return df.sort_values(sort_column, ascending=ascending, kind='stable', na_position='last',
+                              key=lambda series: series.astype(str))
+
+def paginate_frame(df: pd.DataFrame, page: int, page_size: int,
+                   sort_column: Optional[str] = None, ascending: bool = True) -> Tuple[pd.DataFrame, int]:
+    """서버에서 정렬한 뒤 page(1부터 시작)에 해당하는 행만 잘라 (페이지 DataFrame, 전체 페이지 수)를 돌려줍니다."""
+    total_pages = max(1, -(-len(df) // page_size))
+    page = min(max(page, 1), total_pages)
+    start = (page - 1) * page_size
+    return sort_frame(df, sort_column, ascending).iloc[start:start + page_size], total_pages
+
+def display_data_table(df: pd.DataFrame, title: str, version: Tuple):
+    """데이터를 페이지 단위로 표시합니다 (브라우저에는 현재 페이지의 행만 전송)."""
     st.subheader(f"📋 {title} 데이터 테이블")
 
-    # 테이블 설정
+    # 테이블 설정 - 정렬/페이지 크기/페이지 번호
+    col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
+    with col1:
+        sort_column = st.selectbox("정렬 기준", [DEFAULT_SORT_OPTION] + list(df.columns), key=f"{title}_sort_column")
+    with col2:
+        sort_order = st.radio("정렬 방향", ["오름차순", "내림차순"], horizontal=True, key=f"{title}_sort_order")
+    with col3:
+        page_size = st.selectbox("페이지당 행 수", PAGE_SIZE_OPTIONS, index=1, key=f"{title}_page_size")
+
+    total_pages = max(1, -(-len(df) // page_size))
+    page_key = f"{title}_page"
+    # 검색/필터로 행 수가 줄어 현재 페이지가 범위를 벗어나면 마지막 페이지로 이동
+    if st.session_state.get(page_key, 1) > total_pages:
+        st.session_state[page_key] = total_pages
+    with col4:
+        page = st.number_input("페이지", min_value=1, max_value=total_pages, step=1, key=page_key)
+
+    page_df, total_pages = paginate_frame(
+        df, int(page), page_size,
+        sort_column=None if sort_column == DEFAULT_SORT_OPTION else sort_column,
+        ascending=sort_order == "오름차순",
+    )
+
     st.dataframe(
-        df,
+        page_df,
         use_container_width=True,
         hide_index=True,
         column_config={
-            col: st.column_config.TextColumn(col, width="medium") for col in df.columns
+            col: st.column_config.TextColumn(col, width="medium") for col in page_df.columns
         }
     )
-
-    # 데이터 내보내기
-    col1, col2 = st.columns([1, 1])
-    with col1:
-        if st.button("📥 CSV 다운로드"):
-            csv_data = df.to_csv(index=False, encoding='utf-8-sig')
-            st.download_button(
-                label="CSV 파일 다운로드",
-                data=csv_data,
-                file_name=f"{title.lower().replace(' ', '_')}_data.csv",
-                mime="text/csv"
-            )
-
-    with col2:
-        if st.button("📥 Excel 다운로드"):
-            buffer = io.BytesIO()
-            with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='Data', index=False)
-            buffer.seek(0)
-            st.download_button(
-                label="Excel 파일 다운로드",
-                data=buffer,
-                file_name=f"{title.lower().replace(' ', '_')}_data.xlsx",
-                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-            )
+    first_row = (int(page) - 1) * page_size + 1 if len(page_df) else 0
+    last_row = first_row + len(page_df) - 1 if len(page_df) else 0
+    st.caption(f"전체 {len(df):,}개 중 {first_row:,}–{last_row:,}번째 행 "
+               f"(페이지 {int(page)}/{total_pages}, 페이지당 {page_size}행)")
+
+    # 데이터 내보내기 (같은 데이터 버전/필터 결과/형식의 파일은 캐시에서 바로 내려줌)
+    file_stem = f"{title.lower().replace(' ', '_')}_data"
+    export_cache = get_export_cache()
+    for column, fmt, label in zip(st.columns([1, 1]), ['csv', 'xlsx'], ['CSV', 'Excel']):
+        with column:
+            path = export_cache.cached(version, df, fmt)
+            if path is None and st.button(f"📥 {label} 파일 만들기", key=f"{title}_export_{fmt}"):
+                with st.spinner(f"{label} 파일을 만드는 중..."):
+                    path = export_cache.export(version, df, fmt)
+            if path is not None:
+                suffix, mime = EXPORT_FORMATS[fmt]
+                # 확인한 뒤 다른 세션의 정리로 지워졌으면 다시 만들어 엶
+                with export_cache.open(version, df, fmt) as f:
+                    st.download_button(
+                        label=f"{label} 파일 다운로드",
+                        data=f,
+                        file_name=f"{file_stem}{suffix}",
+                        mime=mime,
+                        key=f"{title}_download_{fmt}"
+                    )
 
 def create_visualizations(df: pd.DataFrame, data_type: str):
     """데이터 시각화를 생성합니다."""
@@ -347,6 +567,10 @@ def main():
         help="ETL로 수집된 화학물질 데이터를 선택하세요"
     )
 
+    # 파일이 바뀌면 자동으로 다시 읽지만, 수동으로 캐시를 비울 수도 있음
+    if st.sidebar.button("🔄 데이터 다시 읽기", help="캐시된 데이터를 버리고 파일을 다시 읽습니다"):
+        invalidate_data_cache()
+
     st.sidebar.markdown("---")
     st.sidebar.markdown("### 📋 사용 방법")
     st.sidebar.markdown("""
@@ -361,15 +585,15 @@ def main():
     # 데이터 로드
     if data_source == "EU REACH 데이터":
         st.header("🇪🇺 EU REACH 화학물질 데이터")
-        reach_data = load_reach_data()
+        # 데이터 로드 및 평탄화 (데이터 버전별로 한 번만 수행, 세션 간 공유)
+        version = reach_data_version()
+        df, messages = load_reach_frame(version)
+        render_messages(messages)
 
-        if not reach_data:
+        if df is None:
             st.error("REACH 데이터를 로드할 수 없습니다.")
             return
 
-        # 데이터 평탄화
-        df = flatten_reach_data(reach_data)
-
         if df.empty:
             st.warning("표시할 REACH 데이터가 없습니다.")
             return
@@ -378,25 +602,25 @@ def main():
         display_data_summary(df, "EU REACH")
 
         # 검색 및 필터링
-        df_filtered = create_search_filter(df)
+        df_filtered = create_search_filter(df, load_reach_search_index(version))
 
         # 데이터 테이블 표시
-        display_data_table(df_filtered, "EU REACH")
+        display_data_table(df_filtered, "EU REACH", version)
 
         # 시각화
         create_visualizations(df_filtered, "REACH")
 
     else:  # 한국 KOSHA 데이터
         st.header("🇰🇷 한국 KOSHA 특수관리물질 데이터")
-        kosha_data = load_kosha_data()
+        # 데이터 로드 및 변환 (데이터 버전별로 한 번만 수행, 세션 간 공유)
+        version = kosha_data_version()
+        df, messages = load_kosha_frame(version)
+        render_messages(messages)
 
-        if not kosha_data:
+        if df is None:
             st.error("KOSHA 데이터를 로드할 수 없습니다.")
             return
 
-        # 데이터 처리
-        df = process_kosha_data(kosha_data)
-
         if df.empty:
             st.warning("표시할 KOSHA 데이터가 없습니다.")
             return
@@ -405,10 +629,10 @@ def main():
         display_data_summary(df, "한국 KOSHA")
 
         # 검색 및 필터링
-        df_filtered = create_search_filter(df)
+        df_filtered = create_search_filter(df, load_kosha_search_index(version))
 
         # 데이터 테이블 표시
-        display_data_table(df_filtered, "한국 KOSHA")
+        display_data_table(df_filtered, "한국 KOSHA", version)
 
         # 시각화
         create_visualizations(df_filtered, "KOSHA")
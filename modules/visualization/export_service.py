@@ -0,0 +1,156 @@
+"""
+대시보드 내보내기 서비스
+필터링된 DataFrame을 CSV/Excel 파일로 나누어 쓰고, 같은 화면(데이터 버전, 필터 결과, 형식)의
+파일은 디스크에 캐시해 두었다가 바로 다시 내려줍니다.
+
+- CSV: chunk_size 행씩 to_csv로 이어 쓰기 (utf-8-sig, Excel에서 한글이 깨지지 않도록 BOM 포함)
+- Excel: openpyxl write-only 워크북에 행을 순서대로 추가 (워크북 전체를 메모리에 만들지 않음)
+- 캐시 키: sha1(데이터 버전, 필터 해시, 형식) - 필터 해시는 남은 행의 인덱스와 컬럼 목록으로 계산
+"""
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+try:
+    from openpyxl import Workbook
+    from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+    HAS_OPENPYXL = True
+except ImportError:
+    HAS_OPENPYXL = False
+
+CHUNK_SIZE = 10_000
+
+EXPORT_FORMATS = {
+    'csv': ('.csv', 'text/csv'),
+    'xlsx': ('.xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+}
+
+
+def filter_hash(df: pd.DataFrame) -> str:
+    """필터 결과(남은 행의 인덱스 + 컬럼 순서)의 해시 - 데이터 버전과 함께 써야 내용까지 구분됩니다."""
+    digest = hashlib.sha1()
+    digest.update(pd.util.hash_array(df.index.to_numpy()).tobytes())
+    digest.update('\x1f'.join(map(str, df.columns)).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _excel_text(value):
+    """문자열 컬럼의 셀 값: 숫자는 그대로, 목록/사전 등은 문자열로, 제어 문자는 제거."""
+    if isinstance(value, (int, float, bool)):
+        return value
+    return ILLEGAL_CHARACTERS_RE.sub('', str(value))
+
+
+def _excel_rows(chunk: pd.DataFrame) -> list:
+    """openpyxl에 넘길 행 목록 (컬럼 단위로 변환, 결측값은 빈 셀)."""
+    columns = []
+    for col in range(chunk.shape[1]):
+        series = chunk.iloc[:, col]
+        if not (pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series)):
+            series = series.map(_excel_text, na_action='ignore')
+        series = series.astype(object)
+        columns.append(series.where(series.notna(), None).tolist())
+    return list(zip(*columns))
+
+
+def write_csv(df: pd.DataFrame, path: Path, chunk_size: int = CHUNK_SIZE):
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        if df.empty:
+            df.to_csv(f, index=False)
+        for start in range(0, len(df), chunk_size):
+            df.iloc[start:start + chunk_size].to_csv(f, index=False, header=start == 0)
+
+
+def write_xlsx(df: pd.DataFrame, path: Path, chunk_size: int = CHUNK_SIZE):
+    if not HAS_OPENPYXL:
+        raise ImportError("openpyxl is not installed")
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('Data')
+    sheet.append([str(col) for col in df.columns])
+    for start in range(0, len(df), chunk_size):
+        for row in _excel_rows(df.iloc[start:start + chunk_size]):
+            sheet.append(row)
+    workbook.save(path)
+
+
+WRITERS = {'csv': write_csv, 'xlsx': write_xlsx}
+
+
+class ExportCache:
+    """내보내기 파일 캐시 (cache_dir 아래 <키><확장자>, 최근 max_entries개만 유지)."""
+
+    def __init__(self, cache_dir, max_entries: int = 20):
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def _path(self, version, df: pd.DataFrame, fmt: str) -> Path:
+        suffix, _ = EXPORT_FORMATS[fmt]
+        key = hashlib.sha1(repr((version, filter_hash(df), fmt)).encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}{suffix}"
+
+    def cached(self, version, df: pd.DataFrame, fmt: str) -> Optional[Path]:
+        """이미 만들어 둔 파일이 있으면 그 경로, 없으면 None."""
+        path = self._path(version, df, fmt)
+        try:
+            # 최근 사용 표시 (정리할 때 mtime 순) - touch()와 달리 방금 정리된 파일을 빈 파일로 만들지 않음
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def export(self, version, df: pd.DataFrame, fmt: str, chunk_size: int = CHUNK_SIZE) -> Path:
+        """캐시에 있으면 그대로, 없으면 파일을 만들어 경로를 돌려줍니다."""
+        path = self.cached(version, df, fmt)
+        if path is not None:
+            return path
+
+        path = self._path(version, df, fmt)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # 세션(스레드)마다 다른 임시 파일에 쓰고 완성된 파일만 교체
+        tmp_path = path.with_name(f".{os.getpid()}-{threading.get_ident()}-{path.name}")
+        try:
+            WRITERS[fmt](df, tmp_path, chunk_size)
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        self._evict()
+        return path
+
+    def open(self, version, df: pd.DataFrame, fmt: str, chunk_size: int = CHUNK_SIZE):
+        """내보내기 파일을 읽기용으로 열어 돌려줍니다.
+
+        cached()/export()가 돌려준 경로는 여는 사이에 다른 세션의 정리(_evict)로 지워질 수 있으므로,
+        열다가 FileNotFoundError가 나면 파일을 다시 만들어 엽니다. 한 번 연 파일은 그 뒤에 지워져도
+        끝까지 읽을 수 있습니다.
+        """
+        for attempt in range(2):
+            path = self.export(version, df, fmt, chunk_size)
+            try:
+                return open(path, 'rb')
+            except FileNotFoundError:
+                if attempt:
+                    raise
+
+    def _evict(self):
+        with self._lock:
+            files = []
+            for p in self.cache_dir.iterdir():
+                if p.suffix not in ('.csv', '.xlsx') or p.name.startswith('.'):
+                    continue
+                try:
+                    files.append((p.stat().st_mtime, p))
+                except FileNotFoundError:
+                    continue  # 다른 프로세스가 먼저 정리함
+            files.sort()
+            for _, stale in files[:-self.max_entries]:
+                try:
+                    stale.unlink(missing_ok=True)
+                except PermissionError:
+                    pass  # Windows에서 다른 세션이 내려받는 중인 파일 - 다음 정리 때 지움
@@ -0,0 +1,139 @@
+"""
+대시보드 전문 검색 인덱스
+데이터 버전마다 한 번 만들어 두고, 검색어가 바뀔 때마다 전체 셀을 다시 훑지 않도록 합니다.
+
+- 행마다 모든 셀을 str로 바꾼 뒤 소문자로 이어 붙인 행 텍스트를 보관
+- 행 텍스트의 3글자 조각(trigram) → 행 번호 배열의 역색인
+- 셀에 들어 있는 CAS 번호 → 행 번호 배열 (정확히 일치 검색용)
+
+검색 결과는 "어느 셀에든 검색어가 대소문자 구분 없이 부분 문자열로 포함된 행"으로,
+이전의 df.astype(str) + str.contains 방식과 같습니다. 다만 검색어는 정규식이 아닌
+일반 문자열로 취급합니다 ('(' 같은 문자가 들어가도 오류가 나지 않음).
+"""
+
+import re
+from itertools import chain
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+NGRAM = 3
+# 셀 구분자 - 검색어에는 나올 수 없는 문자라 셀 경계를 넘는 일치가 생기지 않음
+CELL_SEPARATOR = '\x1f'
+CAS_PATTERN = re.compile(r'\b\d{2,7}-\d{2}-\d\b')
+CAS_QUERY_PATTERN = re.compile(r'^\s*(\d{2,7}-\d{2}-\d)\s*$')
+
+
+def is_cas_query(term: Optional[str]) -> bool:
+    """검색어가 CAS 번호 하나(예: 50-00-0)인지 여부."""
+    return bool(term and CAS_QUERY_PATTERN.match(term))
+
+
+def _ngrams(text: str) -> set:
+    return {text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+
+def _expand(codes: np.ndarray, value_ids: List[list]) -> Tuple[np.ndarray, np.ndarray]:
+    """고유 값별 id 목록을 행으로 펼친 (id, 행 번호) 배열 쌍."""
+    lengths = np.array([len(ids) for ids in value_ids], dtype=np.int64)
+    flat = np.fromiter(chain.from_iterable(value_ids), dtype=np.int64, count=int(lengths.sum()))
+    starts = np.cumsum(lengths) - lengths
+    row_lengths = lengths[codes]
+    rows = np.repeat(np.arange(len(codes), dtype=np.int64), row_lengths)
+    row_starts = np.cumsum(row_lengths) - row_lengths
+    within = np.arange(int(row_lengths.sum()), dtype=np.int64) - np.repeat(row_starts, row_lengths)
+    return flat[np.repeat(starts[codes], row_lengths) + within], rows
+
+
+def _invert(pairs: List[Tuple[np.ndarray, np.ndarray]], vocab_size: int, row_count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """(id, 행) 쌍들 → id 순으로 정렬·중복 제거된 행 배열과 id별 시작 위치 (CSR 형태)."""
+    row_count = max(row_count, 1)
+    if pairs:
+        keys = np.sort(np.concatenate([ids * row_count + rows for ids, rows in pairs]))
+        keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))] if len(keys) else keys
+    else:
+        keys = np.empty(0, dtype=np.int64)
+    offsets = np.searchsorted(keys // row_count, np.arange(vocab_size + 1))
+    return (keys % row_count).astype(np.int32), offsets
+
+
+class SearchIndex:
+    """DataFrame 한 개에 대한 검색 인덱스 (행 위치 기준, df.iloc에 바로 사용)."""
+
+    def __init__(self, df: pd.DataFrame):
+        self.row_count = len(df)
+        columns = [df[col].astype(str).fillna('').str.lower() for col in df.columns]
+        cells = [column.tolist() for column in columns]
+        self.texts: List[str] = [CELL_SEPARATOR.join(row) for row in zip(*cells)] if cells else [''] * len(df)
+
+        # 같은 셀 값은 여러 행에 반복되므로 (카테고리, 등급 등) 컬럼별 고유 값마다 한 번만 조각내고,
+        # (조각 번호, 행 번호) 쌍을 numpy로 펼친 뒤 정렬해 역색인을 만듦
+        gram_ids: Dict[str, int] = {}
+        cas_ids: Dict[str, int] = {}
+        gram_pairs, cas_pairs = [], []
+        for column in columns:
+            codes, uniques = pd.factorize(column)
+            uniques = uniques.tolist()
+            gram_pairs.append(_expand(codes, [
+                [gram_ids.setdefault(gram, len(gram_ids)) for gram in _ngrams(value)] for value in uniques
+            ]))
+            cas_pairs.append(_expand(codes, [
+                [cas_ids.setdefault(cas, len(cas_ids)) for cas in set(CAS_PATTERN.findall(value))] for value in uniques
+            ]))
+
+        self._gram_ids = gram_ids
+        self._gram_rows, self._gram_offsets = _invert(gram_pairs, len(gram_ids), self.row_count)
+        self._cas_ids = cas_ids
+        self._cas_rows, self._cas_offsets = _invert(cas_pairs, len(cas_ids), self.row_count)
+        self._all_rows = np.arange(self.row_count, dtype=np.int32)
+
+    def _postings(self, gram: str) -> Optional[np.ndarray]:
+        gram_id = self._gram_ids.get(gram)
+        if gram_id is None:
+            return None
+        return self._gram_rows[self._gram_offsets[gram_id]:self._gram_offsets[gram_id + 1]]
+
+    def _candidates(self, query: str) -> np.ndarray:
+        """검색어의 모든 trigram을 가진 행 (짧은 역색인부터 교집합)."""
+        grams = _ngrams(query)
+        lists = []
+        for gram in grams:
+            ids = self._postings(gram)
+            if ids is None:
+                return self._all_rows[:0]
+            lists.append(ids)
+        lists.sort(key=len)
+        result = lists[0]
+        for ids in lists[1:]:
+            result = np.intersect1d(result, ids, assume_unique=True)
+            if len(result) == 0:
+                break
+        return result
+
+    def search(self, term: str, exact_cas: bool = False) -> np.ndarray:
+        """
+        검색어와 일치하는 행 위치 배열 (오름차순).
+
+        exact_cas=True이고 검색어가 CAS 번호 형식이면 셀 안의 CAS 번호와 정확히 같은
+        행만 돌려줍니다 ('50-00-0'이 '150-00-0'에 걸리지 않음).
+        """
+        if not term:
+            return self._all_rows
+        if exact_cas:
+            match = CAS_QUERY_PATTERN.match(term)
+            if match:
+                cas_id = self._cas_ids.get(match.group(1))
+                if cas_id is None:
+                    return self._all_rows[:0]
+                return self._cas_rows[self._cas_offsets[cas_id]:self._cas_offsets[cas_id + 1]]
+
+        query = term.lower()
+        if CELL_SEPARATOR in query:
+            return self._all_rows[:0]
+        if len(query) < NGRAM:
+            candidates = self._all_rows
+        else:
+            candidates = self._candidates(query)
+        texts = self.texts
+        return np.array([i for i in candidates.tolist() if query in texts[i]], dtype=np.int32)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+CAS 일괄 스크리닝 처리량 벤치마크
+합성 규제 목록(SVHC, Annex XIV/XVII, KOSHA 특수관리물질)과 100만 건의 입력 CAS 번호
+(목록에 있는 번호, 임의 번호, 검증 숫자 오류, 앞자리 0/하이픈 없는 형식, 잘못된 문자열 혼합)를 만들어
+cas_screening.CasScreener.screen(벡터화 정규화 + 검증 숫자 확인 + 해시 조인)과
+항목마다 정규식/검증 숫자/set 조회를 하는 파이썬 루프의 소요 시간을 비교하고 결과가 같은지 확인합니다.
+
+실행 방법:
+    python scripts/benchmarks/cas_screening_throughput.py --lookups 1000000
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'modules' / 'etl-pipeline'))
+
+from cas_screening import CasScreener  # noqa: E402
+
+LIST_SIZES = {'reach/svhc': 250, 'reach/annex_xiv': 60, 'reach/annex_xvii': 1_100, 'kosha/special_materials': 1_500}
+CAS_RE = re.compile(r'^\s*0*(\d{2,7})-?(\d{2})-?(\d)\s*$')
+
+
+def with_check_digit(body: int) -> str:
+    digits = str(body)
+    check = sum(i * int(d) for i, d in enumerate(reversed(digits), start=1)) % 10
+    return f"{digits[:-2]}-{digits[-2:]}-{check}"
+
+
+def make_inputs(rng, listed: list, lookups: int) -> list:
+    values = []
+    for i in range(lookups):
+        kind = i % 10
+        if kind < 2:
+            values.append(listed[rng.integers(len(listed))])                     # 목록에 있는 번호
+        elif kind == 2:
+            values.append('00' + listed[rng.integers(len(listed))])              # 앞자리 0
+        elif kind == 3:
+            values.append(listed[rng.integers(len(listed))].replace('-', ''))    # 하이픈 없음
+        elif kind == 4:
+            cas = listed[rng.integers(len(listed))]
+            values.append(cas[:-1] + str((int(cas[-1]) + 1) % 10))              # 검증 숫자 오류
+        elif kind == 5:
+            values.append('n/a')
+        else:
+            values.append(with_check_digit(int(rng.integers(1_000, 99_999_999))))  # 임의의 유효 번호
+    return values
+
+
+def python_loop(lists: dict, values: list) -> list:
+    """비교 기준: 항목마다 정규식 + 검증 숫자 + 목록별 set 조회."""
+    sets = {name: {cas.replace('-', '') for cas in members} for name, members in lists.items()}
+    regulated = []
+    for value in values:
+        match = CAS_RE.match(value)
+        if not match:
+            regulated.append(False)
+            continue
+        body, check = match.group(1) + match.group(2), int(match.group(3))
+        if sum(i * int(d) for i, d in enumerate(reversed(body), start=1)) % 10 != check:
+            regulated.append(False)
+            continue
+        key = body + match.group(3)
+        regulated.append(any(key in members for members in sets.values()))
+    return regulated
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CAS 스크리닝 처리량 벤치마크')
+    parser.add_argument('--lookups', type=int, default=1_000_000, help='입력 CAS 번호 수')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    lists = {name: [with_check_digit(int(b)) for b in rng.integers(1_000, 9_999_999, size=size)]
+             for name, size in LIST_SIZES.items()}
+    listed = [cas for members in lists.values() for cas in members]
+    values = make_inputs(rng, listed, args.lookups)
+
+    start = time.perf_counter()
+    screener = CasScreener(lists)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = screener.screen(values)
+    vectorized = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = python_loop(lists, values)
+    loop = time.perf_counter() - start
+
+    same = result['regulated'].tolist() == expected
+    print(f"lists: {sum(LIST_SIZES.values()):,} CAS in {len(LIST_SIZES)} lists (build {build * 1000:.1f} ms)")
+    print(f"lookups: {args.lookups:,}  valid: {int(result['valid'].sum()):,}  regulated: {int(result['regulated'].sum()):,}")
+    print(f"python loop {loop:8.2f} s  {args.lookups / loop:12,.0f} lookups/s")
+    print(f"screener    {vectorized:8.2f} s  {args.lookups / vectorized:12,.0f} lookups/s")
+    print(f"speedup: {loop / vectorized:.1f}x")
+    print(f"{'✅' if same else '❌'} identical regulated flags")
+    sys.exit(0 if same else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+CSV 인코딩/구분자 스니퍼 검증 코퍼스
+cp1252, utf-8-sig, 세미콜론, 탭 구분 CSV를 만들어 reach_etl._read_csv_robust가
+방언(dialect)을 올바르게 감지하고 한 번의 파싱으로 읽는지 확인하고 소요 시간을 출력합니다.
+
+실행 방법:
+    python scripts/benchmarks/csv_sniffer_corpus.py --rows 20000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'modules' / 'etl-pipeline'))
+
+from reach_etl import _read_csv_robust  # noqa: E402
+
+HEADER = ['Substance name', 'EC No.', 'CAS No.', 'Reason for inclusion']
+
+# (파일명, 인코딩, 구분자, 기대 인코딩) - 비ASCII 문자가 뒤쪽 행에만 있는 경우도 포함
+CORPUS = [
+    ('cp1252.csv', 'cp1252', ',', 'cp1252'),
+    ('utf8_sig.csv', 'utf-8-sig', ',', 'utf-8-sig'),
+    ('semicolon.csv', 'utf-8', ';', 'utf-8'),
+    ('tab.csv', 'utf-8', '\t', 'utf-8'),
+    ('cp1252_semicolon.csv', 'cp1252', ';', 'cp1252'),
+]
+
+
+def write_corpus_file(path: Path, encoding: str, delimiter: str, rows: int):
+    lines = [delimiter.join(HEADER)]
+    for i in range(rows):
+        # 마지막 행 근처에만 é, ü, € 같은 비ASCII 문자를 넣어 prefix 밖의 인코딩 판별도 검증
+        name = f"Substance {i}" if i < rows - 5 else f"Dérivé {i} – Müller €"
+        lines.append(delimiter.join([
+            f'"{name}"', f"{200000 + i}-{i % 100:02d}-{i % 10}", f"{50 + i}-00-{i % 10}",
+            '"Toxic for reproduction, Article 57c"',
+        ]))
+    path.write_text('\n'.join(lines) + '\n', encoding=encoding)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CSV 스니퍼 코퍼스 검증')
+    parser.add_argument('--rows', type=int, default=20_000, help='파일당 행 수')
+    args = parser.parse_args()
+
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        for filename, encoding, delimiter, expected in CORPUS:
+            path = Path(tmp) / filename
+            write_corpus_file(path, encoding, delimiter, args.rows)
+
+            start = time.perf_counter()
+            df = _read_csv_robust(str(path))
+            elapsed = time.perf_counter() - start
+
+            dialect = df.attrs['csv_dialect'] if df is not None else {}
+            ok = (
+                df is not None
+                and dialect['encoding'] == expected
+                and dialect['delimiter'] == delimiter
+                and list(df.columns) == HEADER
+                and len(df) == args.rows
+                and df.iloc[-1, 0].endswith('– Müller €')
+            )
+            failures += not ok
+            print(f"{'✅' if ok else '❌'} {filename:<22} {dialect} {elapsed * 1000:.1f} ms")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
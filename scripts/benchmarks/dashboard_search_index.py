@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+대시보드 검색 인덱스 벤치마크
+합성 REACH 형태 DataFrame(기본 50,000행)에서 기존 방식(df.astype(str) + str.contains를
+검색마다 전체 셀에 실행)과 SearchIndex.search의 검색당 소요 시간을 비교하고,
+모든 검색어에 대해 두 결과 행이 같은지 확인합니다.
+
+실행 방법:
+    python scripts/benchmarks/dashboard_search_index.py --rows 50000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'modules' / 'visualization'))
+
+from search_index import SearchIndex  # noqa: E402
+
+REASONS = ['Toxic for reproduction (Article 57c)', 'Carcinogenic (Article 57a)', 'PBT (Article 57d)', None]
+QUERIES = ['formaldehyde', 'Substance 4242', '50-00-0', '12', 'article 57', 'x', 'Ü', 'no such substance',
+           '(Article', 'svhc', '200-001-8']
+
+
+def make_frame(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        'Substance Name': ['Formaldehyde' if i == 7 else f"Substance {i} Müller" for i in range(rows)],
+        'Ec No': [f"{200000 + i // 1000:03d}-{i % 1000:03d}-{i % 10}" for i in range(rows)],
+        'Cas No': ['50-00-0' if i == 7 else (f"{50 + i}-{i % 100:02d}-{i % 10}" if i % 17 else None)
+                   for i in range(rows)],
+        'Reason For Inclusion': [REASONS[i % len(REASONS)] for i in range(rows)],
+        'Entry': [float(i % 60) if i % 9 else float('nan') for i in range(rows)],
+        'Category': [['svhc', 'annex_xiv', 'annex_xvii'][i % 3] for i in range(rows)],
+    })
+
+
+def baseline(df: pd.DataFrame, term: str) -> list:
+    """기존 create_search_filter 방식 (검색어를 정규식이 아닌 문자열로 취급)."""
+    mask = df.astype(str).apply(lambda x: x.str.contains(term, case=False, na=False, regex=False)).any(axis=1)
+    return mask.to_numpy().nonzero()[0].tolist()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='대시보드 검색 인덱스 벤치마크')
+    parser.add_argument('--rows', type=int, default=50_000, help='합성 DataFrame 행 수')
+    args = parser.parse_args()
+
+    df = make_frame(args.rows)
+
+    start = time.perf_counter()
+    index = SearchIndex(df)
+    build = time.perf_counter() - start
+    print(f"rows: {args.rows:,}  index build: {build * 1000:.1f} ms (데이터 버전당 1회)")
+
+    failures = 0
+    total_old = total_new = 0.0
+    for term in QUERIES:
+        start = time.perf_counter()
+        expected = baseline(df, term)
+        old = time.perf_counter() - start
+
+        start = time.perf_counter()
+        found = index.search(term).tolist()
+        new = time.perf_counter() - start
+
+        total_old += old
+        total_new += new
+        ok = found == expected
+        failures += not ok
+        print(f"{'✅' if ok else '❌'} {term!r:<22} {len(found):>6} rows  "
+              f"contains {old * 1000:8.1f} ms  index {new * 1000:7.2f} ms")
+
+    exact = index.search('50-00-0', exact_cas=True).tolist()
+    ok = exact == [7]
+    failures += not ok
+    print(f"{'✅' if ok else '❌'} exact CAS '50-00-0' -> {exact}")
+    print(f"speedup per search: {total_old / total_new:.0f}x")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+KOSHA HTML 표 추출 벤치마크
+목록 페이지 형태의 픽스처(기본 2,000행)를 만들어 기존 셀 단위 추출(extract_table_data(bulk=False):
+행마다 find_elements, 셀마다 .text 호출)과 execute_script 한 번으로 표 HTML을 받아 lxml로
+파싱하는 일괄 추출의 소요 시간을 비교하고, 두 결과 DataFrame이 같은지 확인합니다.
+
+기본으로 헤드리스 브라우저(webdriver_pool.build_webdriver)로 픽스처 파일을 엽니다. 브라우저가
+없는 환경에서는 --latency-ms를 주면 픽스처를 로컬에서 탐색하면서 WebDriver 호출마다 지정한
+왕복 지연을 더하는 모의 드라이버를 사용합니다.
+
+실행 방법:
+    python scripts/benchmarks/kosha_table_extraction.py --rows 2000
+    python scripts/benchmarks/kosha_table_extraction.py --rows 2000 --latency-ms 1.5
+    python scripts/benchmarks/kosha_table_extraction.py --fixture saved_page.html
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import lxml.html
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'modules' / 'etl-pipeline'))
+
+from kosha_etl import BROWSER_ARGS, _cell_text, _mark_line_breaks, extract_table_data  # noqa: E402
+
+HEADERS = ['번호', '물질명', '영문명', 'CAS_No', '관리기준', '비고']
+CRITERIA = ['노출기준 1ppm', '피부흡수<br>방지', '  호흡기   보호구 착용 ', '']
+
+
+def make_fixture(rows: int) -> str:
+    """머리글/메뉴, 줄바꿈(<br>)·공백·중첩 태그가 섞인 셀, 빈 행이 있는 목록 페이지."""
+    body = []
+    for i in range(rows):
+        if i % 500 == 499:
+            body.append('<tr></tr>')
+            continue
+        body.append(
+            f"<tr><td>{i + 1}</td><td><a href=\"view.do?id={i}\">물질 {i}</a></td>"
+            f"<td><span>Substance</span> {i}</td><td>{50 + i}-{i % 100:02d}-{i % 10}</td>"
+            f"<td>{CRITERIA[i % len(CRITERIA)]}</td><td>{'발암성' if i % 7 == 0 else '-'}</td></tr>"
+        )
+    head = ''.join(f"<th>{h}</th>" for h in HEADERS)
+    return (
+        "<!DOCTYPE html><html lang=\"ko\"><head><meta charset=\"utf-8\"><title>특수관리물질 목록</title></head>"
+        "<body><div id=\"menu\"><ul><li><a href=\"#\">자료실</a></li><li><a href=\"#\">법령</a></li></ul></div>"
+        f"<table class=\"board_list\"><thead><tr>{head}</tr></thead><tbody>{''.join(body)}</tbody></table>"
+        "<div class=\"paging\"><strong>1</strong></div></body></html>"
+    )
+
+
+class SimulatedElement:
+    """픽스처 요소 위의 WebElement 대용 (태그 이름 탐색만) - 호출마다 WebDriver 왕복 지연을 더합니다."""
+
+    def __init__(self, node, driver):
+        self.node = node
+        self.driver = driver
+
+    def find_element(self, by, value):
+        self.driver.round_trip()
+        found = self.node.find(f".//{value}")
+        if found is None:
+            raise LookupError(f"no such element: {value}")
+        return SimulatedElement(found, self.driver)
+
+    def find_elements(self, by, value):
+        self.driver.round_trip()
+        return [SimulatedElement(node, self.driver) for node in self.node.iterfind(f".//{value}")]
+
+    @property
+    def text(self):
+        self.driver.round_trip()
+        return _cell_text(self.node)
+
+
+class SimulatedDriver(SimulatedElement):
+    def __init__(self, html: str, latency: float):
+        self.latency = latency
+        self.calls = 0
+        super().__init__(lxml.html.fromstring(html), self)
+        self.html = lxml.html.tostring(self.node, encoding='unicode')
+        _mark_line_breaks(self.node)  # .text of a cell reports <br> as a line break
+
+    def round_trip(self):
+        self.calls += 1
+        time.sleep(self.latency)
+
+    def execute_script(self, script, selector):
+        self.round_trip()
+        found = lxml.html.fromstring(self.html).find(f".//{selector}")
+        return None if found is None else lxml.html.tostring(found, encoding='unicode')
+
+    def quit(self):
+        pass
+
+
+class CountingDriver:
+    """실제 WebDriver의 execute 호출 수를 세는 래퍼."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.calls = 0
+        execute = driver.execute
+
+        def counted(*args, **kwargs):
+            self.calls += 1
+            return execute(*args, **kwargs)
+
+        driver.execute = counted
+
+    def __getattr__(self, name):
+        return getattr(self.driver, name)
+
+
+def open_driver(fixture: Path, latency_ms):
+    if latency_ms is not None:
+        return SimulatedDriver(fixture.read_text(encoding='utf-8'), latency_ms / 1000), 'simulated'
+    from webdriver_pool import build_webdriver
+    driver = build_webdriver(fixture.parent, extra_args=BROWSER_ARGS)
+    driver.get(fixture.resolve().as_uri())
+    return CountingDriver(driver), 'browser'
+
+
+def timed(driver, bulk: bool):
+    calls = driver.calls
+    start = time.perf_counter()
+    df = extract_table_data(driver, bulk=bulk)
+    return df, time.perf_counter() - start, driver.calls - calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description='KOSHA HTML 표 추출 벤치마크')
+    parser.add_argument('--rows', type=int, default=2_000, help='픽스처 표 행 수')
+    parser.add_argument('--fixture', help='저장해 둔 HTML 페이지 (지정하면 --rows 무시)')
+    parser.add_argument('--latency-ms', type=float,
+                        help='브라우저 대신 모의 드라이버 사용, WebDriver 호출당 왕복 지연(ms)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.fixture:
+            fixture = Path(args.fixture)
+        else:
+            fixture = Path(tmp) / 'kosha_list.html'
+            fixture.write_text(make_fixture(args.rows), encoding='utf-8')
+
+        driver, mode = open_driver(fixture, args.latency_ms)
+        try:
+            bulk, bulk_time, bulk_calls = timed(driver, bulk=True)
+            cells, cell_time, cell_calls = timed(driver, bulk=False)
+        finally:
+            driver.quit()
+
+    ok = bulk.equals(cells)
+    print(f"fixture: {fixture.name}  rows: {len(cells):,}  driver: {mode}")
+    print(f"cell-by-cell  {cell_time * 1000:9.1f} ms  {cell_calls:>7,} WebDriver calls")
+    print(f"bulk (table)  {bulk_time * 1000:9.1f} ms  {bulk_calls:>7,} WebDriver calls")
+    print(f"{'✅' if ok else '❌'} identical DataFrames, speedup {cell_time / bulk_time:.0f}x")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
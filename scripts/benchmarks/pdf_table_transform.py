@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+PDF 표 → 화학물질 레코드 변환 벤치마크
+합성 표(기본 50,000행)를 만들어 _process_table_data의 두 경로 - 행 단위 변환
+(_process_table_rows: _extract_chemical_info를 행마다 호출)과 컬럼 단위 변환
+(_process_table_columns) - 의 소요 시간을 비교하고, 두 결과가 같은지 확인합니다.
+--sweep은 여러 표 크기에서 측정해 VECTORIZE_MIN_ROWS의 손익분기점을 보여줍니다.
+
+실행 방법:
+    python scripts/benchmarks/pdf_table_transform.py --rows 50000
+    python scripts/benchmarks/pdf_table_transform.py --sweep
+"""
+
+import argparse
+import gc
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'modules' / 'pdf-parser'))
+
+from pdf_parser import VECTORIZE_MIN_ROWS, PDFChemicalParser  # noqa: E402
+
+HEADERS = ['번호', '화학물질명', 'CAS No.', '관리등급', '특별관리물질', '비고']
+SPECIAL_MARKS = ['○', '', '-', 'N/A', '특별관리', 'no', 'Yes']
+SWEEP_ROWS = [50, 300, 1_000, 3_000, 5_000, 10_000, 20_000, 50_000]
+
+
+def make_table(rows: int) -> list:
+    """빈 행, 빈 값('-', 'N/A'), 짧은 행, 공백이 섞인 표."""
+    table = []
+    for i in range(rows):
+        if i % 97 == 0:
+            table.append(['', None, ' ', '', '', ''])
+            continue
+        row = [
+            str(i + 1),
+            f"  물질 {i} ",
+            f"{50 + i}-{i % 100:02d}-{i % 10}" if i % 13 else f"CAS {i} (혼합물)",
+            ['1', '2', '3', '-'][i % 4],
+            SPECIAL_MARKS[i % len(SPECIAL_MARKS)],
+            'N/A' if i % 5 else (float('nan') if i % 2 else f"비고 {i}"),  # tabula는 빈 셀을 NaN으로 줌
+        ]
+        if i % 31 == 0:
+            row = row[:3]  # 셀이 일부만 인식된 행
+        table.append(row)
+    return table
+
+
+def measure(pdf_parser: PDFChemicalParser, rows: list, repeat: int) -> tuple:
+    """(행 단위 ms, 컬럼 단위 ms, 결과 동일 여부, 레코드 수) - 반복 중 최소 시간."""
+    timings, results = {}, {}
+    for name, transform in [
+        ('rows', lambda: pdf_parser._process_table_rows(HEADERS, rows, 0, 0)),
+        ('columns', lambda: pdf_parser._process_table_columns(HEADERS, rows, 0, 0)),
+    ]:
+        best = float('inf')
+        for _ in range(repeat):
+            results[name] = None
+            gc.collect()
+            gc.disable()  # timeit과 같이 GC를 끄고 측정 (레코드 dict 대량 생성 시 편차 제거)
+            start = time.perf_counter()
+            results[name] = transform()
+            best = min(best, time.perf_counter() - start)
+            gc.enable()
+        timings[name] = best * 1000
+    return timings['rows'], timings['columns'], results['rows'] == results['columns'], len(results['rows'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='PDF 표 변환 벤치마크')
+    parser.add_argument('--rows', type=int, default=50_000, help='합성 표 행 수')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (최소 시간 사용)')
+    parser.add_argument('--sweep', action='store_true',
+                        help='여러 표 크기에서 측정해 손익분기점 확인 (VECTORIZE_MIN_ROWS 근거)')
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    sizes = SWEEP_ROWS if args.sweep else [args.rows]
+
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_parser = PDFChemicalParser(download_dir=tmp)
+        print(f"{'rows':>8} {'records':>8} {'rowwise':>10} {'columns':>10} {'speedup':>8}  "
+              f"(VECTORIZE_MIN_ROWS={VECTORIZE_MIN_ROWS:,})")
+        for size in sizes:
+            row_ms, column_ms, same, records = measure(pdf_parser, make_table(size), args.repeat)
+            failures += not same
+            print(f"{size:>8,} {records:>8,} {row_ms:>8.1f}ms {column_ms:>8.1f}ms {row_ms / column_ms:>7.1f}x  "
+                  f"{'✅' if same else '❌'} identical records")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+REACH XML 파서 벤치마크
+ECHA XML export 형식의 합성 파일을 만들어 tree / stream 파싱 속도와 최대 메모리를 비교합니다.
+
+실행 방법:
+    python scripts/benchmarks/reach_xml_parse.py --rows 500000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'modules' / 'etl-pipeline'))
+
+from reach_etl import parse_xml_rows  # noqa: E402
+
+
+def write_synthetic_export(path: Path, rows: int):
+    """ECHA export와 같은 구조(<result> 당 컬럼 7개)의 XML 파일 생성"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n<results>\n')
+        for i in range(rows):
+            f.write(
+                '<result>'
+                f'<Name>Substance {i}</Name>'
+                f'<EC.No>{200000 + i % 99999}-{i % 100:02d}-{i % 10}</EC.No>'
+                f'<CAS.No>{50 + i}-{i % 100:02d}-{i % 10}</CAS.No>'
+                '<Reason_for_inclusion>Carcinogenic (Article 57a)</Reason_for_inclusion>'
+                '<Date_of_inclusion>2023-01-17</Date_of_inclusion>'
+                f'<Decision>ED/{i % 1000}/2023</Decision>'
+                '<Remarks> </Remarks>'
+                '</result>\n'
+            )
+        f.write('</results>\n')
+
+
+def measure(xml_file: Path, parser: str):
+    tracemalloc.start()
+    start = time.perf_counter()
+    data = parse_xml_rows(str(xml_file), parser=parser)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(data), elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='REACH XML tree vs stream 파서 벤치마크')
+    parser.add_argument('--rows', type=int, default=500_000, help='합성 export 행 수')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        xml_file = Path(tmp) / 'synthetic-export.xml'
+        write_synthetic_export(xml_file, args.rows)
+        print(f"📄 합성 export: {args.rows:,} rows, {xml_file.stat().st_size / 1e6:.1f} MB")
+
+        for engine in ('tree', 'stream'):
+            count, elapsed, peak = measure(xml_file, engine)
+            print(f"{engine:>6}: {count:,} rows in {elapsed:.2f}s, peak {peak / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()